@@ -0,0 +1,419 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/common.py."""
+
+import asyncio
+import logging
+import six
+
+from PyU4V import common
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+# HTTP constants
+GET = constants.GET
+POST = constants.POST
+PUT = constants.PUT
+DELETE = constants.DELETE
+
+# Status code constants
+STATUS_202 = constants.STATUS_202
+
+# Job constants
+INCOMPLETE_LIST = constants.INCOMPLETE_LIST
+SUCCEEDED = constants.SUCCEEDED
+
+# Resource constants
+SYSTEM = constants.SYSTEM
+JOB = constants.JOB
+VERSION = constants.VERSION
+SYMMETRIX = constants.SYMMETRIX
+SLOPROVISIONING = constants.SLOPROVISIONING
+COMMON = constants.COMMON
+ITERATOR = constants.ITERATOR
+PAGE = constants.PAGE
+
+
+class AsyncCommonFunctions(common.BaseCommonFunctions):
+    """AsyncCommonFunctions.
+
+    Awaitable counterpart of CommonFunctions, URI building and response
+    checking are inherited from BaseCommonFunctions, every call which goes
+    to Unisphere is a coroutine.
+    """
+
+    def __init__(self, rest_client):
+        """__init__.
+
+        :param rest_client: rest client -- AsyncRestRequests
+        """
+        self.rest_client = rest_client
+        self.request = self.rest_client.rest_request
+        self.interval = self.rest_client.interval
+        self.retries = self.rest_client.retries
+        self.polling_policy = self.rest_client.polling_policy
+        self.UNI_VERSION = constants.UNISPHERE_VERSION
+
+    async def wait_for_job_complete(self, job):
+        """Given the job wait for it to complete.
+
+        :param job: job details -- dict
+        :returns: response code, result, status, task details -- int, str, str,
+                  list
+        :raises: VolumeBackendAPIException
+        """
+        res, tasks = None, None
+        if job['status'].lower() == SUCCEEDED:
+            try:
+                res, tasks = job['result'], job['task']
+            except KeyError:
+                pass
+            return 0, res, job['status'], tasks
+
+        job_id = job['jobId']
+        rc, result, status, task = 0, None, None, None
+        retries = 0
+        while True:
+            retries += 1
+            await asyncio.sleep(self.polling_policy.get_interval(
+                retries, job, self.interval))
+            try:
+                is_complete, result, rc, status, task = (
+                    await self._is_job_finished(job_id))
+            except Exception as error:
+                exception_message = 'Issue encountered waiting for job.'
+                LOG.exception(exception_message)
+                raise exception.VolumeBackendAPIException(
+                    data=exception_message) from error
+            if is_complete:
+                break
+            if retries > self.retries:
+                LOG.error('_wait_for_job_complete failed after {cnt} '
+                          'tries.'.format(cnt=retries))
+                rc = -1
+                break
+
+        LOG.debug('Return code is: {rc}. Result is {res}.'.format(
+            rc=rc, res=result))
+        return rc, result, status, task
+
+    def track_job(self, job, callback=None):
+        """Wait for a job in the background.
+
+        The job is waited for by a task on the running event loop.
+
+        :param job: job details -- dict
+        :param callback: called with the task once the job is finished --
+                         callable
+        :returns: job outcome -- asyncio.Task
+        """
+        task = asyncio.ensure_future(self.wait_for_job_complete(job))
+        if callback:
+            task.add_done_callback(callback)
+        return task
+
+    async def get_job_by_id(self, job_id):
+        """Get details of a specific job.
+
+        :param job_id: job id -- str
+        :returns: job details -- dict
+        """
+        return await self.get_resource(
+            category=SYSTEM, resource_level=JOB, resource_level_id=job_id)
+
+    async def _is_job_finished(self, job_id):
+        """Check if the job is finished.
+
+        :param job_id: job id -- str
+        :returns: job complete, result, response code, status, task
+                  details -- bool, str, int, str, list
+        """
+        complete, rc, status, result, task = False, 0, None, None, None
+        job = await self.get_job_by_id(job_id)
+        if job:
+            status = job['status']
+            try:
+                result, task = job['result'], job['task']
+            except KeyError:
+                pass
+            if status.lower() == SUCCEEDED:
+                complete = True
+            elif status.lower() in INCOMPLETE_LIST:
+                complete = False
+            else:
+                rc, complete = -1, True
+        return complete, result, rc, status, task
+
+    async def wait_for_job(self, operation, status_code, job):
+        """Check if call is async, wait for it to complete.
+
+        :param operation: operation being performed -- str
+        :param status_code: status code -- int
+        :param job: job id -- str
+        :returns: task details -- list
+        :raises: VolumeBackendAPIException
+        """
+        task = None
+        if status_code == STATUS_202:
+            rc, result, status, task = await self.wait_for_job_complete(job)
+            if rc != 0:
+                exception_message = (
+                    'Error {op}. Status code: {sc}. Error: {err}. '
+                    'Status: {st}.'.format(
+                        op=operation, sc=rc, err=six.text_type(result),
+                        st=status))
+                LOG.error(exception_message)
+                raise exception.VolumeBackendAPIException(
+                    data=exception_message)
+        return task
+
+    async def get_request(self, target_uri, resource_type, params=None):
+        """Send a GET request to the array.
+
+        :param target_uri: target uri -- str
+        :param resource_type: the resource type, e.g. maskingview -- str
+        :param params: optional filter params -- dict
+        :returns: resource_object -- dict
+        :raises: ResourceNotFoundException
+        """
+        message, sc = await self.request(target_uri, GET, params=params)
+        operation = 'GET {resource_type}'.format(resource_type=resource_type)
+        self.check_status_code_success(operation, sc, message)
+        return message
+
+    async def get_resource(self, **kwargs):
+        """Get resource details from the array.
+
+        :key version: Unisphere version -- int
+        :key no_version: if versionless uri -- bool
+        :key category: resource category e.g. sloprovisioning -- str
+        :key resource_level: resource level e.g. storagegroup -- str
+        :key resource_level_id: resource level id -- str
+        :key resource_type: optional name of resource -- str
+        :key resource_type_id: optional name of resource -- str
+        :key resource: optional name of resource -- str
+        :key resource_id: optional name of resource -- str
+        :key object_type: optional name of resource -- str
+        :key object_type_id: optional name of resource -- str
+        :key params: query parameters -- dict
+        :returns: resource object -- dict
+        """
+        target_uri = self._build_uri(**kwargs)
+        return await self.get_request(
+            target_uri, kwargs.get('resource_level'), kwargs.get('params'))
+
+    async def create_resource(self, **kwargs):
+        """Create a resource.
+
+        :key version: Unisphere version -- int
+        :key no_version: if versionless uri -- bool
+        :key category: resource category e.g. sloprovisioning -- str
+        :key resource_level: resource level e.g. storagegroup -- str
+        :key resource_level_id: resource level id -- str
+        :key resource_type: optional name of resource -- str
+        :key resource_type_id: optional name of resource -- str
+        :key resource: optional name of resource -- str
+        :key resource_id: optional name of resource -- str
+        :key object_type: optional name of resource -- str
+        :key object_type_id: optional name of resource -- str
+        :key payload: query parameters -- dict
+        :returns: resource object -- dict
+        """
+        target_uri = self._build_uri(**kwargs)
+        message, status_code = await self.request(
+            target_uri, POST, request_object=kwargs.get('payload'))
+        operation = ('POST {resource_type} resource'.format(
+            resource_type=kwargs.get('resource_level')))
+        self.check_status_code_success(operation, status_code, message)
+        return message
+
+    async def modify_resource(self, **kwargs):
+        """Modify a resource.
+
+        :key version: Unisphere version -- int
+        :key no_version: if versionless uri -- bool
+        :key category: resource category e.g. sloprovisioning -- str
+        :key resource_level: resource level e.g. storagegroup -- str
+        :key resource_level_id: resource level id -- str
+        :key resource_type: optional name of resource -- str
+        :key resource_type_id: optional name of resource -- str
+        :key resource: optional name of resource -- str
+        :key resource_id: optional name of resource -- str
+        :key object_type: optional name of resource -- str
+        :key object_type_id: optional name of resource -- str
+        :key payload: query parameters
+        :returns: resource object -- dict
+        """
+        target_uri = self._build_uri(**kwargs)
+        message, status_code = await self.request(
+            target_uri, PUT, request_object=kwargs.get('payload'))
+        operation = ('PUT {resource_type} resource'.format(
+            resource_type=kwargs.get('resource_level')))
+        self.check_status_code_success(operation, status_code, message)
+        return message
+
+    async def delete_resource(self, **kwargs):
+        """Delete a resource.
+
+        :key version: Unisphere version -- int
+        :key no_version: if versionless uri -- bool
+        :key category: resource category e.g. sloprovisioning -- str
+        :key resource_level: resource level e.g. storagegroup -- str
+        :key resource_level_id: resource level id -- str
+        :key resource_type: optional name of resource -- str
+        :key resource_type_id: optional name of resource -- str
+        :key resource: optional name of resource -- str
+        :key resource_id: optional name of resource -- str
+        :key object_type: optional name of resource -- str
+        :key object_type_id: optional name of resource -- str
+        :key payload: query parameters
+        """
+        target_uri = self._build_uri(**kwargs)
+        message, status_code = await self.request(
+            target_uri, DELETE, request_object=kwargs.get('payload'),
+            params=kwargs.get('params'))
+        operation = ('DELETE {resource_type} resource'.format(
+            resource_type=kwargs.get('resource_level')))
+        self.check_status_code_success(operation, status_code, message)
+
+    async def get_uni_version(self):
+        """Get the unisphere version from the server.
+
+        :returns: version and major_version e.g. "V9.2.0.0", "92" -- str, str
+        """
+        version, major_version = None, None
+        response = await self.get_resource(category=VERSION, no_version=True)
+        if response and response.get('version'):
+            version = response['version']
+            version_list = version.split('.')
+            major_version = version_list[0][1] + version_list[1]
+        return version, major_version
+
+    async def get_array_list(self, filters=None):
+        """Return a list of arrays.
+
+        :param filters: optional filters -- dict
+        :returns: arrays ids -- list
+        """
+        response = await self.get_resource(
+            category=SYSTEM, resource_level=SYMMETRIX, params=filters)
+        return response.get('symmetrixId', list()) if response else list()
+
+    async def get_v3_or_newer_array_list(self, filters=None):
+        """Return a list of V3 or newer arrays in the environment.
+
+        :param filters: optional filters -- dict
+        :returns: arrays ids -- list
+        """
+        response = await self.get_resource(
+            category=SLOPROVISIONING, resource_level=SYMMETRIX, params=filters)
+        return response.get('symmetrixId', list()) if response else list()
+
+    async def get_array(self, array_id):
+        """Get array details.
+
+        :param array_id: array id -- str
+        :returns: array details -- dict
+        """
+        return await self.get_resource(
+            category=SYSTEM, resource_level=SYMMETRIX,
+            resource_level_id=array_id)
+
+    async def get_iterator_page_list(self, iterator_id, start, end):
+        """Get a page of results from an iterator instance.
+
+        :param iterator_id: iterator id -- str
+        :param start: the start number -- int
+        :param end: the end number -- int
+        :returns: iterator page results -- dict
+        """
+        response = await self.get_resource(
+            no_version=True, category=COMMON, resource_level=ITERATOR,
+            resource_level_id=iterator_id, resource_type=PAGE,
+            params={'from': start, 'to': end})
+        return response.get('result', list()) if response else list()
+
+    async def get_iterator_results(self, rest_response):
+        """Get all results from all pages of an iterator if count > 1000.
+
+        Pages after the first are requested concurrently and reassembled in
+        order.
+
+        :param rest_response: response JSON from REST API -- dict
+        :returns: all results -- dict
+        """
+        full_response = list()
+        full_response += rest_response['resultList']['result']
+
+        iterator_id = rest_response.get('id')
+        pages = await asyncio.gather(
+            *[self.get_iterator_page_list(iterator_id, start, end) for
+              start, end in self._get_iterator_page_ranges(rest_response)])
+        for page in pages:
+            full_response += page
+        return full_response
+
+    async def iter_iterator_results(self, rest_response):
+        """Iterate over the results from all pages of an iterator.
+
+        Results are yielded page by page as each page is received, use with
+        async for.
+
+        :param rest_response: response JSON from REST API -- dict
+        :returns: results -- async generator
+        """
+        for result in rest_response['resultList']['result']:
+            yield result
+
+        iterator_id = rest_response.get('id')
+        for start, end in self._get_iterator_page_ranges(rest_response):
+            for result in await self.get_iterator_page_list(
+                    iterator_id, start, end):
+                yield result
+
+    async def get_wlp_information(self, array_id):
+        """Get the latest timestamp from WLP for processing new Workloads.
+
+        :param array_id: array id -- str
+        :returns: wlp details -- dict
+        """
+        response = await self.get_resource(
+            category=constants.WLP, resource_level=SYMMETRIX,
+            resource_level_id=array_id)
+        return response if response else dict()
+
+    async def get_headroom(self, array_id, workload=None, srp=None, slo=None):
+        """Get the Remaining Headroom Capacity.
+
+        :param array_id: array id -- str
+        :param workload: the workload type -- str
+        :param srp: storage resource pool id -- str
+        :param slo: service level id -- str
+        :returns: headroom details -- dict
+        """
+        params = dict()
+        if srp:
+            params['srp'] = srp
+        if slo:
+            params['slo'] = slo
+        if workload:
+            params['workloadtype'] = workload
+
+        response = await self.get_resource(
+            category=constants.WLP,
+            resource_level=SYMMETRIX, resource_level_id=array_id,
+            resource_type=constants.HEADROOM, params=params)
+        return response.get('gbHeadroom', list()) if response else list()
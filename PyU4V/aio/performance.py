@@ -0,0 +1,275 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/performance.py."""
+
+import logging
+
+from PyU4V.aio import common
+from PyU4V.aio import real_time
+from PyU4V.performance import PerformanceFunctions
+from PyU4V.utils import exception
+from PyU4V.utils import performance_category_map
+from PyU4V.utils import performance_constants as pc
+
+LOG = logging.getLogger(__name__)
+CATEGORY_MAP = performance_category_map.performance_data
+
+
+class AsyncPerformanceFunctions(object):
+    """AsyncPerformanceFunctions."""
+
+    # Input formatting and validation does not touch the network so is shared
+    # with the synchronous implementation
+    validate_category = staticmethod(PerformanceFunctions.validate_category)
+    format_metrics = staticmethod(PerformanceFunctions.format_metrics)
+    get_performance_categories_list = staticmethod(
+        PerformanceFunctions.get_performance_categories_list)
+    get_performance_metrics_list = staticmethod(
+        PerformanceFunctions.get_performance_metrics_list)
+    get_request_body_object_ids = staticmethod(
+        PerformanceFunctions.get_request_body_object_ids)
+    get_timestamps_from_key_list = staticmethod(
+        PerformanceFunctions.get_timestamps_from_key_list)
+    validate_data_format = staticmethod(
+        PerformanceFunctions.validate_data_format)
+    validate_time_range = staticmethod(
+        PerformanceFunctions.validate_time_range)
+    get_metrics_list_from_input = (
+        PerformanceFunctions.get_metrics_list_from_input)
+    is_timestamp_current = PerformanceFunctions.is_timestamp_current
+
+    def __init__(self, array_id, rest_client):
+        """__init__."""
+        self.common = common.AsyncCommonFunctions(rest_client)
+        self.real_time = real_time.AsyncRealTimeFunctions(
+            array_id, rest_client)
+        self.post_request = self.common.create_resource
+        self.get_request = self.common.get_resource
+        self.put_request = self.common.modify_resource
+        self.array_id = array_id
+        self.recency = 7
+
+    def set_array_id(self, array_id):
+        """Set the array id.
+
+        :param array_id: array id -- str
+        """
+        self.array_id = array_id
+        self.real_time.set_array_id(array_id)
+
+    async def get_last_available_timestamp(self, array_id=None):
+        """Get the last recorded performance timestamp.
+
+        :param array_id: array_id: array id -- str
+        :returns: timestamp -- int
+        :raises: ResourceNotFoundException
+        """
+        array_id = self.array_id if not array_id else array_id
+        timestamp = None
+
+        response = await self.get_request(
+            category=pc.PERFORMANCE, resource_level=pc.ARRAY,
+            resource_type=pc.KEYS)
+        if response:
+            for key in response.get(pc.ARRAY_INFO):
+                if key and key.get(pc.SYMM_ID) == array_id:
+                    timestamp = key[pc.LA_DATE]
+            if not timestamp:
+                msg = ('Array {arr} could not be found in list of performance '
+                       'keys.'.format(arr=array_id))
+                LOG.info(msg)
+                raise exception.ResourceNotFoundException(data=msg)
+
+        return timestamp
+
+    async def get_performance_key_list(
+            self, category, array_id=None, director_id=None,
+            storage_group_id=None, storage_container_id=None,
+            storage_resource_id=None, start_time=None, end_time=None):
+        """Get performance key list for a given performance category.
+
+        :param category: performance category -- str
+        :param array_id: array id -- str
+        :param director_id: director id -- str
+        :param storage_group_id: storage group id -- str
+        :param storage_container_id:  storage container id -- str
+        :param storage_resource_id: storage resource id -- str
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :returns: category performance keys -- list
+        :raises: InvalidInputException
+        """
+        request_body = dict()
+        if array_id:
+            request_body[pc.SYMM_ID] = array_id
+        if director_id:
+            request_body[pc.DIR_ID] = director_id
+        if storage_group_id:
+            request_body[pc.SG_ID] = storage_group_id
+        if storage_container_id:
+            request_body[pc.STORAGE_CONT_ID] = storage_container_id
+        if storage_resource_id:
+            request_body[pc.STORAGE_RES_ID] = storage_resource_id
+        if start_time or end_time:
+            request_body[pc.START_DATE] = start_time
+            request_body[pc.END_DATE] = end_time
+
+        cat = CATEGORY_MAP.get(category.upper())
+        if not cat:
+            raise exception.InvalidInputException(
+                'Key list extraction failed due to invalid category "{cat}", '
+                'please correct the category name before trying '
+                'again.'.format(cat=category))
+
+        request = self.get_request if pc.ARRAY in cat[pc.CATEGORY] else (
+            self.post_request)
+        response = await request(
+            category=pc.PERFORMANCE, resource_level=cat[pc.CATEGORY],
+            resource_type=pc.KEYS, payload=request_body)
+        if not response:
+            raise exception.ResourceNotFoundException(
+                'There are no provisioned assets for performance category '
+                '"{cat}".'.format(cat=category))
+        return response
+
+    async def extract_timestamp_keys(
+            self, array_id=None, category=None, director_id=None,
+            key_tgt_id=None):
+        """Retrieve the timestamp keys for a given performance asset.
+
+        :param array_id: array id -- str
+        :param category: performance category -- str
+        :param director_id: director id -- str
+        :param key_tgt_id: object id for the timestamp required -- str
+        :returns: timestamp in milliseconds since epoch -- str
+        """
+        array_id = self.array_id if not array_id else array_id
+        self.validate_category(category)
+        response = await self.get_performance_key_list(
+            category=category, array_id=array_id, director_id=director_id)
+        tgt_id = array_id if not key_tgt_id else key_tgt_id
+        return self.get_timestamps_from_key_list(response, tgt_id)
+
+    async def format_time_input(
+            self, array_id=None, category=None, director_id=None,
+            key_tgt_id=None, start_time=None, end_time=None):
+        """Format time range for use in the request object.
+
+        See PerformanceFunctions.format_time_input for the use cases.
+
+        :param array_id: array id -- str
+        :param category: performance category -- str
+        :param director_id: director id (for port key extraction only) -- str
+        :param key_tgt_id: object id for the timestamp required -- str
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :returns: start time, end time (tuple) -- str, str
+        :raises: InvalidInputException, VolumeBackendAPIException
+        """
+        array_id = self.array_id if not array_id else array_id
+        err_msg = None
+        if start_time and not end_time:
+            end_time = await self.get_last_available_timestamp(array_id)
+            if not end_time:
+                err_msg = (
+                    'Last available timestamp could not be extracted from '
+                    'Unisphere, please array check performance registration.')
+        elif end_time and not start_time:
+            self.validate_category(category)
+            start_time, __ = await self.extract_timestamp_keys(
+                array_id=array_id, category=category, director_id=director_id,
+                key_tgt_id=key_tgt_id)
+            if not start_time:
+                err_msg = (
+                    'First available timestamp could not be extracted from '
+                    'Unisphere, please array check performance registration.')
+        elif not start_time and not end_time:
+            self.validate_category(category)
+            __, end_time = await self.extract_timestamp_keys(
+                array_id=array_id, category=category, director_id=director_id,
+                key_tgt_id=key_tgt_id)
+            start_time = end_time
+            if not start_time and not end_time:
+                err_msg = (
+                    'Timestamps could not be extracted from Unisphere, please '
+                    'array check performance registration.')
+
+        if err_msg:
+            LOG.error(err_msg)
+            raise exception.VolumeBackendAPIException(err_msg)
+
+        return self.validate_time_range(start_time, end_time)
+
+    async def get_performance_stats(
+            self, category, metrics, data_format=pc.AVERAGE, array_id=None,
+            request_body=None, start_time=None, end_time=None, recency=None):
+        """Retrieve the performance statistics for a given category and object.
+
+        :param category: category id -- str
+        :param array_id: array id -- str
+        :param metrics: performance metrics, options are individual metrics,
+                        a list of metrics, 'KPI' for KPI metrics only, and
+                        'ALL' for all metrics -- str/list
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :param request_body: request params and object IDs -- dict
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :param recency: check recency of timestamp in minutes -- int
+        :returns: performance metrics -- dict
+        :raises: VolumeBackendAPIException, InvalidInputException
+        """
+        array_id = self.array_id if not array_id else array_id
+        performance_details = dict()
+        request_body = dict(request_body) if request_body else dict()
+
+        self.validate_category(category)
+        director_id, object_id = self.get_request_body_object_ids(
+            request_body)
+        start_time, end_time = await self.format_time_input(
+            array_id=array_id, category=category, director_id=director_id,
+            key_tgt_id=object_id, start_time=start_time, end_time=end_time)
+
+        if recency:
+            recency = recency if isinstance(recency, int) else self.recency
+            if not self.is_timestamp_current(int(end_time), minutes=recency):
+                raise exception.VolumeBackendAPIException(
+                    'Timestamp failed recency check of {rec} '
+                    'minutes.'.format(rec=recency))
+
+        metrics_list = self.get_metrics_list_from_input(category, metrics)
+        data_format = self.validate_data_format(data_format)
+
+        for k, v in request_body.items():
+            key = self.common.convert_to_snake_case(k)
+            performance_details[key] = v
+
+        request_body[pc.START_DATE] = start_time
+        request_body[pc.END_DATE] = end_time
+        request_body[pc.SYMM_ID] = str(array_id)
+        request_body[pc.DATA_FORMAT] = str(data_format)
+        request_body[pc.METRICS] = metrics_list
+
+        perf_response = await self.post_request(
+            category=pc.PERFORMANCE, resource_level=category,
+            resource_type=pc.METRICS, payload=request_body)
+
+        performance_details.update(
+            {'result': await self.common.get_iterator_results(perf_response),
+             'array_id': str(array_id),
+             'start_date': start_time,
+             'end_date': end_time,
+             'timestamp': end_time,
+             'reporting_level': self.common.convert_to_snake_case(category)})
+
+        return performance_details
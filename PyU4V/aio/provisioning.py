@@ -0,0 +1,115 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/provisioning.py."""
+
+import logging
+
+from PyU4V.aio import common
+from PyU4V.utils import constants
+
+LOG = logging.getLogger(__name__)
+
+# Resource constants
+SLOPROVISIONING = constants.SLOPROVISIONING
+SYMMETRIX = constants.SYMMETRIX
+SRP = constants.SRP
+STORAGEGROUP = constants.STORAGEGROUP
+VOLUME = constants.VOLUME
+
+
+class AsyncProvisioningFunctions(object):
+    """AsyncProvisioningFunctions."""
+
+    def __init__(self, array_id, rest_client):
+        """__init__."""
+        self.array_id = array_id
+        self.common = common.AsyncCommonFunctions(rest_client)
+        self.get_resource = self.common.get_resource
+        self.create_resource = self.common.create_resource
+        self.modify_resource = self.common.modify_resource
+        self.delete_resource = self.common.delete_resource
+
+    async def get_array(self, array_id=None):
+        """Query for details of an array from SLOPROVISIONING endpoint.
+
+        :param array_id: array serial number -- str
+        :returns: array details -- dict
+        """
+        array_id = array_id if array_id else self.array_id
+        response = await self.get_resource(
+            category=SLOPROVISIONING, resource_level=SYMMETRIX,
+            resource_level_id=array_id)
+        return response if response else dict()
+
+    async def get_srp_list(self, filters=None):
+        """Get a list of available SRPs on a given array.
+
+        :param filters: filter parameters -- dict
+        :returns: SRPs -- list
+        """
+        response = await self.get_resource(
+            category=SLOPROVISIONING,
+            resource_level=SYMMETRIX, resource_level_id=self.array_id,
+            resource_type=SRP, params=filters)
+        return response.get('srpId', list()) if response else list()
+
+    async def get_storage_group(self, storage_group_name):
+        """Given a name, return storage group details.
+
+        :param storage_group_name: name of the storage group -- str
+        :returns: storage group details -- dict
+        """
+        return await self.get_resource(
+            category=SLOPROVISIONING,
+            resource_level=SYMMETRIX, resource_level_id=self.array_id,
+            resource_type=STORAGEGROUP, resource_type_id=storage_group_name)
+
+    async def get_storage_group_list(self, filters=None):
+        """Return a list of storage groups.
+
+        :param filters: filter parameters -- dict
+        :returns: storage groups -- list
+        """
+        sg = await self.get_resource(
+            category=SLOPROVISIONING,
+            resource_level=SYMMETRIX, resource_level_id=self.array_id,
+            resource_type=STORAGEGROUP, params=filters)
+        return sg.get('storageGroupId', list()) if sg else list()
+
+    async def get_volume(self, device_id):
+        """Get a volume from array.
+
+        :param device_id: device id -- str
+        :returns: volume details -- dict
+        """
+        return await self.get_resource(
+            category=SLOPROVISIONING,
+            resource_level=SYMMETRIX, resource_level_id=self.array_id,
+            resource_type=VOLUME, resource_type_id=device_id)
+
+    async def get_volume_list(self, filters=None):
+        """Get list of volumes from array.
+
+        :param filters: filters parameters -- dict
+        :returns: device ids -- list
+        """
+        response = await self.get_resource(
+            category=SLOPROVISIONING,
+            resource_level=SYMMETRIX, resource_level_id=self.array_id,
+            resource_type=VOLUME, params=filters)
+        if not (response and response.get('count') and (
+                int(response.get('count')) > 0)):
+            return list()
+        volumes = await self.common.get_iterator_results(response)
+        return [vol['volumeId'] for vol in volumes]
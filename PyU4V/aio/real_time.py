@@ -0,0 +1,154 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/real_time.py."""
+
+import logging
+
+from PyU4V.aio import common
+from PyU4V.real_time import RealTimeFunctions
+from PyU4V.utils import performance_constants as pc
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncRealTimeFunctions(object):
+    """AsyncRealTimeFunctions."""
+
+    format_metrics = staticmethod(RealTimeFunctions.format_metrics)
+    is_timestamp_current = RealTimeFunctions.is_timestamp_current
+
+    def __init__(self, array_id, rest_client):
+        """__init__."""
+        self.common = common.AsyncCommonFunctions(rest_client)
+        self.post_request = self.common.create_resource
+        self.get_request = self.common.get_resource
+        self.array_id = array_id
+        self.recency = 0
+
+    def set_array_id(self, array_id):
+        """Set the array id.
+
+        :param array_id: array id -- str
+        """
+        self.array_id = array_id
+
+    def set_recency(self, minutes):
+        """Set the recency value in minutes.
+
+        :param minutes: recency minutes -- int
+        """
+        self.recency = int(minutes)
+
+    async def get_categories(self):
+        """Get a list of real-time supported performance categories.
+
+        :returns: categories -- list
+        """
+        response = await self.get_request(
+            no_version=True, category=pc.PERFORMANCE,
+            resource_level=pc.REAL_TIME, resource_type=pc.HELP,
+            resource=pc.CATEGORIES)
+        return response.get(pc.CATEGORY_NAME, list()) if response else list()
+
+    async def get_category_metrics(self, category):
+        """Get metrics available for a real-time performance category.
+
+        :param category: real-time performance category -- str
+        :returns: metrics -- list
+        """
+        response = await self.get_request(
+            no_version=True, category=pc.PERFORMANCE,
+            resource_level=pc.REAL_TIME, resource_type=pc.HELP,
+            resource=category, object_type=pc.METRICS)
+        return response.get(pc.METRIC_NAME, list()) if response else list()
+
+    async def get_timestamps(self, array_id=None):
+        """Get real-time performance timestamps for array(s).
+
+        :param array_id: array serial number -- str
+        :returns: array timestamp info -- list
+        """
+        response = await self.get_request(
+            no_version=True, category=pc.PERFORMANCE,
+            resource_level=pc.REAL_TIME, resource_type=pc.HELP,
+            resource=pc.TIMES)
+        timestamps = response.get(
+            pc.ARRAY_INFO, list()) if response else list()
+
+        if array_id and timestamps:
+            for array_info in timestamps:
+                if array_info.get(pc.SYMM_ID) == array_id:
+                    return [array_info]
+
+        return timestamps
+
+    async def get_category_keys(self, category, array_id=None):
+        """Get category keys valid for real-time metrics collection.
+
+        :param category: real-time performance category -- str
+        :param array_id: array serial number -- str
+        :returns: category keys -- list
+        """
+        array_id = self.array_id if not array_id else array_id
+        request_params = {pc.SYMM_ID: array_id, pc.CATEGORY: category}
+        response = await self.post_request(
+            no_version=True, category=pc.PERFORMANCE,
+            resource_level=pc.REAL_TIME, resource_type=pc.KEYS,
+            payload=request_params)
+        return response.get(pc.KEYS, list()) if response else list()
+
+    async def get_performance_data(
+            self, start_date, end_date, category, metrics, array_id=None,
+            instance_id=None):
+        """Retrieve real-time performance statistics for a given category.
+
+        Unlike RealTimeFunctions.get_performance_data the category, metrics
+        and instance ID are not pre-validated against Unisphere, invalid input
+        is reported by Unisphere in the response status.
+
+        :param start_date: timestamp in milliseconds since epoch -- int
+        :param end_date: timestamp in milliseconds since epoch -- int
+        :param category: category id -- str
+        :param metrics: performance metrics, options are individual metrics,
+                        a list of metrics, or 'ALL' for all metrics -- str/list
+        :param array_id: array serial number -- str
+        :param instance_id: instance id -- str
+        :returns: real-time performance data -- dict
+        """
+        array_id = self.array_id if not array_id else array_id
+        metrics = self.format_metrics(metrics)
+
+        request_params = {
+            pc.SYMM_ID: array_id, pc.START_DATE: start_date,
+            pc.END_DATE: end_date, pc.CATEGORY: category,
+            pc.METRICS: metrics}
+        if instance_id:
+            request_params[pc.INSTANCE_ID] = instance_id
+
+        response = await self.post_request(
+            no_version=True, category=pc.PERFORMANCE,
+            resource_level=pc.REAL_TIME, resource_type=pc.METRICS,
+            payload=request_params)
+
+        return_response = {
+            pc.ARRAY_ID: array_id, pc.START_DATE_SN: start_date,
+            pc.END_DATE_SN: end_date, pc.TIMESTAMP: end_date,
+            pc.REAL_TIME_SN: True,
+            pc.REP_LEVEL: self.common.convert_to_snake_case(category),
+            pc.RESULT: await self.common.get_iterator_results(response)}
+
+        if instance_id:
+            return_response[pc.INSTANCE_ID_SN] = instance_id
+
+        return return_response
@@ -0,0 +1,110 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/replication.py."""
+
+import logging
+
+from PyU4V.aio import common
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+# Resource constants
+REPLICATION = constants.REPLICATION
+SYMMETRIX = constants.SYMMETRIX
+CAPABILITIES = constants.CAPABILITIES
+STORAGEGROUP = constants.STORAGEGROUP
+SNAPSHOT = constants.SNAPSHOT
+RDFG = constants.RDFG
+
+
+class AsyncReplicationFunctions(object):
+    """AsyncReplicationFunctions."""
+
+    def __init__(self, array_id, rest_client):
+        """__init__."""
+        self.common = common.AsyncCommonFunctions(rest_client)
+        self.get_resource = self.common.get_resource
+        self.create_resource = self.common.create_resource
+        self.modify_resource = self.common.modify_resource
+        self.delete_resource = self.common.delete_resource
+        self.array_id = array_id
+
+    async def get_replication_info(self):
+        """Return replication information for an array.
+
+        :returns: replication details -- dict
+        """
+        return await self.get_resource(
+            category=REPLICATION, resource_level=SYMMETRIX,
+            resource_level_id=self.array_id)
+
+    async def get_array_replication_capabilities(self, array_id=None):
+        """Check what replication facilities are available.
+
+        :returns: replication capability details -- dict
+        """
+        array_id = array_id if array_id else self.array_id
+        capabilities = await self.get_resource(
+            category=REPLICATION, resource_level=CAPABILITIES,
+            resource_type=SYMMETRIX)
+        symm_list = capabilities.get(
+            'symmetrixCapability', list()) if capabilities else list()
+        array_capabilities = dict()
+        for symm in symm_list:
+            if symm['symmetrixId'] == array_id:
+                array_capabilities = symm
+                break
+        return array_capabilities
+
+    async def get_storage_group_replication_details(self, storage_group_id):
+        """Given a storage group id, return storage group srdf details.
+
+        :param storage_group_id: storage group id -- str
+        :returns: storage group replication details -- dict
+        """
+        return await self.get_resource(
+            category=REPLICATION,
+            resource_level=SYMMETRIX, resource_level_id=self.array_id,
+            resource_type=STORAGEGROUP, resource_type_id=storage_group_id)
+
+    async def get_storage_group_snapshot_list(self, storage_group_id):
+        """Get a list of snapshots associated with a storage group.
+
+        :param storage_group_id: storage group id -- str
+        :returns: snapshot ids -- list
+        """
+        try:
+            response = await self.get_resource(
+                category=REPLICATION,
+                resource_level=SYMMETRIX, resource_level_id=self.array_id,
+                resource_type=STORAGEGROUP, resource_type_id=storage_group_id,
+                resource=SNAPSHOT)
+        except exception.ResourceNotFoundException:
+            return list()
+        return response.get('name', list()) if response else list()
+
+    async def get_rdf_group_list(self, array_id=None):
+        """Get rdf group list from array.
+
+        :param array_id: array serial number -- str
+        :returns: rdf group list -- list
+        """
+        array_id = self.array_id if not array_id else array_id
+        response = await self.get_resource(
+            category=REPLICATION,
+            resource_level=SYMMETRIX, resource_level_id=array_id,
+            resource_type=RDFG)
+        return response.get('rdfGroupID', list()) if response else list()
@@ -0,0 +1,175 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/rest_requests.py."""
+
+import asyncio
+import logging
+import ssl
+
+from PyU4V.rest_requests import ua_details
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+from PyU4V.utils import json_codec
+from PyU4V.utils import polling_policy as pp
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+LOG = logging.getLogger(__name__)
+
+CONTENT_TYPE = constants.CONTENT_TYPE
+ACCEPT = constants.ACCEPT
+ACCEPT_ENC = constants.ACCEPT_ENC
+USER_AGENT = constants.USER_AGENT
+APP_TYPE = constants.APP_TYPE
+APP_JSON = constants.APP_JSON
+GZIP_DEFLATE = constants.GZIP_DEFLATE
+
+
+class AsyncRestRequests(object):
+    """AsyncRestRequests."""
+
+    def __init__(self, username, password, verify, base_url, interval, retries,
+                 application_type=None, pool_maxsize=None,
+                 json_codec_name=None, polling_policy=None):
+        """__init__."""
+        self.username = username
+        self.password = password
+        self.verify_ssl = verify
+        self.base_url = base_url
+        self.headers = {CONTENT_TYPE: APP_JSON,
+                        ACCEPT: APP_JSON,
+                        ACCEPT_ENC: GZIP_DEFLATE,
+                        USER_AGENT: ua_details,
+                        APP_TYPE: application_type}
+        self.timeout = 120
+        self.interval = interval
+        self.retries = retries
+        self.polling_policy = (
+            polling_policy if polling_policy else pp.PollingPolicy())
+        self.pool_maxsize = (
+            pool_maxsize if pool_maxsize else constants.DEFAULT_POOL_MAXSIZE)
+        self.codec = json_codec.get_codec(json_codec_name)
+        # aiohttp sessions must be created inside a running event loop so the
+        # session is created on first use rather than here
+        self.session = None
+
+    def _get_ssl_setting(self):
+        """Get the aiohttp SSL setting for the verify configuration.
+
+        :returns: SSL setting -- bool, None or SSLContext
+        """
+        if self.verify_ssl is False:
+            return False
+        if isinstance(self.verify_ssl, str):
+            return ssl.create_default_context(cafile=self.verify_ssl)
+        return None
+
+    def establish_rest_session(self):
+        """Establish an asynchronous REST session.
+
+        :returns: session -- aiohttp.ClientSession
+        :raises: MissingDependencyException
+        """
+        if aiohttp is None:
+            raise exception.MissingDependencyException(data='aiohttp')
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_maxsize, ssl=self._get_ssl_setting())
+        headers = {k: v for k, v in self.headers.items() if v is not None}
+        return aiohttp.ClientSession(
+            connector=connector, headers=headers,
+            auth=aiohttp.BasicAuth(self.username, self.password))
+
+    def get_session(self):
+        """Get the current session, establishing one if required.
+
+        :returns: session -- aiohttp.ClientSession
+        """
+        if not self.session or self.session.closed:
+            self.session = self.establish_rest_session()
+        return self.session
+
+    @staticmethod
+    def _format_params(params):
+        """Format URL parameters into types accepted by aiohttp.
+
+        :param params: URL parameters -- dict
+        :returns: URL parameters -- dict
+        """
+        if not params:
+            return None
+        return {k: v if isinstance(v, (str, int, float)) and not isinstance(
+            v, bool) else str(v) for k, v in params.items()}
+
+    async def rest_request(self, target_url, method,
+                           params=None, request_object=None, timeout=None):
+        """Send a request to the target api.
+
+        Valid methods are 'GET', 'POST', 'PUT', 'DELETE'.
+
+        :param target_url: target url --str
+        :param method: method -- str
+        :param params: Additional URL parameters -- dict
+        :param request_object: request payload -- dict
+        :param timeout: optional timeout override -- int
+        :returns: server response, status code -- dict, int
+        :raises: VolumeBackendAPIException
+        """
+        timeout_val = timeout if timeout else self.timeout
+        session = self.get_session()
+        url = '{base_url}{target_url}'.format(
+            base_url=self.base_url, target_url=target_url)
+        data = self.codec.dumps(request_object) if request_object else None
+        try:
+            async with session.request(
+                    method=method, url=url,
+                    params=self._format_params(params), data=data,
+                    timeout=aiohttp.ClientTimeout(
+                        total=timeout_val)) as response:
+                status_code = response.status
+                try:
+                    message = await response.json(
+                        content_type=None, loads=self.codec.loads)
+                except ValueError:
+                    message = None
+                    LOG.debug('No response received from API. Status code '
+                              'received is: {sc}.'.format(sc=status_code))
+
+            LOG.debug('{method} request to {url} has returned with a status '
+                      'code of: {sc}.'.format(method=method, url=url,
+                                              sc=status_code))
+            return message, status_code
+
+        except asyncio.TimeoutError as error:
+            LOG.error(
+                'The {method} request to URL {url} timed-out, but may have '
+                'been successful. Please check the array. Exception received: '
+                '{exc}.'.format(method=method, url=url, exc=error))
+            return None, None
+
+        except aiohttp.ClientError as error:
+            msg = (
+                'The {met} to Unisphere server {base} has experienced a {exc} '
+                'error. Please check your Unisphere server connection and '
+                'availability. Exception message: {msg}'.format(
+                    met=method, base=self.base_url,
+                    exc=error.__class__.__name__, msg=error))
+            raise exception.VolumeBackendAPIException(data=msg) from error
+
+    async def close_session(self):
+        """Close the current session."""
+        if self.session:
+            await self.session.close()
@@ -0,0 +1,117 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""aio/univmax_conn.py."""
+
+import logging
+
+from PyU4V.aio.common import AsyncCommonFunctions
+from PyU4V.aio.performance import AsyncPerformanceFunctions
+from PyU4V.aio.provisioning import AsyncProvisioningFunctions
+from PyU4V.aio.replication import AsyncReplicationFunctions
+from PyU4V.aio.rest_requests import AsyncRestRequests
+from PyU4V import univmax_conn
+from PyU4V.utils import constants
+
+LOG = logging.getLogger(__name__)
+
+ARRAY = constants.ARRAY
+R_ARRAY = constants.R_ARRAY
+R_ARRAY_2 = constants.R_ARRAY_2
+USERNAME = constants.USERNAME
+PASSWORD = constants.PASSWORD
+SERVER_IP = constants.SERVER_IP
+PORT = constants.PORT
+VERIFY = constants.VERIFY
+
+
+class AsyncU4VConn(object):
+    """AsyncU4VConn.
+
+    Asynchronous counterpart of U4VConn, all calls to Unisphere are
+    coroutines which share one connection pool and event loop. Use as an
+    async context manager to validate Unisphere on entry and close the
+    session on exit:
+
+    async with AsyncU4VConn() as conn:
+        array = await conn.common.get_array(conn.array_id)
+    """
+
+    def __init__(self, username=None, password=None, server_ip=None,
+                 port=None, verify=None, interval=5, retries=200,
+                 array_id=None, application_type=univmax_conn.app_type,
+                 remote_array=None, remote_array_2=None, pool_maxsize=None,
+                 json_codec_name=None, polling_policy=None):
+        """__init__."""
+        settings = univmax_conn.load_connection_settings(
+            username=username, password=password, server_ip=server_ip,
+            port=port, verify=verify, array_id=array_id,
+            remote_array=remote_array, remote_array_2=remote_array_2)
+        self.array_id = settings[ARRAY]
+        self.remote_array = settings[R_ARRAY]
+        self.remote_array_2 = settings[R_ARRAY_2]
+        base_url = 'https://{server_ip}:{port}/univmax/restapi'.format(
+            server_ip=settings[SERVER_IP], port=settings[PORT])
+
+        self.rest_client = AsyncRestRequests(
+            settings[USERNAME], settings[PASSWORD], settings[VERIFY],
+            base_url, interval, retries, application_type,
+            pool_maxsize=pool_maxsize, json_codec_name=json_codec_name,
+            polling_policy=polling_policy)
+        self.request = self.rest_client.rest_request
+        self.common = AsyncCommonFunctions(self.rest_client)
+        self.provisioning = AsyncProvisioningFunctions(
+            self.array_id, self.rest_client)
+        self.performance = AsyncPerformanceFunctions(
+            self.array_id, self.rest_client)
+        self.real_time = self.performance.real_time
+        self.replication = AsyncReplicationFunctions(
+            self.array_id, self.rest_client)
+
+    async def __aenter__(self):
+        """Validate Unisphere on entering the context."""
+        await self.validate_unisphere()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the session on exiting the context."""
+        await self.close_session()
+
+    async def close_session(self):
+        """Close the current rest session."""
+        await self.rest_client.close_session()
+
+    def set_requests_timeout(self, timeout_value):
+        """Set the requests timeout.
+
+        :param timeout_value: the new timeout value -- int
+        """
+        self.rest_client.timeout = timeout_value
+
+    def set_array_id(self, array_id):
+        """Set the array serial number.
+
+        :param array_id: the array serial number -- str
+        """
+        self.array_id = array_id
+        self.performance.set_array_id(array_id)
+        self.provisioning.array_id = array_id
+        self.replication.array_id = array_id
+
+    async def validate_unisphere(self):
+        """Check that the minimum version of Unisphere is in-use.
+
+        :raises: SystemExit
+        """
+        uni_ver, major_ver = await self.common.get_uni_version()
+        univmax_conn.check_unisphere_version(uni_ver, major_ver)
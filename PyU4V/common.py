@@ -13,6 +13,9 @@
 # limitations under the License.
 """common.py."""
 
+import collections
+import functools
+import itertools
 import json
 import logging
 import math
@@ -21,10 +24,15 @@ import six
 import socket
 import time
 
+from concurrent import futures
+
 from PyU4V.utils import constants
+from PyU4V.utils import deadline as dl
 from PyU4V.utils import decorators
 from PyU4V.utils import exception
 from PyU4V.utils import file_handler
+from PyU4V.utils import job_tracker
+from PyU4V.utils import json_stream
 
 LOG = logging.getLogger(__name__)
 
@@ -60,104 +68,14 @@ WLP = constants.WLP
 HEADROOM = constants.HEADROOM
 
 
-class CommonFunctions(object):
-    """CommonFunctions."""
-
-    def __init__(self, rest_client):
-        """__init__."""
-        self.rest_client = rest_client
-        self.request = self.rest_client.rest_request
-        self.interval = self.rest_client.interval
-        self.retries = self.rest_client.retries
-        self.UNI_VERSION = constants.UNISPHERE_VERSION
-
-    def wait_for_job_complete(self, job):
-        """Given the job wait for it to complete.
-
-        :param job: job details -- dict
-        :returns: response code, result, status, task details -- int, str, str,
-                  list
-        :raises: VolumeBackendAPIException
-        """
-        res, tasks = None, None
-        if job['status'].lower() == SUCCEEDED:
-            try:
-                res, tasks = job['result'], job['task']
-            except KeyError:
-                pass
-            return 0, res, job['status'], tasks
-
-        def _wait_for_job_complete():
-            """Called at an interval until the job is finished."""
-            retries = kwargs['retries']
-            try:
-                kwargs['retries'] = retries + 1
-                if not kwargs['wait_for_job_called']:
-                    is_complete, result, rc, status, task = (
-                        self._is_job_finished(job_id))
-                    if is_complete is True:
-                        kwargs['wait_for_job_called'] = True
-                        kwargs['rc'], kwargs['status'] = rc, status
-                        kwargs['result'], kwargs['task'] = result, task
-                    else:
-                        kwargs['status'], kwargs['task'] = status, task
-            except Exception as error:
-                exception_message = 'Issue encountered waiting for job.'
-                LOG.exception(exception_message)
-                raise exception.VolumeBackendAPIException(
-                    data=exception_message) from error
-
-            return kwargs
-
-        job_id = job['jobId']
-        kwargs = {'retries': 0, 'wait_for_job_called': False,
-                  'rc': 0, 'result': None}
-
-        while not kwargs['wait_for_job_called']:
-            time.sleep(self.interval)
-            kwargs = _wait_for_job_complete()
-            if kwargs['retries'] > self.retries:
-                LOG.error('_wait_for_job_complete failed after {cnt} '
-                          'tries.'.format(cnt=kwargs['retries']))
-                kwargs['rc'], kwargs['result'] = -1, kwargs['result']
-                break
-
-        LOG.debug('Return code is: {rc}. Result is {res}.'.format(
-            rc=kwargs['rc'], res=kwargs['result']))
-        return (kwargs['rc'], kwargs['result'],
-                kwargs['status'], kwargs['task'])
-
-    def get_job_by_id(self, job_id):
-        """Get details of a specific job.
+class BaseCommonFunctions(object):
+    """BaseCommonFunctions.
 
-        :param job_id: job id -- str
-        :returns: job details -- dict
-        """
-        return self.get_resource(category=SYSTEM, resource_level=JOB,
-                                 resource_level_id=job_id)
-
-    def _is_job_finished(self, job_id):
-        """Check if the job is finished.
+    URI building and response checking shared by CommonFunctions and
+    AsyncCommonFunctions, nothing here sends a request to Unisphere.
+    """
 
-        :param job_id: job id -- str
-        :returns: job complete, result, response code, status, task
-                  details -- bool, str, int, str, list
-        """
-        complete, rc, status, result, task = False, 0, None, None, None
-        job = self.get_job_by_id(job_id)
-        if job:
-            status = job['status']
-            try:
-                result, task = job['result'], job['task']
-            except KeyError:
-                pass
-            if status.lower() == SUCCEEDED:
-                complete = True
-            elif status.lower() in INCOMPLETE_LIST:
-                complete = False
-            else:
-                rc, complete = -1, True
-        return complete, result, rc, status, task
+    UNI_VERSION = constants.UNISPHERE_VERSION
 
     @staticmethod
     def check_status_code_success(operation, status_code, message):
@@ -182,29 +100,6 @@ class CommonFunctions(object):
             raise exception.VolumeBackendAPIException(
                 data=exception_message)
 
-    def wait_for_job(self, operation, status_code, job):
-        """Check if call is async, wait for it to complete.
-
-        :param operation: operation being performed -- str
-        :param status_code: status code -- int
-        :param job: job id -- str
-        :returns: task details -- list
-        :raises: VolumeBackendAPIException
-        """
-        task = None
-        if status_code == STATUS_202:
-            rc, result, status, task = self.wait_for_job_complete(job)
-            if rc != 0:
-                exception_message = (
-                    'Error {op}. Status code: {sc}. Error: {err}. '
-                    'Status: {st}.'.format(
-                        op=operation, sc=rc, err=six.text_type(result),
-                        st=status))
-                LOG.error(exception_message)
-                raise exception.VolumeBackendAPIException(
-                    data=exception_message)
-        return task
-
     def build_target_uri(self, *args, **kwargs):
         """Build the target URI.
 
@@ -335,16 +230,301 @@ class CommonFunctions(object):
                     ver=version))
         return version
 
+    @staticmethod
+    def get_job_resource_uri(job):
+        """Get the uri of the resource a job changes.
+
+        :param job: job details -- dict
+        :returns: target uri, None if the job has no resource link -- str
+        """
+        link = job.get('resourceLink') if job else None
+        if not link:
+            return None
+        # Links are absolute urls which include the REST base url
+        path = link.split('/restapi/', 1)[-1]
+        return '/{path}'.format(path=path.strip('/'))
+
+    @staticmethod
+    def _get_iterator_page_ranges(rest_response):
+        """Get the from/to ranges of the iterator pages after the first.
+
+        :param rest_response: response JSON from REST API -- dict
+        :returns: page start and end numbers -- list
+        """
+        page_ranges = list()
+        if rest_response.get('count') and int(rest_response.get('count')) > 0:
+            count = rest_response.get('count')
+            max_page_size = rest_response.get('maxPageSize')
+            if int(count) > int(max_page_size):
+                total_iterations = int(math.ceil(count / float(max_page_size)))
+                # We skip to second page as we already have the first page in
+                # the input param rest_response
+                for x in range(1, total_iterations):
+                    start = x * max_page_size + 1
+                    end = (x + 1) * max_page_size
+                    if end > count:
+                        end = count
+                    page_ranges.append((start, end))
+        return page_ranges
+
+    @staticmethod
+    def check_ipv4(ipv4):
+        """Check if a given string is a valid ipv6 address
+
+        :param ipv4: ipv4 address -- str
+        :returns: string is valid ipv4 address -- bool
+        """
+        try:
+            socket.inet_pton(socket.AF_INET, ipv4)
+            return True
+        except socket.error:
+            return False
+
+    @staticmethod
+    def check_ipv6(ipv6):
+        """Check if a given string is a valid ipv6 address
+
+        :param ipv6: ipv6 address -- str
+        :returns: string is valid ipv6 address -- bool
+        """
+        try:
+            socket.inet_pton(socket.AF_INET6, ipv6)
+            return True
+        except socket.error:
+            return False
+
+    @staticmethod
+    def convert_to_snake_case(camel_case_string):
+        """Convert a string from camel case to snake case.
+
+        :param camel_case_string: string for formatting -- str
+        :returns: snake case variant -- str
+        """
+        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', camel_case_string)
+        s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return s2.replace('__', '_')
+
+    @staticmethod
+    def check_timestamp(in_timestamp):
+        """Check that the timestamp is in the correct format
+
+        :param in_timestamp: timestamp e.g. 2020-11-24 15:00 -- str
+        """
+
+        pattern = (r'^[0-9]{4}-(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1]) '
+                   r'(2[0-3]|[01][0-9]):[0-5][0-9]$')
+        return re.match(pattern, in_timestamp)
+
+    @staticmethod
+    def check_epoch_timestamp(in_epoch_timestamp):
+        """Check that the timestamp is in the correct format
+
+        :param in_epoch_timestamp: timestamp e.g. 1554332400 -- str
+        """
+
+        pattern1 = r'^[0-9]{10}$'
+        pattern2 = r'^[0-9]{13}$'
+        return re.match(pattern1, in_epoch_timestamp) or re.match(
+            pattern2, in_epoch_timestamp)
+
+
+class CommonFunctions(BaseCommonFunctions):
+    """CommonFunctions."""
+
+    def __init__(self, rest_client, priority=None):
+        """__init__.
+
+        :param rest_client: rest client -- RestRequests
+        :param priority: rate limiter priority class for requests made by
+                         these functions, defaults to normal -- str
+        """
+        self.rest_client = rest_client
+        self.priority = priority
+        self.request = functools.partial(
+            self.rest_client.rest_request, priority=priority) if (
+            priority) else self.rest_client.rest_request
+        self.interval = self.rest_client.interval
+        self.retries = self.rest_client.retries
+        self.polling_policy = self.rest_client.polling_policy
+        self.UNI_VERSION = constants.UNISPHERE_VERSION
+
+    @property
+    def job_tracker(self):
+        """Get the job tracker shared by all users of the rest client.
+
+        :returns: job tracker -- JobTracker
+        """
+        return self.rest_client.get_job_tracker(self)
+
+    def wait_for_job_complete(self, job):
+        """Given the job wait for it to complete.
+
+        The job status is polled according to the polling policy, starting
+        with a short interval which grows up to the connection interval.
+        Polling stops if the next check would be after the current
+        deadline.
+
+        :param job: job details -- dict
+        :returns: response code, result, status, task details -- int, str, str,
+                  list
+        :raises: VolumeBackendAPIException, DeadlineExceededException
+        """
+        res, tasks = None, None
+        if job['status'].lower() == SUCCEEDED:
+            try:
+                res, tasks = job['result'], job['task']
+            except KeyError:
+                pass
+            return 0, res, job['status'], tasks
+
+        def _wait_for_job_complete():
+            """Called at an interval until the job is finished."""
+            retries = kwargs['retries']
+            try:
+                kwargs['retries'] = retries + 1
+                if not kwargs['wait_for_job_called']:
+                    is_complete, result, rc, status, task = (
+                        self._is_job_finished(job_id))
+                    if is_complete is True:
+                        kwargs['wait_for_job_called'] = True
+                        kwargs['rc'], kwargs['status'] = rc, status
+                        kwargs['result'], kwargs['task'] = result, task
+                    else:
+                        kwargs['status'], kwargs['task'] = status, task
+            except exception.DeadlineExceededException:
+                raise
+            except Exception as error:
+                exception_message = 'Issue encountered waiting for job.'
+                LOG.exception(exception_message)
+                raise exception.VolumeBackendAPIException(
+                    data=exception_message) from error
+
+            return kwargs
+
+        job_id = job['jobId']
+        kwargs = {'retries': 0, 'wait_for_job_called': False,
+                  'rc': 0, 'result': None}
+
+        while not kwargs['wait_for_job_called']:
+            interval = self.polling_policy.get_interval(
+                kwargs['retries'] + 1, job, self.interval)
+            dl.check('polling job {j}'.format(j=job_id), interval)
+            time.sleep(interval)
+            kwargs = _wait_for_job_complete()
+            if kwargs['retries'] > self.retries:
+                LOG.error('_wait_for_job_complete failed after {cnt} '
+                          'tries.'.format(cnt=kwargs['retries']))
+                kwargs['rc'], kwargs['result'] = -1, kwargs['result']
+                break
+
+        self.invalidate_job_resource(job)
+        LOG.debug('Return code is: {rc}. Result is {res}.'.format(
+            rc=kwargs['rc'], res=kwargs['result']))
+        return (kwargs['rc'], kwargs['result'],
+                kwargs['status'], kwargs['task'])
+
+    def track_job(self, job, callback=None):
+        """Wait for a job in the background.
+
+        Every job tracked through the same rest client is polled from one
+        background thread, the returned future gives the same response code,
+        result, status and task details as wait_for_job_complete.
+
+        :param job: job details or job id -- dict or str
+        :param callback: called with the future once the job is
+                         finished -- callable
+        :returns: job outcome -- concurrent.futures.Future
+        """
+        return self.job_tracker.track(job, callback)
+
+    def get_job_future(self, job, operation=None):
+        """Get a future for the outcome of an asynchronous request.
+
+        :param job: response of a request sent with ASYNC_UPDATE -- dict
+        :param operation: operation being performed -- str
+        :returns: job outcome -- JobFuture
+        """
+        future = job_tracker.JobFuture(job, operation)
+        if not future.job_id:
+            future.set_result(job)
+        else:
+            self.track_job(job, future.set_job_outcome)
+        return future
+
+    def get_job_by_id(self, job_id):
+        """Get details of a specific job.
+
+        :param job_id: job id -- str
+        :returns: job details -- dict
+        """
+        return self.get_resource(category=SYSTEM, resource_level=JOB,
+                                 resource_level_id=job_id)
+
+    def _is_job_finished(self, job_id):
+        """Check if the job is finished.
+
+        :param job_id: job id -- str
+        :returns: job complete, result, response code, status, task
+                  details -- bool, str, int, str, list
+        """
+        complete, rc, status, result, task = False, 0, None, None, None
+        job = self.get_job_by_id(job_id)
+        if job:
+            status = job['status']
+            try:
+                result, task = job['result'], job['task']
+            except KeyError:
+                pass
+            if status.lower() == SUCCEEDED:
+                complete = True
+            elif status.lower() in INCOMPLETE_LIST:
+                complete = False
+            else:
+                rc, complete = -1, True
+        return complete, result, rc, status, task
+
+    def wait_for_job(self, operation, status_code, job):
+        """Check if call is async, wait for it to complete.
+
+        :param operation: operation being performed -- str
+        :param status_code: status code -- int
+        :param job: job id -- str
+        :returns: task details -- list
+        :raises: VolumeBackendAPIException
+        """
+        task = None
+        if status_code == STATUS_202:
+            rc, result, status, task = self.wait_for_job_complete(job)
+            if rc != 0:
+                exception_message = (
+                    'Error {op}. Status code: {sc}. Error: {err}. '
+                    'Status: {st}.'.format(
+                        op=operation, sc=rc, err=six.text_type(result),
+                        st=status))
+                LOG.error(exception_message)
+                raise exception.VolumeBackendAPIException(
+                    data=exception_message)
+        return task
+
     def get_request(self, target_uri, resource_type, params=None):
         """Send a GET request to the array.
 
+        Concurrent identical GET requests, same uri and params, share a
+        single call to Unisphere when request coalescing is enabled.
+
         :param target_uri: target uri -- str
         :param resource_type: the resource type, e.g. maskingview -- str
         :param params: optional filter params -- dict
         :returns: resource_object -- dict
         :raises: ResourceNotFoundException
         """
-        message, sc = self.request(target_uri, GET, params=params)
+        flight = self.rest_client.singleflight
+        if flight:
+            message, sc = flight.do(
+                flight.make_key(target_uri, params), self.request,
+                target_uri, GET, params=params)
+        else:
+            message, sc = self.request(target_uri, GET, params=params)
         operation = 'GET {resource_type}'.format(resource_type=resource_type)
         self.check_status_code_success(operation, sc, message)
         return message
@@ -352,6 +532,10 @@ class CommonFunctions(object):
     def get_resource(self, *args, **kwargs):
         """Get resource details from the array.
 
+        If the rest client has a response cache, responses of resource types
+        with a cache TTL are returned from the cache until they expire or
+        are invalidated by a write.
+
         :key version: Unisphere version -- int
         :key no_version: if versionless uri -- bool
         :key category: resource category e.g. sloprovisioning -- str
@@ -372,9 +556,146 @@ class CommonFunctions(object):
             resource_type = args[2]
         elif not args and kwargs:
             resource_type = kwargs.get('resource_level')
+        cache = self.rest_client.response_cache
+        if cache:
+            # Cache TTLs apply to the most specific resource in the uri
+            cache_type = resource_type if args else (
+                kwargs.get('object_type') or kwargs.get('resource')
+                or kwargs.get('resource_type') or resource_type)
+            return cache.get_or_load(
+                target_uri, kwargs.get('params'), cache_type,
+                self.get_request, target_uri, resource_type,
+                kwargs.get('params'))
         return self.get_request(
             target_uri, resource_type, kwargs.get('params'))
 
+    def get_request_stream(self, target_uri, resource_type, params=None,
+                           result_path=json_stream.RESULT_LIST_PATH):
+        """Send a GET request to the array and stream the result list.
+
+        :param target_uri: target uri -- str
+        :param resource_type: the resource type, e.g. maskingview -- str
+        :param params: optional filter params -- dict
+        :param result_path: keys leading to the result list -- tuple
+        :returns: result list items, decoded as iterated -- JSONArrayStream
+        :raises: ResourceNotFoundException
+        """
+        message, sc = self.rest_client.stream_request(
+            target_uri, GET, params=params, result_path=result_path,
+            priority=self.priority)
+        operation = 'GET {resource_type}'.format(resource_type=resource_type)
+        self.check_status_code_success(operation, sc, message)
+        return message
+
+    def get_resources(self, resource_specs, max_workers=None,
+                      return_exceptions=True):
+        """Get many resources from the array concurrently.
+
+        Each resource spec is a dict of the keyword arguments accepted by
+        get_resource. Up to max_workers requests are in progress at once and
+        the results are returned in the same order as the specs. By default
+        the exception raised for a resource is returned in its place so one
+        missing resource does not fail the others.
+
+        :param resource_specs: get_resource keyword arguments -- list
+        :param max_workers: maximum concurrent requests, defaults to
+                            8 -- int
+        :param return_exceptions: return exceptions in place of results
+                                  instead of raising the first -- bool
+        :returns: resource objects or exceptions -- list
+        """
+        resource_specs = list(resource_specs)
+        max_workers = (
+            max_workers if max_workers else constants.DEFAULT_BULK_WORKERS)
+
+        def _get_resource(resource_spec):
+            """Get one resource, returning any exception raised."""
+            try:
+                return self.get_resource(**resource_spec)
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+                LOG.debug('Bulk get of {spec} failed: {err}'.format(
+                    spec=resource_spec, err=error))
+                return error
+
+        if max_workers > 1 and len(resource_specs) > 1:
+            with futures.ThreadPoolExecutor(
+                    max_workers=min(max_workers,
+                                    len(resource_specs))) as pool:
+                return list(pool.map(dl.wrap(_get_resource), resource_specs))
+        return [_get_resource(spec) for spec in resource_specs]
+
+    def invalidate_cached_responses(self, target_uri=None):
+        """Remove cached responses affected by a write.
+
+        Responses for the uri, its parents and its children are removed.
+
+        :param target_uri: written uri, None to remove every cached
+                           response -- str
+        """
+        if self.rest_client.response_cache:
+            self.rest_client.response_cache.invalidate(target_uri)
+
+    def invalidate_job_resource(self, job):
+        """Remove cached responses affected by a finished job.
+
+        Nothing is removed if the job does not link to the resource it
+        changed, responses written by the request which started the job
+        were already removed.
+
+        :param job: job details -- dict
+        """
+        target_uri = self.get_job_resource_uri(job)
+        if target_uri:
+            self.invalidate_cached_responses(target_uri)
+
+    def get_metadata(self, kind, load, array_id=None, key=None):
+        """Get static metadata, from the metadata cache if configured.
+
+        :param kind: metadata kind e.g. array_list -- str
+        :param load: function which gets the metadata from Unisphere --
+                     callable
+        :param array_id: array id, None for endpoint metadata -- str
+        :param key: JSON serializable value which distinguishes metadata
+                    of the same kind e.g. filters, None if not required
+        :returns: metadata
+        """
+        cache = self.rest_client.metadata_cache
+        if not cache:
+            return load()
+        return cache.get_or_load(
+            self.rest_client.base_url, array_id, kind, key, load)
+
+    def get_resource_stream(self, **kwargs):
+        """Get a resource list from the array, streaming the result items.
+
+        This is an opt-in alternative to get_resource for large list
+        responses, the items of resultList.result are decoded one at a time
+        as the returned stream is iterated instead of the whole response
+        being held in memory. Once iterated the remaining response values,
+        such as the iterator id and count, are in the stream metadata.
+
+        :key version: Unisphere version -- int
+        :key no_version: if versionless uri -- bool
+        :key category: resource category e.g. sloprovisioning -- str
+        :key resource_level: resource level e.g. storagegroup -- str
+        :key resource_level_id: resource level id -- str
+        :key resource_type: optional name of resource -- str
+        :key resource_type_id: optional name of resource -- str
+        :key resource: optional name of resource -- str
+        :key resource_id: optional name of resource -- str
+        :key object_type: optional name of resource -- str
+        :key object_type_id: optional name of resource -- str
+        :key params: query parameters -- dict
+        :key result_path: keys leading to the result list -- tuple
+        :returns: result list items, decoded as iterated -- JSONArrayStream
+        """
+        target_uri = self._build_uri(**kwargs)
+        return self.get_request_stream(
+            target_uri, kwargs.get('resource_level'), kwargs.get('params'),
+            kwargs.get('result_path', json_stream.RESULT_LIST_PATH))
+
     def create_resource(self, *args, **kwargs):
         """Create a resource.
 
@@ -390,11 +711,21 @@ class CommonFunctions(object):
         :key object_type: optional name of resource -- str
         :key object_type_id: optional name of resource -- str
         :key payload: query parameters -- dict
+        :key retry_safe: request is safe to retry -- bool
+        :key read_only: request is a query which does not modify the array,
+                        it is load balanced and retried as a GET -- bool
         :returns: resource object -- dict
         """
         target_uri = self._build_uri(*args, **kwargs)
-        message, status_code = self.request(
-            target_uri, POST, request_object=kwargs.get('payload'))
+        try:
+            message, status_code = self.request(
+                target_uri, POST, request_object=kwargs.get('payload'),
+                retry_safe=kwargs.get('retry_safe', False),
+                read_only=kwargs.get('read_only', False))
+        finally:
+            # Queries sent as POST, marked read_only, change nothing
+            if not kwargs.get('read_only'):
+                self.invalidate_cached_responses(target_uri)
         resource_type = None
         if args:
             resource_type = args[2]
@@ -420,11 +751,16 @@ class CommonFunctions(object):
         :key object_type: optional name of resource -- str
         :key object_type_id: optional name of resource -- str
         :key payload: query parameters
+        :key retry_safe: request is safe to retry -- bool
         :returns: resource object -- dict
         """
         target_uri = self._build_uri(*args, **kwargs)
-        message, status_code = self.request(
-            target_uri, PUT, request_object=kwargs.get('payload'))
+        try:
+            message, status_code = self.request(
+                target_uri, PUT, request_object=kwargs.get('payload'),
+                retry_safe=kwargs.get('retry_safe', False))
+        finally:
+            self.invalidate_cached_responses(target_uri)
         resource_type = None
         if args:
             resource_type = args[2]
@@ -450,11 +786,16 @@ class CommonFunctions(object):
         :key object_type: optional name of resource -- str
         :key object_type_id: optional name of resource -- str
         :key payload: query parameters
+        :key retry_safe: request is safe to retry -- bool
         """
         target_uri = self._build_uri(*args, **kwargs)
-        message, status_code = self.request(
-            target_uri, DELETE, request_object=kwargs.get('payload'),
-            params=kwargs.get('params'))
+        try:
+            message, status_code = self.request(
+                target_uri, DELETE, request_object=kwargs.get('payload'),
+                params=kwargs.get('params'),
+                retry_safe=kwargs.get('retry_safe', False))
+        finally:
+            self.invalidate_cached_responses(target_uri)
         resource_type = None
         if args:
             resource_type = args[2]
@@ -497,6 +838,11 @@ class CommonFunctions(object):
                 'message has been returned from Unisphere. Please check '
                 'Unisphere REST logs for further details.'.format(
                     uri=target_uri))
+        except Exception:
+            # Release the pooled connection held by the streamed response
+            if response is not None:
+                response.close()
+            raise
         return response
 
     def upload_file(self, **kwargs):
@@ -586,7 +932,9 @@ class CommonFunctions(object):
         :returns: version and major_version e.g. "V9.2.0.0", "92" -- str, str
         """
         version, major_version = None, None
-        response = self.get_resource(category=VERSION, no_version=True)
+        response = self.get_metadata(
+            constants.METADATA_UNISPHERE_VERSION, functools.partial(
+                self.get_resource, category=VERSION, no_version=True))
         if response and response.get('version'):
             version = response['version']
             version_list = version.split('.')
@@ -599,8 +947,10 @@ class CommonFunctions(object):
         :param filters: optional filters -- dict
         :returns: arrays ids -- list
         """
-        response = self.get_resource(
-            category=SYSTEM, resource_level=SYMMETRIX, params=filters)
+        response = self.get_metadata(
+            constants.METADATA_ARRAY_LIST, functools.partial(
+                self.get_resource, category=SYSTEM, resource_level=SYMMETRIX,
+                params=filters), key=filters)
         return response.get('symmetrixId', list()) if response else list()
 
     def get_v3_or_newer_array_list(self, filters=None):
@@ -636,32 +986,104 @@ class CommonFunctions(object):
             params={'from': start, 'to': end})
         return response.get('result', list()) if response else list()
 
-    def get_iterator_results(self, rest_response):
+    def get_iterator_page_stream(self, iterator_id, start, end):
+        """Get a page of results from an iterator instance as a stream.
+
+        :param iterator_id: iterator id -- str
+        :param start: the start number -- int
+        :param end: the end number -- int
+        :returns: iterator page results, decoded as iterated --
+                  JSONArrayStream
+        """
+        return self.get_resource_stream(
+            no_version=True, category=COMMON, resource_level=ITERATOR,
+            resource_level_id=iterator_id, resource_type=PAGE,
+            params={'from': start, 'to': end},
+            result_path=json_stream.PAGE_RESULT_PATH)
+
+    def get_iterator_results(self, rest_response, max_workers=None):
         """Get all results from all pages of an iterator if count > 1000.
 
+        If max_workers is greater than 1 the pages after the first are
+        requested concurrently by up to max_workers threads and reassembled
+        in order.
+
         :param rest_response: response JSON from REST API -- dict
+        :param max_workers: maximum concurrent page requests, pages are
+                            requested one at a time if not set -- int
         :returns: all results -- dict
         """
         full_response = list()
         full_response += rest_response['resultList']['result']
 
-        if rest_response.get('count') and int(rest_response.get('count')) > 0:
-            count = rest_response.get('count')
-            max_page_size = rest_response.get('maxPageSize')
-            if int(count) > int(max_page_size):
-                total_iterations = int(math.ceil(count / float(max_page_size)))
-                iterator_id = rest_response.get('id')
-                # We skip to second page as we already have the first page in
-                # the input param rest_response
-                for x in range(1, total_iterations):
-                    start = x * max_page_size + 1
-                    end = (x + 1) * max_page_size
-                    if end > count:
-                        end = count
-                    full_response += self.get_iterator_page_list(iterator_id,
-                                                                 start, end)
+        iterator_id = rest_response.get('id')
+        page_ranges = self._get_iterator_page_ranges(rest_response)
+        if max_workers and max_workers > 1 and len(page_ranges) > 1:
+            with futures.ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(page_ranges))) as pool:
+                pages = pool.map(dl.wrap(
+                    lambda page: self.get_iterator_page_list(
+                        iterator_id, *page)), page_ranges)
+                for page in pages:
+                    full_response += page
+            return full_response
+
+        for start, end in page_ranges:
+            full_response += self.get_iterator_page_list(iterator_id,
+                                                         start, end)
         return full_response
 
+    def iter_iterator_results(self, rest_response, prefetch=None):
+        """Iterate over the results from all pages of an iterator.
+
+        Results are yielded page by page as each page is received, only one
+        page is held in memory at a time.
+
+        If prefetch is set the next prefetch pages are requested in the
+        background while the caller processes the current page. At most
+        prefetch pages are requested or waiting to be consumed at any time,
+        a slow consumer holds back further requests.
+
+        :param rest_response: response JSON from REST API -- dict
+        :param prefetch: number of pages to request ahead -- int
+        :returns: results -- generator
+        """
+        iterator_id = rest_response.get('id')
+        page_ranges = self._get_iterator_page_ranges(rest_response)
+        if not prefetch or prefetch < 1 or not page_ranges:
+            for result in rest_response['resultList']['result']:
+                yield result
+            for start, end in page_ranges:
+                for result in self.get_iterator_page_list(
+                        iterator_id, start, end):
+                    yield result
+            return
+
+        remaining = iter(page_ranges)
+        pending = collections.deque()
+        pool = futures.ThreadPoolExecutor(max_workers=prefetch)
+        get_page = dl.wrap(self.get_iterator_page_list)
+        try:
+            for start, end in itertools.islice(remaining, prefetch):
+                pending.append(pool.submit(
+                    get_page, iterator_id, start, end))
+            for result in rest_response['resultList']['result']:
+                yield result
+            while pending:
+                page = pending.popleft().result()
+                next_range = next(remaining, None)
+                if next_range:
+                    pending.append(pool.submit(
+                        get_page, iterator_id, *next_range))
+                for result in page:
+                    yield result
+        finally:
+            # Stop any page requests not yet started if the caller stops
+            # iterating early
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+
     @decorators.refactoring_notice(
         'CommonFunctions', 'WLPFunctions.get_wlp_information', 9.1, 10.0)
     def get_wlp_information(self, array_id):
@@ -709,63 +1131,3 @@ class CommonFunctions(object):
             resource_level=SYMMETRIX, resource_level_id=array_id,
             resource_type=HEADROOM, params=params)
         return response.get('gbHeadroom', list()) if response else list()
-
-    @staticmethod
-    def check_ipv4(ipv4):
-        """Check if a given string is a valid ipv6 address
-
-        :param ipv4: ipv4 address -- str
-        :returns: string is valid ipv4 address -- bool
-        """
-        try:
-            socket.inet_pton(socket.AF_INET, ipv4)
-            return True
-        except socket.error:
-            return False
-
-    @staticmethod
-    def check_ipv6(ipv6):
-        """Check if a given string is a valid ipv6 address
-
-        :param ipv6: ipv6 address -- str
-        :returns: string is valid ipv6 address -- bool
-        """
-        try:
-            socket.inet_pton(socket.AF_INET6, ipv6)
-            return True
-        except socket.error:
-            return False
-
-    @staticmethod
-    def convert_to_snake_case(camel_case_string):
-        """Convert a string from camel case to snake case.
-
-        :param camel_case_string: string for formatting -- str
-        :returns: snake case variant -- str
-        """
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', camel_case_string)
-        s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-        return s2.replace('__', '_')
-
-    @staticmethod
-    def check_timestamp(in_timestamp):
-        """Check that the timestamp is in the correct format
-
-        :param in_timestamp: timestamp e.g. 2020-11-24 15:00 -- str
-        """
-
-        pattern = (r'^[0-9]{4}-(0[1-9]|1[0-2])-(0[1-9]|[1-2][0-9]|3[0-1]) '
-                   r'(2[0-3]|[01][0-9]):[0-5][0-9]$')
-        return re.match(pattern, in_timestamp)
-
-    @staticmethod
-    def check_epoch_timestamp(in_epoch_timestamp):
-        """Check that the timestamp is in the correct format
-
-        :param in_epoch_timestamp: timestamp e.g. 1554332400 -- str
-        """
-
-        pattern1 = r'^[0-9]{10}$'
-        pattern2 = r'^[0-9]{13}$'
-        return re.match(pattern1, in_epoch_timestamp) or re.match(
-            pattern2, in_epoch_timestamp)
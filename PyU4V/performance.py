@@ -14,19 +14,25 @@
 """performance.py."""
 
 import copy
+import functools
 import logging
 import re
 import socket
 import time
 
+from concurrent import futures
+
 from PyU4V import common
 from PyU4V import real_time
+from PyU4V.utils import columnar
 from PyU4V.utils import constants
+from PyU4V.utils import deadline as dl
 from PyU4V.utils import decorators
 from PyU4V.utils import exception
 from PyU4V.utils import file_handler
 from PyU4V.utils import performance_category_map
 from PyU4V.utils import performance_constants as pc
+from PyU4V.utils import performance_key_cache
 
 
 LOG = logging.getLogger(__name__)
@@ -38,7 +44,8 @@ class PerformanceFunctions(object):
 
     def __init__(self, array_id, rest_client):
         """__init__."""
-        self.common = common.CommonFunctions(rest_client)
+        self.common = common.CommonFunctions(
+            rest_client, priority=constants.PRIORITY_BACKGROUND)
         self.real_time = real_time.RealTimeFunctions(array_id, rest_client)
         self.post_request = self.common.create_resource
         self.get_request = self.common.get_resource
@@ -46,6 +53,7 @@ class PerformanceFunctions(object):
         self.array_id = array_id
         self.timestamp = None
         self.recency = 7
+        self.key_cache = performance_key_cache.PerformanceKeyCache()
 
     def set_array_id(self, array_id):
         """Set the array id.
@@ -68,6 +76,14 @@ class PerformanceFunctions(object):
         """
         self.recency = minutes
 
+    def set_key_cache(self, key_cache):
+        """Set the cache of performance key list timestamps.
+
+        :param key_cache: key cache, None to always get the key list --
+                          PerformanceKeyCache
+        """
+        self.key_cache = key_cache
+
     @decorators.refactoring_notice(
         'PyU4V.performance',
         'PyU4V.performance.is_array_diagnostic_performance_registered',
@@ -435,9 +451,12 @@ class PerformanceFunctions(object):
         if cat:
             request = self.get_request if pc.ARRAY in cat[pc.CATEGORY] else (
                 self.post_request)
-            response = request(
-                category=pc.PERFORMANCE, resource_level=cat[pc.CATEGORY],
-                resource_type=pc.KEYS, payload=request_body)
+            response = self.common.get_metadata(
+                constants.METADATA_PERFORMANCE_KEYS, functools.partial(
+                    request, category=pc.PERFORMANCE,
+                    resource_level=cat[pc.CATEGORY], resource_type=pc.KEYS,
+                    payload=request_body, read_only=True),
+                array_id=array_id, key=[cat[pc.CATEGORY], request_body])
 
             if response:
                 return response
@@ -534,18 +553,33 @@ class PerformanceFunctions(object):
         """
         array_id = self.array_id if not array_id else array_id
         self.validate_category(category)
+        tgt_id = array_id if not key_tgt_id else key_tgt_id
+        if self.key_cache:
+            return self.key_cache.get_timestamps(
+                array_id, category, director_id, tgt_id, functools.partial(
+                    self.get_performance_key_list, category=category,
+                    array_id=array_id, director_id=director_id))
         response = self.get_performance_key_list(
             category=category, array_id=array_id, director_id=director_id)
+        return self.get_timestamps_from_key_list(response, tgt_id)
+
+    @staticmethod
+    def get_timestamps_from_key_list(key_list, tgt_id):
+        """Get the first and last available timestamps of an object.
+
+        :param key_list: performance key list response -- dict
+        :param tgt_id: object id for the timestamp required -- str
+        :returns: timestamp in milliseconds since epoch -- str
+        """
         key_regex = re.compile(r'\A[\w]*(Info)$')
         start = None
         end = None
-        for key in response.keys():
+        for key in key_list.keys():
             match = key_regex.search(key)
             if match:
-                time_keys = response.get(match.group())
+                time_keys = key_list.get(match.group())
                 for p_keys in time_keys:
                     for k, v in p_keys.items():
-                        tgt_id = array_id if not key_tgt_id else key_tgt_id
                         if isinstance(v, str) and tgt_id in v:
                             start = p_keys.get(pc.FA_DATE)
                             end = p_keys.get(pc.LA_DATE)
@@ -614,6 +648,17 @@ class PerformanceFunctions(object):
             raise exception.VolumeBackendAPIException(err_msg)
 
         # 4. Check time values are valid
+        return self.validate_time_range(start_time, end_time)
+
+    @staticmethod
+    def validate_time_range(start_time, end_time):
+        """Check that a start and end time form a valid time range.
+
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :returns: start time, end time (tuple) -- str, str
+        :raises: InvalidInputException
+        """
         if len(str(start_time)) != 13 and len(str(end_time)) != 13:
             raise exception.InvalidInputException(
                 'Invalid time input, time must be in milliseconds since epoch')
@@ -623,35 +668,14 @@ class PerformanceFunctions(object):
 
         return str(start_time), str(end_time)
 
-    def get_performance_stats(
-            self, category, metrics, data_format=pc.AVERAGE, array_id=None,
-            request_body=None, start_time=None, end_time=None, recency=None):
-        """Retrieve the performance statistics for a given category and object.
+    @staticmethod
+    def get_request_body_object_ids(request_body):
+        """Get the director and object IDs from a stats request body.
 
-        :param category: category id -- str
-        :param array_id: array id -- str
-        :param metrics: performance metrics, options are individual metrics,
-                        a list of metrics, 'KPI' for KPI metrics only, and
-                        'ALL' for all metrics -- str/list
-        :param data_format: response data format 'Average' or 'Maximum' -- str
         :param request_body: request params and object IDs -- dict
-        :param start_time: timestamp in milliseconds since epoch -- str
-        :param end_time: timestamp in milliseconds since epoch -- str
-        :param recency: check recency of timestamp in minutes -- int
-        :returns: performance metrics -- dict
-        :raises: VolumeBackendAPIException, InvalidInputException
+        :returns: director id, object id -- str, str
         """
-        array_id = self.array_id if not array_id else array_id
         director_id, object_id = None, None
-        metrics_list, performance_details = list(), dict()
-        if not request_body:
-            request_body = dict()
-
-        # 1. Validate category
-        self.validate_category(category)
-
-        # 2. Format Time input - request body input need to retrieve object
-        # specific timestamps
         if request_body:
             req_body_copy = copy.deepcopy(request_body)
             # Dir/Port Scenario
@@ -668,21 +692,18 @@ class PerformanceFunctions(object):
                         match = key_regex.search(key)
                         if match:
                             object_id = req_body_copy.get(match.group())
+        return director_id, object_id
 
-        start_time, end_time = self.format_time_input(
-            array_id=array_id, category=category, director_id=director_id,
-            key_tgt_id=object_id, start_time=start_time, end_time=end_time)
-
-        # 3. Check recency
-        if recency:
-            recency = recency if isinstance(recency, int) else self.recency
+    def get_metrics_list_from_input(self, category, metrics):
+        """Get the list of metrics to request for a given metrics input.
 
-            if not self.is_timestamp_current(int(end_time), minutes=recency):
-                raise exception.VolumeBackendAPIException(
-                    'Timestamp failed recency check of {rec} '
-                    'minutes.'.format(rec=recency))
-
-        # 4. Format Metrics
+        :param category: performance category -- str
+        :param metrics: performance metrics, options are individual metrics,
+                        a list of metrics, 'KPI' for KPI metrics only, and
+                        'ALL' for all metrics -- str/list
+        :returns: metrics -- list
+        """
+        metrics_list = list()
         if isinstance(metrics, list):
             metrics_list = metrics
         elif isinstance(metrics, str):
@@ -694,17 +715,105 @@ class PerformanceFunctions(object):
                     category=category)
             else:
                 metrics_list = self.format_metrics(metrics)
+        return metrics_list
 
-        # 5. Set data format
+    @staticmethod
+    def validate_data_format(data_format):
+        """Validate a performance data format input.
+
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :returns: data format -- str
+        :raises: InvalidInputException
+        """
         if data_format.upper() not in [pc.AVERAGE.upper(), pc.MAXIMUM.upper()]:
             raise exception.InvalidInputException(
                 'Invalid data format "{f}" specified, please use one of '
                 'Average or Maximum'.format(f=data_format))
 
         if pc.MAXIMUM.upper() in data_format.upper():
-            data_format = pc.MAXIMUM
-        else:
-            data_format = pc.AVERAGE
+            return pc.MAXIMUM
+        return pc.AVERAGE
+
+    @staticmethod
+    def validate_result_format(result_format):
+        """Check that a supplied result format is valid and available.
+
+        :param result_format: 'rows' or 'columnar' -- str
+        :raises: InvalidInputException, MissingDependencyException
+        """
+        if result_format not in [pc.ROWS, pc.COLUMNAR]:
+            msg = ('Invalid result format "{fmt}" supplied, valid options '
+                   'are {opts}.'.format(fmt=result_format,
+                                        opts=[pc.ROWS, pc.COLUMNAR]))
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        if result_format == pc.COLUMNAR:
+            columnar.check_available()
+
+    @dl.with_deadline
+    def get_performance_stats(
+            self, category, metrics, data_format=pc.AVERAGE, array_id=None,
+            request_body=None, start_time=None, end_time=None, recency=None,
+            deadline=None, result_format=pc.ROWS):
+        """Retrieve the performance statistics for a given category and object.
+
+        If deadline is set the timestamp lookup, metrics request and iterator
+        pages must all complete within deadline seconds, each request uses
+        only the remaining budget as its timeout.
+
+        By default the result is a list with a dict of metric values per
+        timestamp. If result_format is 'columnar' the result is a dict with
+        an int64 NumPy array of timestamps and a float64 NumPy array per
+        metric, built page by page as the iterator is read. The columnar
+        format requires NumPy.
+
+        :param category: category id -- str
+        :param array_id: array id -- str
+        :param metrics: performance metrics, options are individual metrics,
+                        a list of metrics, 'KPI' for KPI metrics only, and
+                        'ALL' for all metrics -- str/list
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :param request_body: request params and object IDs -- dict
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :param recency: check recency of timestamp in minutes -- int
+        :param deadline: seconds the whole operation may take -- float
+        :param result_format: 'rows' or 'columnar' -- str
+        :returns: performance metrics -- dict
+        :raises: VolumeBackendAPIException, InvalidInputException,
+                 DeadlineExceededException, MissingDependencyException
+        """
+        array_id = self.array_id if not array_id else array_id
+        performance_details = dict()
+        if not request_body:
+            request_body = dict()
+
+        # 1. Validate category and result format
+        self.validate_category(category)
+        self.validate_result_format(result_format)
+
+        # 2. Format Time input - request body input need to retrieve object
+        # specific timestamps
+        director_id, object_id = self.get_request_body_object_ids(
+            request_body)
+        start_time, end_time = self.format_time_input(
+            array_id=array_id, category=category, director_id=director_id,
+            key_tgt_id=object_id, start_time=start_time, end_time=end_time)
+
+        # 3. Check recency
+        if recency:
+            recency = recency if isinstance(recency, int) else self.recency
+
+            if not self.is_timestamp_current(int(end_time), minutes=recency):
+                raise exception.VolumeBackendAPIException(
+                    'Timestamp failed recency check of {rec} '
+                    'minutes.'.format(rec=recency))
+
+        # 4. Format Metrics
+        metrics_list = self.get_metrics_list_from_input(category, metrics)
+
+        # 5. Set data format
+        data_format = self.validate_data_format(data_format)
 
         # Add asset IDs to the return dict before additional key/values added
         if request_body:
@@ -722,11 +831,20 @@ class PerformanceFunctions(object):
         # 7. Post Request
         perf_response = self.post_request(
             category=pc.PERFORMANCE, resource_level=category,
-            resource_type=pc.METRICS, payload=request_body)
+            resource_type=pc.METRICS, payload=request_body, read_only=True)
 
         # 8 Format results response
+        if result_format == pc.COLUMNAR:
+            result = columnar.build_columns(
+                self.common.iter_iterator_results(
+                    perf_response,
+                    prefetch=constants.DEFAULT_ITERATOR_WORKERS),
+                metrics_list, count=perf_response.get('count'))
+        else:
+            result = self.common.get_iterator_results(
+                perf_response, max_workers=constants.DEFAULT_ITERATOR_WORKERS)
         performance_details.update(
-            {'result': self.common.get_iterator_results(perf_response),
+            {'result': result,
              'array_id': str(array_id),
              'start_date': start_time,
              'end_date': end_time,
@@ -735,6 +853,320 @@ class PerformanceFunctions(object):
 
         return performance_details
 
+    def get_category_object_keys(
+            self, category, array_id=None, director_id=None,
+            start_time=None, end_time=None):
+        """Get the performance keys of the objects of a category.
+
+        :param category: category id -- str
+        :param array_id: array id -- str
+        :param director_id: director id, required for port categories -- str
+        :param start_time: timestamp in milliseconds since epoch, only used
+                           by categories which list the objects active in a
+                           time range -- str
+        :param end_time: timestamp in milliseconds since epoch, only used
+                         by categories which list the objects active in a
+                         time range -- str
+        :returns: object keys with first and last available dates keyed by
+                  object id -- dict
+        :raises: InvalidInputException, ResourceNotFoundException
+        """
+        array_id = self.array_id if not array_id else array_id
+        self.validate_category(category)
+        category = CATEGORY_MAP[category.upper()][pc.CATEGORY]
+        if category in pc.PORT_CATEGORIES and not director_id:
+            msg = 'A director id is required for category {cat}.'.format(
+                cat=category)
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        key_id = pc.STATS_OBJECT_IDS[category][0]
+        key_start, key_end = None, None
+        if category in pc.TIME_RANGE_KEY_CATEGORIES:
+            # Only objects active in the time range are listed
+            key_start, key_end = self.format_time_input(
+                category=pc.ARRAY, array_id=array_id, start_time=start_time,
+                end_time=end_time)
+        key_list = self.get_performance_key_list(
+            category=category, array_id=array_id, director_id=director_id,
+            start_time=key_start, end_time=key_end)
+        object_keys = dict()
+        for key, time_keys in key_list.items():
+            if performance_key_cache.KEY_REGEX.search(key) and time_keys:
+                for p_keys in time_keys:
+                    if p_keys.get(key_id) is not None:
+                        object_keys[str(p_keys[key_id])] = p_keys
+        return object_keys
+
+    def _get_object_stats(
+            self, category, object_id, p_keys, metrics_list, array_id,
+            director_id, data_format, start_time, end_time,
+            result_format=pc.ROWS):
+        """Get the statistics of an object found in the category keys.
+
+        A start time without an end time must already be resolved to the
+        last available timestamp of the array.
+
+        :param category: category id -- str
+        :param object_id: object id -- str
+        :param p_keys: object keys, None if not found -- dict
+        :param metrics_list: performance metrics -- list
+        :param array_id: array id -- str
+        :param director_id: director id of port categories -- str
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :param result_format: 'rows' or 'columnar' -- str
+        :returns: performance metrics -- dict
+        :raises: ResourceNotFoundException
+        """
+        if not p_keys:
+            raise exception.ResourceNotFoundException(
+                'Object "{obj}" could not be found in the performance keys '
+                'of category "{cat}".'.format(obj=object_id, cat=category))
+        key_id, request_id = pc.STATS_OBJECT_IDS[category]
+        if not start_time:
+            start_time = p_keys.get(pc.FA_DATE) if end_time else p_keys.get(
+                pc.LA_DATE)
+            end_time = end_time if end_time else start_time
+        request_body = dict()
+        if request_id:
+            request_body[request_id] = p_keys[key_id]
+        if director_id and request_id != pc.DIR_ID:
+            request_body[pc.DIR_ID] = director_id
+        if p_keys.get(pc.STORAGE_CONT_ID) and (
+                request_id != pc.STORAGE_CONT_ID):
+            request_body[pc.STORAGE_CONT_ID] = p_keys[pc.STORAGE_CONT_ID]
+        return self.get_performance_stats(
+            category=category, metrics=metrics_list, data_format=data_format,
+            array_id=array_id, request_body=request_body,
+            start_time=start_time, end_time=end_time,
+            result_format=result_format)
+
+    @dl.with_deadline
+    def get_bulk_stats(
+            self, category, object_ids=pc.ALL, metrics=pc.KPI,
+            director_id=None, array_id=None, data_format=pc.AVERAGE,
+            start_time=None, end_time=None, max_workers=None,
+            return_exceptions=True, deadline=None, result_format=pc.ROWS,
+            object_keys=None):
+        """Retrieve the performance statistics of many objects of a category.
+
+        The category keys are retrieved once, unless given, to find the
+        objects and their first and last available timestamps, then the
+        statistics of up to max_workers objects are requested at once. By
+        default the exception raised for an object is returned in place of
+        its statistics so one object does not fail the others. Port
+        categories require the director id.
+
+        :param category: category id -- str
+        :param object_ids: object ids, 'ALL' for every object in the
+                           category keys -- str/list
+        :param metrics: performance metrics, options are individual metrics,
+                        a list of metrics, 'KPI' for KPI metrics only, and
+                        'ALL' for all metrics -- str/list
+        :param director_id: director id, required for port categories -- str
+        :param array_id: array id -- str
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :param max_workers: maximum concurrent requests, defaults to
+                            8 -- int
+        :param return_exceptions: return exceptions in place of statistics
+                                  instead of raising the first -- bool
+        :param deadline: seconds the whole operation may take -- float
+        :param result_format: 'rows' or 'columnar' -- str
+        :param object_keys: category keys keyed by object id, as returned by
+                            get_category_object_keys -- dict
+        :returns: performance metrics or exceptions keyed by object id --
+                  dict
+        :raises: InvalidInputException, ResourceNotFoundException,
+                 DeadlineExceededException, MissingDependencyException
+        """
+        array_id = self.array_id if not array_id else array_id
+        self.validate_result_format(result_format)
+        if object_keys is None:
+            object_keys = self.get_category_object_keys(
+                category, array_id=array_id, director_id=director_id,
+                start_time=start_time, end_time=end_time)
+        category = CATEGORY_MAP[category.upper()][pc.CATEGORY]
+        if isinstance(object_ids, str) and object_ids.upper() == (
+                pc.ALL.upper()):
+            object_ids = [array_id] if category == pc.ARRAY else list(
+                object_keys)
+        elif isinstance(object_ids, str):
+            object_ids = [object_ids]
+        object_ids = [str(object_id) for object_id in object_ids]
+        max_workers = (
+            max_workers if max_workers else constants.DEFAULT_BULK_WORKERS)
+
+        # The time range and metrics are shared by all objects
+        if start_time and not end_time:
+            end_time = self.get_last_available_timestamp(array_id)
+        metrics_list = self.get_metrics_list_from_input(category, metrics)
+
+        def _get_stats(object_id):
+            """Get the statistics of one object, returning any exception."""
+            try:
+                return self._get_object_stats(
+                    category, object_id, object_keys.get(object_id),
+                    metrics_list, array_id, director_id, data_format,
+                    start_time, end_time, result_format)
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+                LOG.debug('Bulk {cat} stats of {obj} failed: {err}'.format(
+                    cat=category, obj=object_id, err=error))
+                return error
+
+        if max_workers > 1 and len(object_ids) > 1:
+            with futures.ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(object_ids))) as pool:
+                results = list(pool.map(dl.wrap(_get_stats), object_ids))
+        else:
+            results = [_get_stats(object_id) for object_id in object_ids]
+        return dict(zip(object_ids, results))
+
+    @dl.with_deadline
+    def get_array_snapshot(
+            self, metrics=pc.KPI, categories=None, array_id=None,
+            data_format=pc.AVERAGE, start_time=None, end_time=None,
+            max_workers=None, deadline=None, result_format=pc.ROWS):
+        """Retrieve the performance statistics of every object on an array.
+
+        The keys of every category are retrieved concurrently and the keys
+        of each director category are reused to list the ports of its
+        directors. The statistics of every object are then requested
+        through the same pool of max_workers threads. Categories with no
+        objects on the array are returned empty. The exception raised for
+        the keys of a category is returned in place of its objects, and the
+        exception raised for an object in place of its statistics. Ports
+        are keyed by director and port id e.g. FA-1D:4, or by director id
+        if the ports of the director could not be listed.
+
+        :param metrics: 'KPI' for KPI metrics only or 'ALL' for all
+                        metrics -- str
+        :param categories: categories to collect, defaults to every
+                           category -- list
+        :param array_id: array id -- str
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :param start_time: timestamp in milliseconds since epoch -- str
+        :param end_time: timestamp in milliseconds since epoch -- str
+        :param max_workers: maximum concurrent requests, defaults to
+                            8 -- int
+        :param deadline: seconds the whole operation may take -- float
+        :param result_format: 'rows' or 'columnar' -- str
+        :returns: performance metrics or exceptions keyed by object id,
+                  keyed by category -- dict
+        :raises: InvalidInputException, DeadlineExceededException,
+                 MissingDependencyException
+        """
+        array_id = self.array_id if not array_id else array_id
+        self.validate_result_format(result_format)
+        if categories is None:
+            categories = [cat[pc.CATEGORY] for cat in CATEGORY_MAP.values()]
+        for category in categories:
+            self.validate_category(category)
+        categories = [CATEGORY_MAP[category.upper()][pc.CATEGORY]
+                      for category in categories]
+        max_workers = (
+            max_workers if max_workers else constants.DEFAULT_BULK_WORKERS)
+        if start_time and not end_time:
+            end_time = self.get_last_available_timestamp(array_id)
+
+        def _get_keys(category, director_id=None):
+            """Get the object keys of a category, empty if it has none."""
+            try:
+                return self.get_category_object_keys(
+                    category, array_id=array_id, director_id=director_id,
+                    start_time=start_time, end_time=end_time)
+            except exception.ResourceNotFoundException:
+                return dict()
+
+        def _get_result(future):
+            """Get the result of a future, returning any exception."""
+            try:
+                return future.result()
+            except Exception as error:
+                LOG.debug('Array snapshot request failed: {err}'.format(
+                    err=error))
+                return error
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            get_keys = dl.wrap(_get_keys)
+            get_stats = dl.wrap(self._get_object_stats)
+
+            # 1. Discover the keys of every category concurrently, director
+            # keys are also needed to list the ports of each director
+            key_futures = dict()
+            for category in categories + [
+                    pc.PORT_CATEGORIES[category] for category in categories
+                    if category in pc.PORT_CATEGORIES]:
+                if category not in pc.PORT_CATEGORIES and (
+                        category not in key_futures):
+                    key_futures[category] = pool.submit(get_keys, category)
+
+            # 2. List the ports of each director once its keys are known
+            for category in categories:
+                if category in pc.PORT_CATEGORIES:
+                    director_keys = _get_result(
+                        key_futures[pc.PORT_CATEGORIES[category]])
+                    key_futures[category] = director_keys if isinstance(
+                        director_keys, Exception) else {
+                        director_id: pool.submit(
+                            get_keys, category, director_id=director_id)
+                        for director_id in director_keys}
+
+            # 3. Request the statistics of every object as soon as the keys
+            # of its category are known
+            stats_futures = dict()
+            for category in categories:
+                if isinstance(key_futures[category], Exception):
+                    stats_futures[category] = key_futures[category]
+                    continue
+                objects = list()
+                if category in pc.PORT_CATEGORIES:
+                    for director_id, future in key_futures[category].items():
+                        port_keys = _get_result(future)
+                        if isinstance(port_keys, Exception):
+                            objects.append(
+                                (director_id, director_id, port_keys))
+                            continue
+                        objects.extend(
+                            ('{dir}:{port}'.format(
+                                dir=director_id, port=object_id),
+                             director_id, p_keys)
+                            for object_id, p_keys in port_keys.items())
+                else:
+                    object_keys = _get_result(key_futures[category])
+                    if isinstance(object_keys, Exception):
+                        stats_futures[category] = object_keys
+                        continue
+                    if category == pc.ARRAY:
+                        object_keys = {array_id: object_keys.get(array_id)}
+                    objects.extend(
+                        (object_id, None, p_keys)
+                        for object_id, p_keys in object_keys.items())
+                metrics_list = self.get_metrics_list_from_input(
+                    category, metrics)
+                stats_futures[category] = {
+                    object_id: p_keys if isinstance(p_keys, Exception) else (
+                        pool.submit(
+                            get_stats, category, object_id, p_keys,
+                            metrics_list, array_id, director_id,
+                            data_format, start_time, end_time,
+                            result_format))
+                    for object_id, director_id, p_keys in objects}
+
+            # 4. Collect the results
+            snapshot = dict()
+            for category, object_futures in stats_futures.items():
+                snapshot[category] = object_futures if isinstance(
+                    object_futures, Exception) else {
+                    object_id: future if isinstance(future, Exception) else (
+                        _get_result(future))
+                    for object_id, future in object_futures.items()}
+        return snapshot
+
     def get_days_to_full(self, array_id=None, array_to_full=False,
                          srp_to_full=False, thin_pool_to_full=False):
         """Get days to full information.
@@ -766,7 +1198,7 @@ class PerformanceFunctions(object):
         request_body = {pc.SYMM_ID: array_id, pc.CATEGORY: category}
         response = self.post_request(
             category=pc.PERFORMANCE, resource_level=pc.DAYS_TO_FULL,
-            payload=request_body)
+            payload=request_body, read_only=True)
         return response.get(
             pc.DAYS_TO_FULL_RESULT, list()) if response else list()
 
@@ -13,8 +13,8 @@
 # limitations under the License.
 """provisioning.py."""
 
+import functools
 import logging
-import math
 import random
 import re
 
@@ -55,7 +55,8 @@ class ProvisioningFunctions(object):
     def __init__(self, array_id, rest_client):
         """__init__."""
         self.array_id = array_id
-        self.common = CommonFunctions(rest_client)
+        self.common = CommonFunctions(
+            rest_client, priority=constants.PRIORITY_INTERACTIVE)
         self.get_resource = self.common.get_resource
         self.create_resource = self.common.create_resource
         self.modify_resource = self.common.modify_resource
@@ -89,10 +90,11 @@ class ProvisioningFunctions(object):
 
         :returns: directors -- list
         """
-        response = self.get_resource(
-            category=SYSTEM,
-            resource_level=SYMMETRIX, resource_level_id=self.array_id,
-            resource_type=DIRECTOR)
+        response = self.common.get_metadata(
+            constants.METADATA_DIRECTOR_LIST, functools.partial(
+                self.get_resource, category=SYSTEM,
+                resource_level=SYMMETRIX, resource_level_id=self.array_id,
+                resource_type=DIRECTOR), array_id=self.array_id)
         return response.get('directorId', list()) if response else list()
 
     def get_director_port(self, director, port_no):
@@ -117,11 +119,13 @@ class ProvisioningFunctions(object):
         :param filters: optional filters - dict
         :returns: port key dicts -- list
         """
-        response = self.get_resource(
-            category=SYSTEM,
-            resource_level=SYMMETRIX, resource_level_id=self.array_id,
-            resource_type=DIRECTOR, resource_type_id=director,
-            resource=PORT, params=filters)
+        response = self.common.get_metadata(
+            constants.METADATA_PORT_LIST, functools.partial(
+                self.get_resource, category=SYSTEM,
+                resource_level=SYMMETRIX, resource_level_id=self.array_id,
+                resource_type=DIRECTOR, resource_type_id=director,
+                resource=PORT, params=filters), array_id=self.array_id,
+            key=[director, filters])
         port_key_list = (
             response.get('symmetrixPortKey', list()) if response else list())
         return port_key_list
@@ -926,10 +930,12 @@ class ProvisioningFunctions(object):
         :param filters: optional filters e.g. {'vnx_attached': 'true'} -- dict
         :returns: port key dicts -- list
         """
-        response = self.get_resource(
-            category=SLOPROVISIONING,
-            resource_level=SYMMETRIX, resource_level_id=self.array_id,
-            resource_type=PORT, params=filters)
+        response = self.common.get_metadata(
+            constants.METADATA_PORT_LIST, functools.partial(
+                self.get_resource, category=SLOPROVISIONING,
+                resource_level=SYMMETRIX, resource_level_id=self.array_id,
+                resource_type=PORT, params=filters), array_id=self.array_id,
+            key=[SLOPROVISIONING, filters])
         return response.get('symmetrixPortKey', list()) if response else list()
 
     @decorators.refactoring_notice(
@@ -1555,7 +1561,8 @@ class ProvisioningFunctions(object):
             self, srp_id, sg_id, slo=None, workload=None,
             do_disable_compression=False, num_vols=0, vol_size=0,
             cap_unit='GB', allocate_full=False, _async=False,
-            vol_name=None, snapshot_policy_ids=None, enable_mobility_id=False):
+            vol_name=None, snapshot_policy_ids=None, enable_mobility_id=False,
+            return_future=False):
         """Create a storage group with optional volumes on create operation.
 
         :param srp_id: SRP id -- str
@@ -1573,7 +1580,9 @@ class ProvisioningFunctions(object):
                                     to associate with storage group -- list
         :param enable_mobility_id: enables unique volume WWN not tied to array
                                    serial number -- bool
-        :returns: storage group details -- dict
+        :param return_future: run asynchronously and return a future for the
+                              job -- bool
+        :returns: storage group details or job outcome -- dict or JobFuture
         """
         srp_id = srp_id if srp_id else 'None'
         slo = slo if slo else 'None'
@@ -1611,16 +1620,20 @@ class ProvisioningFunctions(object):
             payload.update({'snapshot_policies': snapshot_policy_ids})
         payload.update({'sloBasedStorageGroupParam': [slo_param]})
 
-        if _async:
+        if _async or return_future:
             payload.update(ASYNC_UPDATE)
 
         if enable_mobility_id:
             slo_param.update({'enable_mobility_id': enable_mobility_id})
 
-        return self.create_resource(
+        response = self.create_resource(
             category=SLOPROVISIONING,
             resource_level=SYMMETRIX, resource_level_id=self.array_id,
             resource_type=STORAGEGROUP, payload=payload)
+        if return_future:
+            return self.common.get_job_future(
+                response, 'creating storage group {sg}'.format(sg=sg_id))
+        return response
 
     @decorators.refactoring_notice(
         'ProvisioningFunctions',
@@ -1824,7 +1837,7 @@ class ProvisioningFunctions(object):
             vol_name=None, create_new_volumes=None,
             remote_array_1_id=None, remote_array_1_sgs=None,
             remote_array_2_id=None, remote_array_2_sgs=None,
-            enable_mobility_id=False):
+            enable_mobility_id=False, return_future=False):
         """Expand an existing storage group by adding new volumes.
 
         :param storage_group_id: storage group id -- str
@@ -1848,7 +1861,9 @@ class ProvisioningFunctions(object):
                                    -- str or list
         :param enable_mobility_id: enables unique volume WWN not tied to array
                                    serial number -- bool
-        :returns: storage group details -- dict
+        :param return_future: run asynchronously and return a future for the
+                              job -- bool
+        :returns: storage group details or job outcome -- dict or JobFuture
         """
         add_volume_param = {'emulation': 'FBA'}
 
@@ -1889,9 +1904,14 @@ class ProvisioningFunctions(object):
                 add_volume_param['remoteSymmSGInfoParam'].update({
                     'remote_symmetrix_2_id': remote_array_2_id,
                     'remote_symmetrix_2_sgs': remote_array_2_sgs})
-        if _async:
+        if _async or return_future:
             expand_sg_data.update(ASYNC_UPDATE)
-        return self.modify_storage_group(storage_group_id, expand_sg_data)
+        response = self.modify_storage_group(storage_group_id, expand_sg_data)
+        if return_future:
+            return self.common.get_job_future(
+                response, 'adding volumes to storage group {sg}'.format(
+                    sg=storage_group_id))
+        return response
 
     @decorators.refactoring_notice(
         'ProvisioningFunctions',
@@ -2283,37 +2303,48 @@ class ProvisioningFunctions(object):
             resource_level=SYMMETRIX, resource_level_id=self.array_id,
             resource_type=VOLUME, resource_type_id=device_id)
 
+    def get_volumes(self, device_ids, max_workers=None,
+                    return_exceptions=True):
+        """Get details of many volumes concurrently.
+
+        :param device_ids: device ids -- list
+        :param max_workers: maximum concurrent requests -- int
+        :param return_exceptions: return exceptions in place of volumes which
+                                  could not be retrieved instead of raising
+                                  the first -- bool
+        :returns: volume details in device id order -- list
+        """
+        return self.common.get_resources(
+            [{'category': SLOPROVISIONING, 'resource_level': SYMMETRIX,
+              'resource_level_id': self.array_id, 'resource_type': VOLUME,
+              'resource_type_id': device_id} for device_id in device_ids],
+            max_workers=max_workers, return_exceptions=return_exceptions)
+
     def get_volume_list(self, filters=None):
         """Get list of volumes from array.
 
         :param filters: filters parameters -- dict
         :returns: device ids -- list
         """
-        vol_id_list = list()
+        return list(self.iter_volumes(filters))
+
+    def iter_volumes(self, filters=None):
+        """Iterate over the volumes on an array.
+
+        Device ids are yielded page by page as each iterator page is
+        received, so large volume lists can be processed with flat memory.
+
+        :param filters: filters parameters -- dict
+        :returns: device ids -- generator
+        """
         response = self.get_resource(
             category=SLOPROVISIONING,
             resource_level=SYMMETRIX, resource_level_id=self.array_id,
             resource_type=VOLUME, params=filters)
-        if (response and response.get('count') and (
-                int(response.get('count')) > 0)):
-            count = response['count']
-            max_page_size = response['maxPageSize']
-            if int(count) > int(max_page_size):
-                total_iterations = int(math.ceil(count / float(max_page_size)))
-                iterator_id = response['id']
-                for x in range(0, total_iterations):
-                    start = x * max_page_size + 1
-                    end = (x + 1) * max_page_size
-                    if end > count:
-                        end = count
-                    vol_page = self.common.get_iterator_page_list(
-                        iterator_id, start, end)
-                    for vol in vol_page:
-                        vol_id_list.append(vol['volumeId'])
-            else:
-                for vol in response['resultList']['result']:
-                    vol_id_list.append(vol['volumeId'])
-        return vol_id_list
+        if response and response.get('count') and (
+                int(response.get('count')) > 0):
+            for vol in self.common.iter_iterator_results(response):
+                yield vol['volumeId']
 
     @decorators.refactoring_notice(
         'ProvisioningFunctions',
@@ -2337,8 +2368,8 @@ class ProvisioningFunctions(object):
         data = list()
         data.append(['volumeId', 'effective_wwn', 'wwn', 'has_effective_wwn',
                      'storageGroupId'])
-        for device_id in vol_list:
-            vol_details = self.get_volume(device_id)
+        volumes = self.get_volumes(vol_list, return_exceptions=False)
+        for device_id, vol_details in zip(vol_list, volumes):
             data.append([device_id,
                          vol_details.get('effective_wwn'),
                          vol_details.get('wwn'),
@@ -2358,8 +2389,8 @@ class ProvisioningFunctions(object):
         :returns: volume details list (nested) -- list
         """
         data = list()
-        for device_id in vol_list:
-            vol_details = self.get_volume(device_id)
+        volumes = self.get_volumes(vol_list, return_exceptions=False)
+        for device_id, vol_details in zip(vol_list, volumes):
             data.append([device_id,
                          vol_details.get('effective_wwn'),
                          vol_details.get('wwn'),
@@ -2520,7 +2551,7 @@ class ProvisioningFunctions(object):
             payload=payload)
 
     def extend_volume(self, device_id, new_size, _async=False,
-                      rdf_group_num=None):
+                      rdf_group_num=None, return_future=False):
         """Extend a volume.
 
         :param device_id: device id -- str
@@ -2528,7 +2559,9 @@ class ProvisioningFunctions(object):
         :param _async: if call should be async -- bool
         :param rdf_group_num: RDF group number to extend R2 device in same
                               operation -- int
-        :returns: volume details -- dict
+        :param return_future: run asynchronously and return a future for the
+                              job -- bool
+        :returns: volume details or job outcome -- dict or JobFuture
         """
         LOG.info('Extending device {dev} to {num}GB.'.format(
             dev=device_id, num=new_size))
@@ -2541,9 +2574,13 @@ class ProvisioningFunctions(object):
             vol_attributes['expandVolumeParam']['rdfGroupNumber'] = (
                 rdf_group_num)
         payload = {'editVolumeActionParam': vol_attributes}
-        if _async:
+        if _async or return_future:
             payload.update(ASYNC_UPDATE)
-        return self._modify_volume(device_id, payload)
+        response = self._modify_volume(device_id, payload)
+        if return_future:
+            return self.common.get_job_future(
+                response, 'extending volume {dev}'.format(dev=device_id))
+        return response
 
     def rename_volume(self, device_id, new_name):
         """Rename a volume.
@@ -2606,8 +2643,8 @@ class ProvisioningFunctions(object):
                      'allocated_percent'])
         for sg in sg_list:
             vol_list = self.get_vols_from_storagegroup(sg)
-            for vol in vol_list:
-                volume = self.get_volume(vol)
+            volumes = self.get_volumes(vol_list, return_exceptions=False)
+            for vol, volume in zip(vol_list, volumes):
                 if volume['allocated_percent'] < low_utilization_percentage:
                     if volume.get('volume_identifier'):
                         vol_identifier = volume.get('volume_identifier')
@@ -13,10 +13,12 @@
 # limitations under the License.
 """real_time.py."""
 
+import functools
 import logging
 import time
 
 from PyU4V import common
+from PyU4V.utils import constants
 from PyU4V.utils import exception
 from PyU4V.utils import performance_constants as pc
 
@@ -28,7 +30,8 @@ class RealTimeFunctions(object):
 
     def __init__(self, array_id, rest_client):
         """__init__."""
-        self.common = common.CommonFunctions(rest_client)
+        self.common = common.CommonFunctions(
+            rest_client, priority=constants.PRIORITY_BACKGROUND)
         self.post_request = self.common.create_resource
         self.get_request = self.common.get_resource
         self.array_id = array_id
@@ -67,10 +70,11 @@ class RealTimeFunctions(object):
 
         :returns: categories -- list
         """
-        response = self.get_request(
-            no_version=True, category=pc.PERFORMANCE,
-            resource_level=pc.REAL_TIME, resource_type=pc.HELP,
-            resource=pc.CATEGORIES)
+        response = self.common.get_metadata(
+            constants.METADATA_REAL_TIME_CATEGORIES, functools.partial(
+                self.get_request, no_version=True, category=pc.PERFORMANCE,
+                resource_level=pc.REAL_TIME, resource_type=pc.HELP,
+                resource=pc.CATEGORIES))
         return response.get(pc.CATEGORY_NAME, list()) if response else list()
 
     def get_category_metrics(self, category):
@@ -79,10 +83,11 @@ class RealTimeFunctions(object):
         :param category: real-time performance category -- str
         :returns: metrics -- list
         """
-        response = self.get_request(
-            no_version=True, category=pc.PERFORMANCE,
-            resource_level=pc.REAL_TIME, resource_type=pc.HELP,
-            resource=category, object_type=pc.METRICS)
+        response = self.common.get_metadata(
+            constants.METADATA_REAL_TIME_METRICS, functools.partial(
+                self.get_request, no_version=True, category=pc.PERFORMANCE,
+                resource_level=pc.REAL_TIME, resource_type=pc.HELP,
+                resource=category, object_type=pc.METRICS), key=category)
         return response.get(pc.METRIC_NAME, list()) if response else list()
 
     def get_timestamps(self, array_id=None):
@@ -114,10 +119,12 @@ class RealTimeFunctions(object):
         """
         array_id = self.array_id if not array_id else array_id
         request_params = {pc.SYMM_ID: array_id, pc.CATEGORY: category}
-        response = self.post_request(
-            no_version=True, category=pc.PERFORMANCE,
-            resource_level=pc.REAL_TIME, resource_type=pc.KEYS,
-            payload=request_params)
+        response = self.common.get_metadata(
+            constants.METADATA_REAL_TIME_KEYS, functools.partial(
+                self.post_request, no_version=True, category=pc.PERFORMANCE,
+                resource_level=pc.REAL_TIME, resource_type=pc.KEYS,
+                payload=request_params, read_only=True),
+            array_id=array_id, key=category)
         return response.get(pc.KEYS, list()) if response else list()
 
     def _validate_real_time_input(
@@ -243,7 +250,7 @@ class RealTimeFunctions(object):
         response = self.post_request(
             no_version=True, category=pc.PERFORMANCE,
             resource_level=pc.REAL_TIME, resource_type=pc.METRICS,
-            payload=request_params)
+            payload=request_params, read_only=True)
 
         return_response = {
             pc.ARRAY_ID: array_id, pc.START_DATE_SN: start_date,
@@ -19,6 +19,7 @@ from PyU4V.common import CommonFunctions
 from PyU4V.provisioning import ProvisioningFunctions
 from PyU4V.utils import console
 from PyU4V.utils import constants
+from PyU4V.utils import deadline as dl
 from PyU4V.utils import decorators
 from PyU4V.utils import exception
 
@@ -133,6 +134,23 @@ class ReplicationFunctions(object):
             resource_level=SYMMETRIX, resource_level_id=self.array_id,
             resource_type=STORAGEGROUP, resource_type_id=storage_group_id)
 
+    def get_storage_group_replication_details_list(
+            self, storage_group_ids, max_workers=None):
+        """Get replication details of many storage groups concurrently.
+
+        :param storage_group_ids: storage group ids -- list
+        :param max_workers: maximum concurrent requests -- int
+        :returns: storage group replication details in storage group id
+                  order -- list
+        """
+        return self.common.get_resources(
+            [{'category': REPLICATION, 'resource_level': SYMMETRIX,
+              'resource_level_id': self.array_id,
+              'resource_type': STORAGEGROUP,
+              'resource_type_id': storage_group_id}
+             for storage_group_id in storage_group_ids],
+            max_workers=max_workers, return_exceptions=False)
+
     @decorators.refactoring_notice(
         'ReplicationFunctions', 'get_replication_enabled_storage_groups',
         9.1, 10.0)
@@ -361,7 +379,8 @@ class ReplicationFunctions(object):
             resource=SNAPSHOT, resource_id=snap_name,
             object_type=SNAP_ID, object_type_id=snap_id)
 
-    def find_expired_snapvx_snapshots(self):
+    @dl.with_deadline
+    def find_expired_snapvx_snapshots(self, deadline=None):
         """Find all expired snapvx snapshots.
 
         This is for arrays with microcode less than 5978.669.669.
@@ -372,13 +391,16 @@ class ReplicationFunctions(object):
         snapshots where the expiration date has passed however snapshots
         have not been deleted as they have links.
 
+        :param deadline: seconds the whole search may take, requests use
+                         only the remaining budget as their timeout -- float
         :returns: expired snapshot details -- list
         """
         expired_snap_list = list()
         sg_list = self.get_replication_enabled_storage_groups(
             has_snapshots=True)
-        for sg in sg_list:
-            snap_list = self.get_storage_group_replication_details(sg)
+        sg_details = self.get_storage_group_replication_details_list(
+            sg_list)
+        for sg, snap_list in zip(sg_list, sg_details):
             for snapshot_name in snap_list['snapVXSnapshots']:
                 snap_gen_list = (
                     self.get_storage_group_snapshot_generation_list(
@@ -409,7 +431,8 @@ class ReplicationFunctions(object):
                             expired_snap_list.append(expired_snap_details)
         return expired_snap_list
 
-    def find_expired_snapvx_snapshots_by_snap_ids(self):
+    @dl.with_deadline
+    def find_expired_snapvx_snapshots_by_snap_ids(self, deadline=None):
         """Find all expired snapvx snapshots using snap id.
 
         Snap ids are only available on microcode 5978.669.669
@@ -419,13 +442,16 @@ class ReplicationFunctions(object):
         snapshots where the expiration date has passed however snapshots
         have not been deleted as they have links.
 
+        :param deadline: seconds the whole search may take, requests use
+                         only the remaining budget as their timeout -- float
         :returns: expired snapshot details -- list
         """
         expired_snap_list = list()
         sg_list = self.get_replication_enabled_storage_groups(
             has_snapshots=True)
-        for sg in sg_list:
-            snap_list = self.get_storage_group_replication_details(sg)
+        sg_details = self.get_storage_group_replication_details_list(
+            sg_list)
+        for sg, snap_list in zip(sg_list, sg_details):
             for snapshot_name in snap_list['snapVXSnapshots']:
                 snap_id_list = (
                     self.get_storage_group_snapshot_snap_id_list(
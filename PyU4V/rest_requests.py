@@ -13,16 +13,26 @@
 # limitations under the License.
 """rest_requests.py."""
 
-import json
 import logging
 import platform
 import requests
 import requests.exceptions as r_exc
-import sys
+import threading
+import time
 import urllib3
+import weakref
 
 from PyU4V.utils import constants
+from PyU4V.utils import deadline as dl
+from PyU4V.utils import endpoint_pool as ep
 from PyU4V.utils import exception
+from PyU4V.utils import job_tracker as jt
+from PyU4V.utils import json_codec
+from PyU4V.utils import json_stream
+from PyU4V.utils import polling_policy as pp
+from PyU4V.utils import retry_policy as rp
+from PyU4V.utils import singleflight
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 __pyu4v_version__ = constants.PYU4V_VERSION
@@ -45,75 +55,390 @@ APP_TYPE = constants.APP_TYPE
 APP_JSON = constants.APP_JSON
 APP_OCT = constants.APP_OCT
 APP_MPART = constants.APP_MPART
+GZIP_DEFLATE = constants.GZIP_DEFLATE
+SHARED_SESSION = constants.SHARED_SESSION
+THREAD_SESSION = constants.THREAD_SESSION
+
+
+class _ThreadSession(object):
+    """The session of a thread, held in thread local storage."""
+
+    def __init__(self, session):
+        """__init__."""
+        self.session = session
+
+
+def _close_thread_session(sessions, key):
+    """Close and forget the session of a thread which has exited.
+
+    This can run from garbage collection while the session lock is held,
+    so it relies on dict.pop being atomic instead of taking the lock.
+
+    :param sessions: sessions keyed by holder id -- dict
+    :param key: holder id -- int
+    """
+    session = sessions.pop(key, None)
+    if session:
+        session.close()
 
 
 class RestRequests(object):
     """RestRequests."""
 
     def __init__(self, username, password, verify, base_url, interval, retries,
-                 application_type=None):
-        """__init__."""
+                 application_type=None, pool_connections=None,
+                 pool_maxsize=None, pool_block=False,
+                 session_mode=SHARED_SESSION, json_codec_name=None,
+                 retry_policy=None, circuit_breaker=False,
+                 breaker_failure_threshold=(
+                     constants.DEFAULT_BREAKER_FAILURE_THRESHOLD),
+                 breaker_recovery_timeout=(
+                     constants.DEFAULT_BREAKER_RECOVERY_TIMEOUT),
+                 endpoint_cooldown=constants.DEFAULT_ENDPOINT_COOLDOWN,
+                 coalesce_requests=True, rate_limit=None, rate_burst=None,
+                 max_concurrency=None, download_chunk_size=None,
+                 polling_policy=None, response_cache=None,
+                 metadata_cache=None):
+        """__init__.
+
+        base_url may be a list of Unisphere base urls which manage the same
+        arrays, in order of preference. Reads are load balanced across them
+        and all requests fail over if a server cannot be reached.
+
+        If rate_limit or max_concurrency is set requests to each server are
+        admitted by a rate limiter, waiting requests are admitted in order
+        of priority. Streamed responses count towards max_concurrency until
+        they are closed.
+
+        If response_cache is set GET responses of slow changing resources
+        are cached by CommonFunctions.get_resource. If metadata_cache is set
+        static metadata is cached on disk between process runs.
+        """
         self.username = username
         self.password = password
         self.verify_ssl = verify
-        self.base_url = base_url
+        self.base_urls = (
+            list(base_url) if isinstance(base_url, (list, tuple))
+            else [base_url])
+        self.base_url = self.base_urls[0] if self.base_urls else None
         self.headers = {CONTENT_TYPE: APP_JSON,
                         ACCEPT: APP_JSON,
+                        ACCEPT_ENC: GZIP_DEFLATE,
                         USER_AGENT: ua_details,
                         APP_TYPE: application_type}
         self.timeout = 120
+        self.download_chunk_size = (
+            download_chunk_size if download_chunk_size else
+            constants.DOWNLOAD_CHUNK_SIZE)
         self.interval = interval
         self.retries = retries
+        self.polling_policy = (
+            polling_policy if polling_policy else pp.PollingPolicy())
+        if session_mode not in constants.SESSION_MODES:
+            msg = ('Invalid session mode "{sm}" supplied, valid options are '
+                   '{opts}.'.format(sm=session_mode,
+                                    opts=constants.SESSION_MODES))
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.session_mode = session_mode
+        self.pool_connections = (
+            pool_connections if pool_connections else
+            constants.DEFAULT_POOL_CONNECTIONS)
+        self.pool_maxsize = (
+            pool_maxsize if pool_maxsize else constants.DEFAULT_POOL_MAXSIZE)
+        self.pool_block = pool_block
+        self.codec = json_codec.get_codec(json_codec_name)
+        self.retry_policy = (
+            retry_policy if retry_policy is not None else rp.RetryPolicy())
+        self.endpoint_pool = ep.EndpointPool(
+            self.base_urls, cooldown=endpoint_cooldown,
+            circuit_breaker=circuit_breaker,
+            breaker_failure_threshold=breaker_failure_threshold,
+            breaker_recovery_timeout=breaker_recovery_timeout,
+            rate_limit=rate_limit, rate_burst=rate_burst,
+            max_concurrency=max_concurrency)
+        self.singleflight = (
+            singleflight.SingleFlight() if coalesce_requests else None)
+        self.response_cache = response_cache
+        self.metadata_cache = metadata_cache
+        self.job_tracker = None
+        self._job_tracker_lock = threading.Lock()
+        self.adapter = self.establish_http_adapter()
+        self._session_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._thread_sessions = dict()
         self.session = self.establish_rest_session()
 
+    def establish_http_adapter(self):
+        """Establish the HTTP adapter holding the connection pool.
+
+        The adapter is shared by every session created by this client so that
+        keep-alive connections are reused across threads.
+
+        :returns: adapter -- HTTPAdapter
+        """
+        return HTTPAdapter(pool_connections=self.pool_connections,
+                           pool_maxsize=self.pool_maxsize,
+                           pool_block=self.pool_block)
+
     def establish_rest_session(self, headers=None):
         """Establish a REST session.
 
+        :param headers: optional session headers override -- dict
         :returns: session -- object
         """
         session = requests.session()
         session.headers = self.headers if not headers else headers
         session.auth = HTTPBasicAuth(self.username, self.password)
         session.verify = self.verify_ssl
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
         return session
 
+    def get_session(self):
+        """Get the session to be used by the calling thread.
+
+        In shared session mode all threads use the same session, in thread
+        session mode each thread is given its own session. In both modes the
+        underlying connection pool is shared.
+
+        :returns: session -- object
+        """
+        if self.session_mode == THREAD_SESSION:
+            holder = getattr(self._thread_local, 'holder', None)
+            if not holder:
+                holder = _ThreadSession(self.establish_rest_session())
+                self._thread_local.holder = holder
+                with self._session_lock:
+                    self._thread_sessions[id(holder)] = holder.session
+                # Thread local values are released when the thread exits,
+                # close and forget its session then so short lived worker
+                # threads do not accumulate sessions
+                weakref.finalize(
+                    holder, _close_thread_session, self._thread_sessions,
+                    id(holder))
+            return holder.session
+
+        with self._session_lock:
+            if not self.session:
+                self.session = self.establish_rest_session()
+            return self.session
+
+    def send_request(self, session, method, target_url, timeout,
+                     retry_safe=False, priority=None, read_only=False,
+                     **kwargs):
+        """Send a request, retrying it according to the retry policy.
+
+        Timeouts, connection errors and retryable status codes are retried
+        with exponential backoff and jitter if the method is idempotent or
+        the request is marked safe to retry or read only. Once the attempts
+        are used up the last response is returned or the last exception is
+        raised.
+
+        If a deadline is active each attempt uses at most the remaining
+        budget as its timeout and no retry is made which would not start
+        before the deadline.
+
+        GET requests and requests marked read only, such as queries sent as
+        POST, are sent to the healthy endpoint with the fewest outstanding
+        requests and fail over to another endpoint on any failure. Other
+        requests, including writes marked safe to retry, are sent to the
+        preferred healthy endpoint and only fail over when the server could
+        not be reached, so a write is never sent twice because of failover.
+
+        :param session: session -- requests.Session
+        :param method: method -- str
+        :param target_url: target url -- str
+        :param timeout: request timeout -- int
+        :param retry_safe: request is safe to retry -- bool
+        :param priority: rate limiter priority class -- str
+        :param read_only: request does not modify the array -- bool
+        :param kwargs: additional request arguments -- dict
+        :returns: response -- requests.Response
+        :raises: CircuitOpenException, DeadlineExceededException, Timeout,
+                 SSLError, ConnectionError, HTTPError
+        """
+        policy, pool = self.retry_policy, self.endpoint_pool
+        read_only = bool(read_only) or (
+            str(method).upper() in constants.IDEMPOTENT_METHODS)
+        retry = policy.is_retryable_method(
+            method, retry_safe or read_only) if policy else False
+        # Reads are retried on other endpoints, writes are only sent to
+        # another endpoint when failing over
+        attempt, tried, exclude = 1, list(), list()
+        operation = '{method} {target_url}'.format(
+            method=method, target_url=target_url)
+        while True:
+            attempt_timeout = dl.get_timeout(timeout, operation)
+            endpoint = pool.select(read_only, exclude=exclude)
+            tried.append(endpoint)
+            if read_only:
+                exclude.append(endpoint)
+            url = '{base_url}{target_url}'.format(
+                base_url=endpoint.base_url, target_url=target_url)
+            try:
+                response = self._send_to_endpoint(
+                    session, endpoint, method, url, attempt_timeout,
+                    priority, **kwargs)
+            except exception.DeadlineExceededException:
+                raise
+            except Exception as error:
+                if pool.can_fail_over(tried) and (
+                        read_only or ep.is_connect_failure(error)
+                        or isinstance(error, exception.CircuitOpenException)):
+                    if endpoint not in exclude:
+                        exclude.append(endpoint)
+                    LOG.warning(
+                        'The {method} request to URL {url} failed with '
+                        '{exc}, failing over to another Unisphere '
+                        'server.'.format(method=method, url=url,
+                                         exc=error.__class__.__name__))
+                    continue
+                if not (retry and attempt < policy.total_attempts
+                        and policy.is_retryable_exception(error)):
+                    raise
+                delay = policy.get_backoff(attempt)
+                reason = error.__class__.__name__
+            else:
+                if not (retry and attempt < policy.total_attempts
+                        and policy.is_retryable_status(
+                            response.status_code)):
+                    return response
+                delay = policy.get_backoff(
+                    attempt, response.headers.get('Retry-After'))
+                reason = 'status code {sc}'.format(sc=response.status_code)
+                response.close()
+            LOG.warning(
+                'The {method} request to URL {url} failed with {reason}, '
+                'attempt {att} of {total}. Retrying in {delay:.2f} '
+                'seconds.'.format(
+                    method=method, url=url, reason=reason, att=attempt,
+                    total=policy.total_attempts, delay=delay))
+            dl.check('a retry of {op}'.format(op=operation), delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_to_endpoint(self, session, endpoint, method, url, timeout,
+                          priority=None, **kwargs):
+        """Send a single request to an endpoint.
+
+        The request first waits for the endpoint rate limiter, if enabled.
+        The outcome is recorded against the endpoint health and, if
+        enabled, the endpoint circuit breaker.
+
+        :param session: session -- requests.Session
+        :param endpoint: selected endpoint -- Endpoint
+        :param method: method -- str
+        :param url: request url -- str
+        :param timeout: request timeout -- int
+        :param priority: rate limiter priority class -- str
+        :param kwargs: additional request arguments -- dict
+        :returns: response -- requests.Response
+        :raises: CircuitOpenException, Timeout, SSLError, ConnectionError,
+                 HTTPError
+        """
+        breaker, limiter = endpoint.circuit_breaker, endpoint.rate_limiter
+        admitted, response = False, None
+        try:
+            if limiter:
+                limiter.acquire(priority, timeout=dl.get_remaining())
+                admitted = True
+            if breaker:
+                breaker.before_request()
+            try:
+                response = session.request(
+                    method=method, url=url, timeout=timeout, **kwargs)
+            except Exception as error:
+                if breaker and breaker.is_failure_exception(error):
+                    breaker.record_failure()
+                elif breaker:
+                    breaker.release()
+                if ep.is_connect_failure(error):
+                    self.endpoint_pool.mark_down(endpoint)
+                raise
+        finally:
+            if admitted and kwargs.get('stream') and response is not None:
+                # The body is still to be read on this connection
+                self._release_on_close(response, limiter)
+            elif admitted:
+                limiter.release()
+            self.endpoint_pool.release(endpoint)
+        if breaker and breaker.is_failure_status(response.status_code):
+            breaker.record_failure()
+        elif breaker:
+            breaker.record_success()
+        if endpoint.down_until:
+            self.endpoint_pool.mark_up(endpoint)
+        return response
+
+    @staticmethod
+    def _release_on_close(response, limiter):
+        """Hold a rate limiter slot until a streamed response is closed.
+
+        :param response: streamed response -- requests.Response
+        :param limiter: rate limiter which admitted the request --
+                        RateLimiter
+        """
+        close, lock, released = response.close, threading.Lock(), list()
+
+        def _close():
+            """Close the response and release its slot once."""
+            try:
+                close()
+            finally:
+                with lock:
+                    release = not released
+                    released.append(True)
+                if release:
+                    limiter.release()
+
+        response.close = _close
+
     def rest_request(self, target_url, method,
-                     params=None, request_object=None, timeout=None):
+                     params=None, request_object=None, timeout=None,
+                     retry_safe=False, priority=None, read_only=False):
         """Send a request to the target api.
 
-        Valid methods are 'GET', 'POST', 'PUT', 'DELETE'.
+        Valid methods are 'GET', 'POST', 'PUT', 'DELETE'. GET requests are
+        retried according to the retry policy, other methods are only
+        retried if retry_safe or read_only is set.
 
         :param target_url: target url --str
         :param method: method -- str
         :param params: Additional URL parameters -- dict
         :param request_object: request payload -- dict
         :param timeout: optional timeout override -- int
+        :param retry_safe: request is safe to retry -- bool
+        :param priority: rate limiter priority class, one of interactive,
+                         normal or background -- str
+        :param read_only: request does not modify the array, e.g. a query
+                          sent as POST -- bool
         :returns: server response, status code -- dict, int
         """
         if timeout:
             timeout_val = timeout
         else:
             timeout_val = self.timeout
-        if not self.session:
-            self.session = self.establish_rest_session()
+        session = self.get_session()
         url = '{base_url}{target_url}'.format(
             base_url=self.base_url, target_url=target_url)
         try:
             if request_object:
-                response = self.session.request(
-                    method=method, url=url, timeout=timeout_val,
-                    data=json.dumps(request_object, sort_keys=True,
-                                    indent=4))
+                response = self.send_request(
+                    session, method, target_url, timeout_val, retry_safe,
+                    priority, read_only,
+                    data=self.codec.dumps(request_object))
             elif params:
-                response = self.session.request(method=method, url=url,
-                                                params=params,
-                                                timeout=timeout_val)
+                response = self.send_request(
+                    session, method, target_url, timeout_val, retry_safe,
+                    priority, read_only, params=params)
             else:
-                response = self.session.request(method=method, url=url,
-                                                timeout=timeout_val)
+                response = self.send_request(
+                    session, method, target_url, timeout_val, retry_safe,
+                    priority, read_only)
             status_code = response.status_code
             try:
-                response = response.json()
+                response = self.codec.decode_response(response)
             except ValueError:
                 response = None
                 if not status_code:
@@ -126,43 +451,79 @@ class RestRequests(object):
                                               sc=status_code))
             return response, status_code
 
-        except requests.Timeout as error:
-            LOG.error(
-                'The {method} request to URL {url} timed-out, but may have '
-                'been successful. Please check the array. Exception received: '
-                '{exc}.'.format(method=method, url=url, exc=error))
+        except Exception as error:
+            self._handle_request_error(method, url, error)
             return None, None
 
-        except r_exc.SSLError as error:
-            msg = (
-                'The connection to {base} has encountered an SSL error. '
-                'Please check your SSL config or supplied SSL cert in Cinder '
-                'configuration. SSL Exception message: {m}'.format(
-                    base=self.base_url, m=error))
-            raise r_exc.SSLError(msg) from error
+    def stream_request(self, target_url, method, params=None,
+                       request_object=None, timeout=None,
+                       result_path=json_stream.RESULT_LIST_PATH,
+                       chunk_size=None, retry_safe=False, priority=None,
+                       read_only=False):
+        """Send a request to the target api and stream the result list.
 
-        except (r_exc.ConnectionError, r_exc.HTTPError) as error:
-            exc_class, __, __ = sys.exc_info()
-            msg = (
-                'The {met} to Unisphere server {base} has experienced a {exc} '
-                'error. Please check your Unisphere server connection and '
-                'availability. Exception message: {msg}'.format(
-                    met=method, base=self.base_url,
-                    exc=error.__class__.__name__, msg=error))
-            raise exc_class(msg) from error
+        The response body is read in chunks, decompressed if the server used
+        gzip or deflate encoding, and the items of the list found at
+        result_path are decoded one at a time as the returned stream is
+        iterated. Every other value in the response is available in the
+        stream metadata once iteration is complete. Responses with an error
+        status code are decoded in full and returned as normal.
+
+        :param target_url: target url --str
+        :param method: method -- str
+        :param params: Additional URL parameters -- dict
+        :param request_object: request payload -- dict
+        :param timeout: optional timeout override -- int
+        :param result_path: keys leading to the result list -- tuple
+        :param chunk_size: response read size in bytes -- int
+        :param retry_safe: request is safe to retry -- bool
+        :param priority: rate limiter priority class -- str
+        :param read_only: request does not modify the array -- bool
+        :returns: result stream or server response, status code --
+                  JSONArrayStream or dict, int
+        :raises: VolumeBackendAPIException, SSLError, ConnectionError,
+                 HTTPError
+        """
+        timeout_val = self.timeout if not timeout else timeout
+        chunk_size = chunk_size if chunk_size else constants.STREAM_CHUNK_SIZE
+        session = self.get_session()
+        url = '{base_url}{target_url}'.format(
+            base_url=self.base_url, target_url=target_url)
+        data = self.codec.dumps(request_object) if request_object else None
+        try:
+            response = self.send_request(
+                session, method, target_url, timeout_val, retry_safe,
+                priority, read_only, params=params, data=data, stream=True)
+            status_code = response.status_code
+            LOG.debug('{method} request to {url} has returned with a status '
+                      'code of: {sc}.'.format(method=method, url=url,
+                                              sc=status_code))
 
         except Exception as error:
-            exp_message = (
-                'The {method} request to URL {url} failed with exception: '
-                '{e}.'.format(method=method, url=url, e=error))
-            raise exception.VolumeBackendAPIException(
-                data=exp_message) from error
+            self._handle_request_error(method, url, error)
+            return None, None
+
+        if status_code not in constants.SUCCESS_STATUS_CODES:
+            try:
+                message = self.codec.decode_response(response)
+            except ValueError:
+                message = None
+            finally:
+                response.close()
+            return message, status_code
+
+        return json_stream.JSONArrayStream(
+            response.iter_content(chunk_size=chunk_size), path=result_path,
+            close_callback=response.close), status_code
 
     def file_transfer_request(self, method, uri, timeout=None, download=False,
                               r_obj=None, upload=False, form_data=None):
         """Send a file transfer request via REST to the target API.
 
-        Valid methods are 'POST' and 'PUT'.
+        Valid methods are 'POST' and 'PUT'. File transfers use the same
+        session and pooled connections as other requests, the file transfer
+        headers are sent with the request. Downloads are streamed, the
+        response content should be read in chunks of download_chunk_size.
 
         :param method: request method -- str
         :param uri: target uri -- str
@@ -176,16 +537,14 @@ class RestRequests(object):
                  Timeout, SSLError, ConnectionError, HTTPError
         """
         if download and not upload:
-            headers = {
-                CONTENT_TYPE: APP_JSON,
-                ACCEPT: APP_OCT,
-                USER_AGENT: ua_details,
-                APP_TYPE: self.headers.get('application-type')}
+            headers = {ACCEPT: APP_OCT}
         elif upload and not download:
+            # Headers set to None are removed from the session headers,
+            # requests sets the multipart content type and boundary
             headers = {
-                ACCEPT_ENC: APP_MPART,
-                USER_AGENT: ua_details,
-                APP_TYPE: self.headers.get('application-type')}
+                CONTENT_TYPE: None,
+                ACCEPT: None,
+                ACCEPT_ENC: APP_MPART}
         else:
             msg = ('You must select one of upload/download for '
                    'file_transfer_request method.')
@@ -193,29 +552,49 @@ class RestRequests(object):
             raise exception.InvalidInputException(msg)
 
         timeout_val = self.timeout if not timeout else timeout
-        data = json.dumps(r_obj, sort_keys=True, indent=4) if r_obj else None
+        data = self.codec.dumps(r_obj) if r_obj else None
         url = '{base_url}{uri}'.format(base_url=self.base_url, uri=uri)
 
         try:
-            ft_session = self.establish_rest_session(headers=headers)
-            response = ft_session.request(
-                method=method, url=url, timeout=timeout_val,
+            session = self.get_session()
+            response = self.send_request(
+                session, method, uri, timeout_val, headers=headers,
                 stream=download, data=data, files=form_data)
-            ft_session.close()
             status_code = response.status_code
             LOG.debug('{method} request to {url} has returned with a status '
                       'code of: {sc}.'.format(method=method, url=url,
                                               sc=status_code))
             return response, status_code
 
-        except requests.Timeout as error:
+        except Exception as error:
+            self._handle_request_error(method, url, error)
+            return None, None
+
+    def _handle_request_error(self, method, url, error):
+        """Handle the exception raised sending a request.
+
+        Timeouts are logged as the request may still have succeeded, unless
+        the deadline has expired. Every other exception is raised again
+        with a message describing the failed request.
+
+        :param method: method -- str
+        :param url: request url -- str
+        :param error: exception raised -- Exception
+        :raises: DeadlineExceededException, CircuitOpenException, SSLError,
+                 ConnectionError, HTTPError, VolumeBackendAPIException
+        """
+        if isinstance(error, requests.Timeout):
+            if dl.is_expired():
+                raise exception.DeadlineExceededException(
+                    data='{method} request to URL {url} timed-out'.format(
+                        method=method, url=url)) from error
             LOG.error(
                 'The {method} request to URL {url} timed-out, but may have '
                 'been successful. Please check the array. Exception received: '
                 '{exc}.'.format(method=method, url=url, exc=error))
-            return None, None
+            return
 
-        except r_exc.SSLError as error:
+        if isinstance(error, r_exc.SSLError):
             msg = (
                 'The connection to {base} has encountered an SSL error. '
                 'Please check your SSL config or supplied SSL cert in Cinder '
@@ -223,22 +602,47 @@ class RestRequests(object):
                     base=self.base_url, m=error))
             raise r_exc.SSLError(msg) from error
 
-        except (r_exc.ConnectionError, r_exc.HTTPError) as error:
-            exc_class, __, __ = sys.exc_info()
+        if isinstance(error, (r_exc.ConnectionError, r_exc.HTTPError)):
             msg = (
                 'The {met} to Unisphere server {base} has experienced a {exc} '
                 'error. Please check your Unisphere server connection and '
                 'availability. Exception message: {msg}'.format(
                     met=method, base=self.base_url,
                     exc=error.__class__.__name__, msg=error))
-            raise exc_class(msg) from error
+            raise error.__class__(msg) from error
 
-        except Exception as error:
-            exp_message = (
-                'The {method} request to URL {url} failed with exception: '
-                '{e}.'.format(method=method, url=url, e=error))
-            raise exception.VolumeBackendAPIException(data=exp_message)
+        if isinstance(error, (exception.CircuitOpenException,
+                              exception.DeadlineExceededException)):
+            raise error
+
+        exp_message = (
+            'The {method} request to URL {url} failed with exception: '
+            '{e}.'.format(method=method, url=url, e=error))
+        raise exception.VolumeBackendAPIException(
+            data=exp_message) from error
+
+    def get_job_tracker(self, common):
+        """Get the job tracker shared by every user of this client.
+
+        The tracker is created on first use, every function class using
+        this client then polls its jobs from the same background thread.
+
+        :param common: common functions the tracker queries jobs with if it
+                       is created -- CommonFunctions
+        :returns: job tracker -- JobTracker
+        """
+        with self._job_tracker_lock:
+            if self.job_tracker is None:
+                self.job_tracker = jt.JobTracker(common)
+            return self.job_tracker
 
     def close_session(self):
-        """Close the current session."""
-        self.session.close()
+        """Close the current session and any per-thread sessions."""
+        with self._session_lock:
+            sessions = list(self._thread_sessions.values())
+            self._thread_sessions.clear()
+            self._thread_local = threading.local()
+            for session in sessions:
+                session.close()
+            if self.session:
+                self.session.close()
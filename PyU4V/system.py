@@ -13,6 +13,7 @@
 # limitations under the License.
 """system.py."""
 
+import functools
 import logging
 import re
 import time
@@ -361,7 +362,8 @@ class SystemFunctions(object):
             else:
                 file_path = file_handler.write_binary_data_to_file(
                     data=response, file_extension=ZIP_SUFFIX,
-                    file_name=file_name, dir_path=dir_path)
+                    file_name=file_name, dir_path=dir_path,
+                    chunk_size=self.common.rest_client.download_chunk_size)
                 return_dict['settings_path'] = file_path
 
             return_dict['success'] = True
@@ -775,7 +777,8 @@ class SystemFunctions(object):
                                            resource_type=AUDIT_LOG_RECORD)
 
         if response.get(COUNT, 0) > 0:
-            return self.common.get_iterator_results(response)
+            return self.common.get_iterator_results(
+                response, max_workers=constants.DEFAULT_ITERATOR_WORKERS)
         else:
             return list()
 
@@ -834,7 +837,8 @@ class SystemFunctions(object):
         else:
             file_path = file_handler.write_binary_data_to_file(
                 data=response, file_extension=PDF_SUFFIX, file_name=file_name,
-                dir_path=dir_path)
+                dir_path=dir_path,
+                chunk_size=self.common.rest_client.download_chunk_size)
             return_dict[AUDIT_RECORD_PATH] = file_path
 
         return_dict[SUCCESS] = True
@@ -851,10 +855,11 @@ class SystemFunctions(object):
         :returns: iSCSI directors -- list
         """
         array_id = array_id if array_id else self.array_id
-        dir_list = self.common.get_resource(
-            category=SYSTEM,
-            resource_level=SYMMETRIX, resource_level_id=array_id,
-            resource_type=DIRECTOR)
+        dir_list = self.common.get_metadata(
+            constants.METADATA_DIRECTOR_LIST, functools.partial(
+                self.common.get_resource, category=SYSTEM,
+                resource_level=SYMMETRIX, resource_level_id=array_id,
+                resource_type=DIRECTOR), array_id=array_id)
         response_dir_list = list()
         for director in dir_list.get(DIRECTOR_ID, list()):
             if iscsi_only and re.match(r'^SE-\d[A-Z]$', director):
@@ -881,11 +886,13 @@ class SystemFunctions(object):
         if isinstance(iscsi_target, bool):
             filters['iscsi_target'] = iscsi_target
 
-        port_list = self.common.get_resource(
-            category=SYSTEM,
-            resource_level=SYMMETRIX, resource_level_id=array_id,
-            resource_type=DIRECTOR, resource_type_id=director_id,
-            resource=PORT, params=filters)
+        port_list = self.common.get_metadata(
+            constants.METADATA_PORT_LIST, functools.partial(
+                self.common.get_resource, category=SYSTEM,
+                resource_level=SYMMETRIX, resource_level_id=array_id,
+                resource_type=DIRECTOR, resource_type_id=director_id,
+                resource=PORT, params=filters), array_id=array_id,
+            key=[director_id, filters])
         return port_list.get(
             'symmetrixPortKey', list()) if port_list else list()
 
@@ -36,8 +36,15 @@ class FakeResponse(object):
         self.return_object = return_object
         self.raw = mock.MagicMock()
         self.raw.reason = raw_reason
+        self.headers = dict()
         self.text = json.dumps(text, sort_keys=True, indent=4)
-        self.content = content
+        self.binary_content = content
+        if content is not None:
+            self.content = content
+        elif return_object:
+            self.content = json.dumps(return_object, default=str).encode()
+        else:
+            self.content = b''
 
     def json(self):
         """json."""
@@ -47,11 +54,15 @@ class FakeResponse(object):
             raise ValueError
 
     def iter_content(self, chunk_size):
-        if self.content:
-            return [self.content]
+        if self.binary_content:
+            return [self.binary_content]
         else:
             return [self.return_object]
 
+    def close(self):
+        """close."""
+        pass
+
 
 class FakeRequestsSession(object):
     """Fake request session."""
@@ -62,7 +73,7 @@ class FakeRequestsSession(object):
         self.p_data = PerformanceData()
 
     def request(self, method, url, params=None, data=None, timeout=None,
-                stream=None, files=None):
+                stream=None, files=None, headers=None):
         """request."""
         return_object = ''
         status_code = 200
@@ -104,6 +115,10 @@ class FakeRequestsSession(object):
         elif method == 'EXCEPTION':
             raise Exception
 
+        if stream and method == 'GET':
+            return FakeResponse(
+                status_code, return_object, raw_reason, text,
+                content=json.dumps(return_object).encode())
         return FakeResponse(status_code, return_object, raw_reason, text)
 
     def _get_request(self, url, params):
@@ -600,6 +615,8 @@ class FakeRequestsSession(object):
             status_code = 500
             return_object = self.data.job_list[2]
         elif payload:
+            if isinstance(payload, bytes):
+                payload = payload.decode()
             payload = ast.literal_eval(payload)
             if self.data.failed_resource in payload.values():
                 status_code = 500
@@ -693,3 +710,54 @@ class FakeConfigFile(object):
         finally:
             os.umask(0o77)
             os.rmdir(dir_path)
+
+
+class FakeArray(list):
+    """Fake one dimensional NumPy array."""
+
+    def __init__(self, values, dtype):
+        """__init__."""
+        super(FakeArray, self).__init__(values)
+        self.dtype = dtype
+
+    def __setitem__(self, key, value):
+        """Set items, a slice may be set to a single value."""
+        if isinstance(key, slice) and not isinstance(value, list):
+            for index in range(*key.indices(len(self))):
+                super(FakeArray, self).__setitem__(index, value)
+        else:
+            super(FakeArray, self).__setitem__(key, value)
+
+    def resize(self, size, refcheck=True):
+        """Resize in place, new items are zero."""
+        if size < len(self):
+            del self[size:]
+        else:
+            self.extend([0] * (size - len(self)))
+
+    def tolist(self):
+        """Get the items as a list."""
+        return list(self)
+
+
+class FakeNumpy(object):
+    """Fake NumPy module with the functions used by utils.columnar."""
+
+    nan = float('nan')
+    int64 = 'int64'
+    float64 = 'float64'
+
+    @staticmethod
+    def empty(size, dtype):
+        """Get an array of zeros."""
+        return FakeArray([0] * size, dtype)
+
+    @staticmethod
+    def full(size, value, dtype):
+        """Get an array filled with a value."""
+        return FakeArray([value] * size, dtype)
+
+    @staticmethod
+    def isnan(array):
+        """Get which items are NaN."""
+        return [value != value for value in array]
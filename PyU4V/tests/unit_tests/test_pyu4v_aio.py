@@ -0,0 +1,324 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""test_pyu4v_aio.py."""
+
+import asyncio
+import testtools
+
+from unittest import mock
+
+from PyU4V.aio import common as aio_common
+from PyU4V.aio import rest_requests as aio_rest
+from PyU4V.aio import univmax_conn as aio_conn
+from PyU4V import common
+from PyU4V import rest_requests
+from PyU4V.tests.unit_tests import pyu4v_common_data as pcd
+from PyU4V.tests.unit_tests import pyu4v_fakes as pf
+from PyU4V.tests.unit_tests import pyu4v_performance_data as ppd
+from PyU4V import univmax_conn
+from PyU4V.utils import exception
+from PyU4V.utils import performance_constants as pc
+
+
+def run(coroutine):
+    """Run a coroutine to completion in a new event loop."""
+    return asyncio.run(coroutine)
+
+
+class PyU4VAsyncConnTest(testtools.TestCase):
+    """Test asynchronous connection and function classes."""
+
+    def setUp(self):
+        """setUp."""
+        super(PyU4VAsyncConnTest, self).setUp()
+        self.data = pcd.CommonData()
+        self.p_data = ppd.PerformanceData()
+        self.conf_file, self.conf_dir = (
+            pf.FakeConfigFile.create_fake_config_file())
+        univmax_conn.file_path = self.conf_file
+        # Route async requests through the fake synchronous session so the
+        # async classes are tested against the same fake Unisphere responses
+        sync_rest = rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='https://10.0.0.75:8443/univmax/restapi',
+            interval=1, retries=3)
+        sync_rest.session = pf.FakeRequestsSession()
+        self.requests = list()
+
+        async def _fake_request(rest_self, target_url, method, **kwargs):
+            self.requests.append((target_url, method, kwargs))
+            await asyncio.sleep(0)
+            return sync_rest.rest_request(target_url, method, **kwargs)
+
+        with mock.patch.object(aio_rest.AsyncRestRequests, 'rest_request',
+                               new=_fake_request):
+            self.conn = aio_conn.AsyncU4VConn()
+        self.common = self.conn.common
+        self.common.interval = 0
+        self.common.retries = 1
+
+    def tearDown(self):
+        """tearDown."""
+        super(PyU4VAsyncConnTest, self).tearDown()
+        pf.FakeConfigFile.delete_fake_config_file(
+            self.conf_file, self.conf_dir)
+
+    def test_init(self):
+        """Test AsyncU4VConn __init__ loads settings from PyU4V.conf."""
+        self.assertEqual(self.data.array, self.conn.array_id)
+        self.assertEqual(self.data.remote_array, self.conn.remote_array)
+        self.assertEqual('https://10.0.0.75:8443/univmax/restapi',
+                         self.conn.rest_client.base_url)
+        self.assertFalse(self.conn.rest_client.verify_ssl)
+        self.assertIs(self.conn.performance.real_time, self.conn.real_time)
+
+    def test_set_array_id(self):
+        """Test set_array_id."""
+        self.conn.set_array_id('000123456789')
+        self.assertEqual('000123456789', self.conn.provisioning.array_id)
+        self.assertEqual('000123456789', self.conn.performance.array_id)
+        self.assertEqual('000123456789', self.conn.real_time.array_id)
+        self.assertEqual('000123456789', self.conn.replication.array_id)
+
+    def test_context_manager(self):
+        """Test async context manager validates and closes the session."""
+        async def _run():
+            with mock.patch.object(
+                    self.conn.rest_client, 'close_session',
+                    new=mock.AsyncMock()) as mck_close:
+                async with self.conn as conn:
+                    self.assertIs(self.conn, conn)
+                mck_close.assert_awaited_once()
+
+        run(_run())
+        self.assertEqual(('/version', 'GET'), self.requests[0][:2])
+
+    def test_validate_unisphere_failed_check(self):
+        """Test Unisphere version validation fail scenario."""
+        with mock.patch.object(self.common, 'get_uni_version',
+                               new=mock.AsyncMock(
+                                   return_value=('v9.0.0', '90'))):
+            self.assertRaises(SystemExit, run,
+                              self.conn.validate_unisphere())
+
+    def test_get_resource(self):
+        """Test get_resource."""
+        response = run(self.common.get_array(self.data.array))
+        self.assertEqual(self.data.symmetrix[0], response)
+
+    def test_get_resource_not_found(self):
+        """Test get_resource failed status code."""
+        self.assertRaises(
+            exception.VolumeBackendAPIException, run,
+            self.common.get_resource(
+                category='sloprovisioning',
+                resource_level=self.data.failed_resource))
+
+    def test_create_modify_delete_resource(self):
+        """Test create, modify and delete resource."""
+        run(self.common.create_resource(
+            category='sloprovisioning', resource_level='storagegroup',
+            payload={'storageGroupId': 'new'}))
+        run(self.common.modify_resource(
+            category='sloprovisioning', resource_level='storagegroup',
+            payload={'storageGroupId': 'new'}))
+        run(self.common.delete_resource(
+            category='sloprovisioning', resource_level='storagegroup',
+            resource_level_id='new'))
+        self.assertEqual(['POST', 'PUT', 'DELETE'],
+                         [x[1] for x in self.requests])
+
+    def test_get_iterator_results(self):
+        """Test get_iterator_results requests remaining pages in order."""
+        rest_response = dict(self.data.vol_with_pages)
+        rest_response['count'], rest_response['maxPageSize'] = 3, 1
+        results = run(self.common.get_iterator_results(rest_response))
+        self.assertEqual(3, len(results))
+        self.assertEqual(
+            [{'from': 2, 'to': 2}, {'from': 3, 'to': 3}],
+            [x[2]['params'] for x in self.requests])
+
+    def test_iter_iterator_results(self):
+        """Test iter_iterator_results yields results page by page."""
+        rest_response = dict(self.data.vol_with_pages)
+        rest_response['count'], rest_response['maxPageSize'] = 3, 1
+
+        async def _collect():
+            return [result async for result in
+                    self.common.iter_iterator_results(rest_response)]
+
+        self.assertEqual(3, len(run(_collect())))
+        self.assertEqual(2, len(self.requests))
+
+    def test_wait_for_job_complete(self):
+        """Test wait_for_job_complete waits without blocking."""
+        with mock.patch.object(
+                aio_common.AsyncCommonFunctions, '_is_job_finished',
+                new=mock.AsyncMock(side_effect=[
+                    (False, None, 0, 'RUNNING', None),
+                    (True, 'done', 0, 'SUCCEEDED', ['task'])])):
+            self.common.retries = 5
+            rc, result, status, task = run(
+                self.common.wait_for_job_complete(self.data.job_list[1]))
+        self.assertEqual((0, 'done', 'SUCCEEDED', ['task']),
+                         (rc, result, status, task))
+
+    def test_wait_for_job_complete_retries_exceeded(self):
+        """Test wait_for_job_complete retries exceeded."""
+        with mock.patch.object(
+                aio_common.AsyncCommonFunctions, '_is_job_finished',
+                new=mock.AsyncMock(
+                    return_value=(False, None, 0, 'RUNNING', None))):
+            rc, __, status, __ = run(
+                self.common.wait_for_job_complete(self.data.job_list[1]))
+        self.assertEqual(-1, rc)
+        self.assertEqual('RUNNING', status)
+
+    def test_wait_for_job_failed(self):
+        """Test wait_for_job failed job."""
+        self.assertRaises(
+            exception.VolumeBackendAPIException, run,
+            self.common.wait_for_job('test', 202, self.data.job_list[2]))
+
+    def test_sync_only_functions_not_inherited(self):
+        """Test functions without an async version are not available."""
+        self.assertIsInstance(self.common, common.BaseCommonFunctions)
+        self.assertNotIsInstance(self.common, common.CommonFunctions)
+        for name in ('get_resources', 'get_metadata', 'get_request_stream',
+                     'get_resource_stream', 'get_job_future',
+                     'download_file', 'upload_file'):
+            self.assertFalse(hasattr(self.common, name))
+        self.assertFalse(hasattr(self.common, 'job_tracker'))
+
+    def test_provisioning_get_storage_group_list(self):
+        """Test provisioning get_storage_group_list."""
+        sg_list = run(self.conn.provisioning.get_storage_group_list())
+        self.assertEqual(self.data.sg_list['storageGroupId'], sg_list)
+
+    def test_provisioning_get_volume_list(self):
+        """Test provisioning get_volume_list with an iterator."""
+        with mock.patch.object(
+                self.conn.provisioning, 'get_resource',
+                new=mock.AsyncMock(return_value=self.data.vol_with_pages)):
+            with mock.patch.object(
+                    self.conn.provisioning.common, 'get_iterator_results',
+                    new=mock.AsyncMock(return_value=[
+                        {'volumeId': '00001'}, {'volumeId': '00002'}])):
+                vol_list = run(self.conn.provisioning.get_volume_list())
+        self.assertEqual(['00001', '00002'], vol_list)
+
+    def test_replication_get_rdf_group_list(self):
+        """Test replication get_rdf_group_list."""
+        rdfg_list = run(self.conn.replication.get_rdf_group_list())
+        self.assertEqual(self.data.rdf_group_list['rdfGroupID'], rdfg_list)
+
+    def test_performance_get_performance_stats(self):
+        """Test performance get_performance_stats."""
+        response = run(self.conn.performance.get_performance_stats(
+            category=pc.ARRAY, metrics=pc.KPI,
+            start_time=self.p_data.first_date,
+            end_time=self.p_data.last_date))
+        self.assertEqual(self.data.array, response['array_id'])
+        self.assertEqual(str(self.p_data.last_date), response['end_date'])
+        self.assertEqual(pc.ARRAY.lower(), response['reporting_level'])
+        self.assertIn('result', response)
+
+    def test_performance_format_time_input_end_only(self):
+        """Test performance format_time_input end time only."""
+        start, end = run(self.conn.performance.format_time_input(
+            category=pc.ARRAY, end_time=self.p_data.last_date))
+        self.assertEqual(str(self.p_data.first_date), start)
+        self.assertEqual(str(self.p_data.last_date), end)
+
+    def test_real_time_get_categories(self):
+        """Test real-time get_categories."""
+        with mock.patch.object(
+                self.conn.real_time, 'get_request',
+                new=mock.AsyncMock(return_value={
+                    pc.CATEGORY_NAME: [pc.ARRAY]})):
+            self.assertEqual([pc.ARRAY],
+                             run(self.conn.real_time.get_categories()))
+
+
+class PyU4VAsyncRestRequestsTest(testtools.TestCase):
+    """Test asynchronous REST requests."""
+
+    def setUp(self):
+        """setUp."""
+        super(PyU4VAsyncRestRequestsTest, self).setUp()
+        self.rest = aio_rest.AsyncRestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3)
+
+    def test_format_params(self):
+        """Test _format_params converts values aiohttp cannot encode."""
+        self.assertIsNone(self.rest._format_params(None))
+        self.assertEqual(
+            {'from': 1, 'to': 'x', 'flag': 'True'},
+            self.rest._format_params({'from': 1, 'to': 'x', 'flag': True}))
+
+    def test_get_ssl_setting(self):
+        """Test _get_ssl_setting."""
+        self.assertFalse(self.rest._get_ssl_setting())
+        self.rest.verify_ssl = True
+        self.assertIsNone(self.rest._get_ssl_setting())
+
+    def test_establish_rest_session_missing_dependency(self):
+        """Test establish_rest_session without aiohttp installed."""
+        with mock.patch.object(aio_rest, 'aiohttp', None):
+            self.assertRaises(exception.MissingDependencyException,
+                              self.rest.establish_rest_session)
+
+    @testtools.skipIf(aio_rest.aiohttp is None, 'aiohttp is not installed')
+    def test_rest_request(self):
+        """Test rest_request success."""
+        fake_response = mock.MagicMock(status=200)
+        fake_response.json = mock.AsyncMock(return_value={'version': 'V9'})
+        fake_session = mock.MagicMock(closed=False)
+        fake_session.request.return_value.__aenter__ = mock.AsyncMock(
+            return_value=fake_response)
+        fake_session.request.return_value.__aexit__ = mock.AsyncMock(
+            return_value=False)
+        self.rest.session = fake_session
+        response, sc = run(self.rest.rest_request('/version', 'GET'))
+        self.assertEqual(({'version': 'V9'}, 200), (response, sc))
+        __, kwargs = fake_session.request.call_args
+        self.assertEqual('http://10.10.10.10:8443/univmax/restapi/version',
+                         kwargs['url'])
+        self.assertIsNone(kwargs['data'])
+
+    @testtools.skipIf(aio_rest.aiohttp is None, 'aiohttp is not installed')
+    def test_rest_request_timeout(self):
+        """Test rest_request timeout."""
+        fake_session = mock.MagicMock(closed=False)
+        fake_session.request.return_value.__aenter__ = mock.AsyncMock(
+            side_effect=asyncio.TimeoutError)
+        fake_session.request.return_value.__aexit__ = mock.AsyncMock(
+            return_value=False)
+        self.rest.session = fake_session
+        self.assertEqual((None, None),
+                         run(self.rest.rest_request('/version', 'GET')))
+
+    @testtools.skipIf(aio_rest.aiohttp is None, 'aiohttp is not installed')
+    def test_rest_request_connection_error(self):
+        """Test rest_request connection error."""
+        fake_session = mock.MagicMock(closed=False)
+        fake_session.request.return_value.__aenter__ = mock.AsyncMock(
+            side_effect=aio_rest.aiohttp.ClientConnectionError('down'))
+        fake_session.request.return_value.__aexit__ = mock.AsyncMock(
+            return_value=False)
+        self.rest.session = fake_session
+        self.assertRaises(exception.VolumeBackendAPIException, run,
+                          self.rest.rest_request('/version', 'GET'))
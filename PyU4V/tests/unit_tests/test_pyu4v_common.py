@@ -14,6 +14,9 @@
 """test_pyu4v_common.py."""
 
 import csv
+import os
+import shutil
+import tempfile
 import testtools
 import time
 
@@ -25,7 +28,11 @@ from PyU4V.tests.unit_tests import pyu4v_common_data as pcd
 from PyU4V.tests.unit_tests import pyu4v_fakes as pf
 from PyU4V import univmax_conn
 from PyU4V.utils import constants
+from PyU4V.utils import deadline
 from PyU4V.utils import exception
+from PyU4V.utils import metadata_cache
+from PyU4V.utils import polling_policy
+from PyU4V.utils import response_cache
 
 # Resource constants
 SLOPROVISIONING = constants.SLOPROVISIONING
@@ -92,6 +99,64 @@ class PyU4VCommonTest(testtools.TestCase):
         self.assertEqual(-1, rc)
         self.assertIsNone(result)
 
+    @mock.patch.object(common.time, 'sleep')
+    @mock.patch.object(common.CommonFunctions, '_is_job_finished',
+                       side_effect=[(False, '', 0, 'RUNNING', '')] * 5 + [
+                           (True, '', 0, 'SUCCEEDED', '')])
+    def test_wait_for_job_complete_adaptive_interval(self, mock_job,
+                                                     mck_sleep):
+        """Test wait_for_job_complete polls at a growing interval."""
+        self.common.interval, self.common.retries = 5, 10
+        _, _, status, _ = self.common.wait_for_job_complete(
+            self.data.job_list[1])
+        self.assertEqual('SUCCEEDED', status)
+        self.assertEqual([mock.call(x) for x in [0.5, 1, 2, 4, 5, 5]],
+                         mck_sleep.call_args_list)
+
+    def test_wait_for_job_complete_deadline(self):
+        """Test wait_for_job_complete stops polling at the deadline."""
+        self.common.polling_policy = polling_policy.PollingPolicy(
+            initial_interval=5)
+        with mock.patch.object(self.common, '_is_job_finished') as mck_job:
+            with deadline.Deadline(1):
+                self.assertRaises(exception.DeadlineExceededException,
+                                  self.common.wait_for_job_complete,
+                                  self.data.job_list[1])
+        mck_job.assert_not_called()
+
+    def test_track_job(self):
+        """Test track_job waits for the job in the background."""
+        self.common.polling_policy = polling_policy.PollingPolicy(
+            initial_interval=0.001)
+        callback = mock.Mock()
+        future = self.common.track_job(self.data.job_list[1], callback)
+        self.assertEqual((-1, None, 'RUNNING', None),
+                         future.result(timeout=5))
+        callback.assert_called_once_with(future)
+
+    def test_job_tracker_shared(self):
+        """Test every function class uses the connection's job tracker."""
+        tracker = self.conn.job_tracker
+        self.assertIs(tracker, self.common.job_tracker)
+        self.assertIs(tracker, self.conn.provisioning.common.job_tracker)
+        self.assertIs(tracker, self.conn.performance.common.job_tracker)
+        self.assertIs(tracker, common.CommonFunctions(
+            self.conn.rest_client).job_tracker)
+
+    def test_get_job_future(self):
+        """Test get_job_future."""
+        response = {'storageGroupId': self.data.storagegroup_name}
+        future = self.common.get_job_future(response)
+        self.assertEqual(response, future.result(timeout=0))
+        future = self.common.get_job_future(
+            self.data.job_list[0], 'creating storage group')
+        self.assertEqual('12345', future.job_id)
+        self.assertEqual('SUCCEEDED', future.result(timeout=5)['status'])
+        with mock.patch.object(self.common, 'track_job') as mck_track:
+            future = self.common.get_job_future(self.data.job_list[2])
+            mck_track.assert_called_once_with(
+                self.data.job_list[2], future.set_job_outcome)
+
     def test_get_job_by_id(self):
         """Test get_job_by_id."""
         job = self.common.get_job_by_id(self.data.job_list[0]['jobId'])
@@ -330,6 +395,42 @@ class PyU4VCommonTest(testtools.TestCase):
         message = self.common.get_request('/version', resource_type='version')
         self.assertEqual(self.data.server_version, message)
 
+    def test_get_request_coalesced(self):
+        """Test get_request shares in-flight identical requests."""
+        flight = self.common.rest_client.singleflight
+        with mock.patch.object(
+                flight, 'do', wraps=flight.do) as mck_do:
+            self.common.get_request('/version', 'version',
+                                    params={'a': 1})
+            mck_do.assert_called_once_with(
+                flight.make_key('/version', {'a': 1}), self.common.request,
+                '/version', 'GET', params={'a': 1})
+
+    def test_get_request_not_coalesced(self):
+        """Test get_request with request coalescing disabled."""
+        self.common.rest_client.singleflight = None
+        with mock.patch.object(
+                self.common, 'request',
+                return_value=(self.data.server_version, 200)) as mck_req:
+            message = self.common.get_request('/version', 'version')
+            mck_req.assert_called_once_with('/version', 'GET', params=None)
+        self.assertEqual(self.data.server_version, message)
+
+    def test_common_functions_priority(self):
+        """Test CommonFunctions sends requests with its priority."""
+        with mock.patch.object(
+                self.conn.rest_client, 'rest_request',
+                return_value=(self.data.server_version, 200)) as mck_req:
+            common_funcs = common.CommonFunctions(
+                self.conn.rest_client,
+                priority=constants.PRIORITY_BACKGROUND)
+            common_funcs.request('/version', 'GET')
+            common_funcs.get_request('/version', 'version')
+        self.assertEqual(2, mck_req.call_count)
+        for call in mck_req.call_args_list:
+            self.assertEqual(constants.PRIORITY_BACKGROUND,
+                             call[1]['priority'])
+
     def test_get_resource(self):
         """Test get_resource."""
         # Traditional Method
@@ -346,6 +447,96 @@ class PyU4VCommonTest(testtools.TestCase):
             resource_type='volume')
         self.assertEqual(self.data.volume_list[2], message_1)
 
+    def test_get_resources(self):
+        """Test get_resources returns results and errors in order."""
+        error = exception.ResourceNotFoundException('not found')
+        results = {'1': {'volumeId': '1'}, '2': error, '3': {'volumeId': '3'}}
+
+        def _get_resource(**kwargs):
+            result = results[kwargs['resource_type_id']]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        specs = [{'category': constants.SLOPROVISIONING,
+                  'resource_type_id': device_id} for device_id in results]
+        with mock.patch.object(self.common, 'get_resource',
+                               side_effect=_get_resource) as mck_get:
+            for max_workers in [1, 3]:
+                self.assertEqual(
+                    list(results.values()),
+                    self.common.get_resources(specs, max_workers))
+            self.assertRaises(exception.ResourceNotFoundException,
+                              self.common.get_resources, specs,
+                              return_exceptions=False)
+            mck_get.assert_any_call(**specs[0])
+        self.assertEqual(list(), self.common.get_resources(list()))
+
+    def test_get_resource_response_cache(self):
+        """Test get_resource caches responses until a write."""
+        self.common.rest_client.response_cache = (
+            response_cache.ResponseCache())
+        srp_kwargs = {'category': constants.SLOPROVISIONING,
+                      'resource_level': constants.SYMMETRIX,
+                      'resource_level_id': self.data.array,
+                      'resource_type': constants.SRP,
+                      'resource_type_id': self.data.srp}
+        with mock.patch.object(self.common, 'request',
+                               return_value=({'srpId': 'SRP_1'}, 200)) as mck:
+            self.common.get_resource(**srp_kwargs)
+            srp = self.common.get_resource(**srp_kwargs)
+            self.common.get_resource(
+                category=constants.SYSTEM, resource_level=constants.JOB)
+            self.common.get_resource(
+                category=constants.SYSTEM, resource_level=constants.JOB)
+            self.assertEqual({'srpId': 'SRP_1'}, srp)
+            self.assertEqual(3, mck.call_count)
+            self.common.modify_resource(**srp_kwargs)
+            self.common.get_resource(**srp_kwargs)
+            self.assertEqual(5, mck.call_count)
+        self.assertEqual(
+            {'size': 1, 'max_entries': 256, 'hits': 1, 'misses': 2,
+             'hit_ratio': 1 / 3, 'evictions': 0, 'invalidations': 1},
+            self.common.rest_client.response_cache.get_stats())
+
+    def test_job_response_cache_invalidation(self):
+        """Test finished jobs and queries only remove affected responses."""
+        cache = response_cache.ResponseCache()
+        self.common.rest_client.response_cache = cache
+        sg_uri = '/{ver}/sloprovisioning/symmetrix/{arr}/storagegroup'.format(
+            ver=UNISPHERE_VERSION, arr=self.data.array)
+        srp_uri = '/{ver}/sloprovisioning/symmetrix/{arr}/srp'.format(
+            ver=UNISPHERE_VERSION, arr=self.data.array)
+        for uri in (sg_uri + '/SG_1', srp_uri):
+            cache.get_or_load(uri, None, constants.SRP, dict)
+        self.assertEqual(
+            '{uri}/SG_1'.format(uri=sg_uri),
+            self.common.get_job_resource_uri({
+                'resourceLink': 'https://u4v:8443/univmax/restapi{uri}/SG_1/'
+                .format(uri=sg_uri)}))
+        self.assertIsNone(self.common.get_job_resource_uri({'jobId': '1'}))
+        self.common.invalidate_job_resource({'jobId': '1'})
+        self.assertEqual(2, cache.get_stats()['size'])
+        self.common.invalidate_job_resource({
+            'jobId': '1', 'resourceLink': 'https://u4v:8443/univmax/restapi'
+                                          '{uri}/SG_1'.format(uri=sg_uri)})
+        self.assertEqual(1, cache.get_stats()['size'])
+        with mock.patch.object(self.common, 'request',
+                               return_value=(dict(), 200)):
+            self.common.create_resource(
+                category=constants.SLOPROVISIONING,
+                resource_level=constants.SYMMETRIX,
+                resource_level_id=self.data.array,
+                resource_type=constants.SRP, read_only=True)
+            self.assertEqual(1, cache.get_stats()['size'])
+            # Writes marked safe to retry still change the array
+            self.common.create_resource(
+                category=constants.SLOPROVISIONING,
+                resource_level=constants.SYMMETRIX,
+                resource_level_id=self.data.array,
+                resource_type=constants.SRP, retry_safe=True)
+            self.assertEqual(0, cache.get_stats()['size'])
+
     def test_create_resource(self):
         """Test create_resource."""
         # Traditional Method
@@ -419,6 +610,22 @@ class PyU4VCommonTest(testtools.TestCase):
         self.assertEqual(self.data.server_version['version'], version)
         self.assertEqual(self.data.u4v_version, major_version)
 
+    def test_get_uni_version_metadata_cache(self):
+        """Test get_uni_version is read from the metadata cache."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.common.rest_client.metadata_cache = metadata_cache.MetadataCache(
+            path=os.path.join(cache_dir, 'metadata.db'))
+        with mock.patch.object(
+                self.common, 'get_resource',
+                return_value=self.data.server_version) as mck_get:
+            self.common.get_uni_version()
+            version, major_version = self.common.get_uni_version()
+            mck_get.assert_called_once_with(category='version',
+                                            no_version=True)
+        self.assertEqual(self.data.server_version['version'], version)
+        self.assertEqual(self.data.u4v_version, major_version)
+
     def test_get_array_list(self):
         """Test get_array_list."""
         array_list = self.common.get_array_list()
@@ -498,12 +705,92 @@ class PyU4VCommonTest(testtools.TestCase):
         iterator_page = self.common.get_iterator_page_list('123', 1, 1000)
         self.assertEqual(self.data.iterator_page['result'], iterator_page)
 
+    def test_get_resource_stream(self):
+        """Test get_resource_stream."""
+        stream = self.common.get_resource_stream(
+            category='sloprovisioning', resource_level='symmetrix',
+            resource_level_id=self.data.array, resource_type='volume')
+        self.assertEqual(self.data.volume_list[2]['resultList']['result'],
+                         list(stream))
+        self.assertEqual(self.data.volume_list[2]['id'],
+                         stream.metadata['id'])
+
+    def test_get_request_stream_not_found(self):
+        """Test get_request_stream error status code."""
+        with mock.patch.object(self.common.rest_client, 'stream_request',
+                               return_value=(None, 404)):
+            self.assertRaises(exception.ResourceNotFoundException,
+                              self.common.get_request_stream,
+                              '/fake_uri', 'volume')
+
+    def test_get_iterator_page_stream(self):
+        """Test get_iterator_page_stream."""
+        stream = self.common.get_iterator_page_stream('123', 1, 1000)
+        self.assertEqual(self.data.iterator_page['result'], list(stream))
+
     def test_get_iterator_results(self):
         rest_response_in = self.data.vol_with_pages
         ref_response = [{'volumeId': '00001'}, {'volumeId': '00002'}]
         response = self.common.get_iterator_results(rest_response_in)
         self.assertEqual(response, ref_response)
 
+    def test_get_iterator_results_concurrent(self):
+        """Test get_iterator_results fetches pages concurrently in order."""
+        rest_response_in = {'id': '123', 'count': 3500, 'maxPageSize': 1000,
+                            'resultList': {'result': [0]}}
+
+        def _get_page(iterator_id, start, end):
+            # Later pages return first to check results are reordered
+            time.sleep((3500 - start) / 100000.0)
+            return [start, end]
+
+        with mock.patch.object(
+                self.common, 'get_iterator_page_list',
+                side_effect=_get_page) as mck_page:
+            response = self.common.get_iterator_results(
+                rest_response_in, max_workers=4)
+        self.assertEqual([0, 1001, 2000, 2001, 3000, 3001, 3500], response)
+        self.assertEqual(3, mck_page.call_count)
+
+    def test_iter_iterator_results(self):
+        """Test iter_iterator_results requests pages as it is iterated."""
+        rest_response_in = {'id': '123', 'count': 3, 'maxPageSize': 1,
+                            'resultList': {'result': [1]}}
+        with mock.patch.object(
+                self.common, 'get_iterator_page_list',
+                side_effect=[[2], [3]]) as mck_page:
+            results = self.common.iter_iterator_results(rest_response_in)
+            self.assertEqual(1, next(results))
+            mck_page.assert_not_called()
+            self.assertEqual(2, next(results))
+            mck_page.assert_called_once_with('123', 2, 2)
+            self.assertEqual([3], list(results))
+
+    def test_iter_iterator_results_prefetch(self):
+        """Test iter_iterator_results prefetches pages in order."""
+        rest_response_in = {'id': '123', 'count': 10, 'maxPageSize': 1,
+                            'resultList': {'result': [1]}}
+
+        def _get_page(iterator_id, start, end):
+            time.sleep((10 - start) / 10000.0)
+            return [start]
+
+        with mock.patch.object(
+                self.common, 'get_iterator_page_list',
+                side_effect=_get_page) as mck_page:
+            self.assertEqual(
+                list(range(1, 11)), list(self.common.iter_iterator_results(
+                    rest_response_in, prefetch=3)))
+            self.assertEqual(9, mck_page.call_count)
+
+            mck_page.reset_mock()
+            results = self.common.iter_iterator_results(
+                rest_response_in, prefetch=2)
+            self.assertEqual([1, 2], [next(results), next(results)])
+            results.close()
+            # Two pages requested ahead plus one more once page 2 is taken
+            self.assertTrue(mck_page.call_count <= 3)
+
     def test_convert_to_snake_case(self):
         """Test convert_to_snake_case variations."""
         string_1 = 'CamelCase'
@@ -546,6 +833,20 @@ class PyU4VCommonTest(testtools.TestCase):
                     resource_type=constants.EXPORT_FILE, payload=request_body)
                 self.assertIsInstance(response, pf.FakeResponse)
 
+    def test_download_file_error_status(self):
+        """Test download_file closes the response on an error status."""
+        response = pf.FakeResponse(500, None, raw_reason='error')
+        with mock.patch.object(
+                self.conn.rest_client, 'file_transfer_request',
+                return_value=(response, 500)):
+            with mock.patch.object(response, 'close') as mck_close:
+                self.assertRaises(
+                    exception.VolumeBackendAPIException,
+                    self.common.download_file, category=constants.SYSTEM,
+                    resource_level=constants.SETTINGS,
+                    resource_type=constants.EXPORT_FILE)
+                mck_close.assert_called_once()
+
     def test_upload_file_success(self):
         """Test upload_file success scenario."""
         with mock.patch.object(
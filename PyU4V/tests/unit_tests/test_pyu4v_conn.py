@@ -70,6 +70,45 @@ class PyU4VUnivmaxConnTest(testtools.TestCase):
                                return_value=('v9.0.0', '90')):
             self.assertRaises(SystemExit, self.conn.validate_unisphere)
 
+    def test_init_endpoints(self):
+        """Test U4VConn with multiple Unisphere endpoints."""
+        with mock.patch.object(
+                rest_requests.RestRequests, 'establish_rest_session',
+                return_value=pf.FakeRequestsSession()):
+            conn = univmax_conn.U4VConn(
+                username='smc', password='smc', verify=False,
+                array_id=self.data.array,
+                endpoints=['10.0.0.75:8443', ('10.0.0.76', 8443)])
+        self.assertEqual(['https://10.0.0.75:8443/univmax/restapi',
+                          'https://10.0.0.76:8443/univmax/restapi'],
+                         conn.rest_client.base_urls)
+        self.assertEqual('https://10.0.0.75:8443/univmax/restapi',
+                         conn.rest_client.base_url)
+        self.assertEqual(2, len(conn.rest_client.endpoint_pool.endpoints))
+
+    def test_parse_endpoint(self):
+        """Test parse_endpoint."""
+        self.assertEqual(('10.0.0.75', '8443'),
+                         univmax_conn.parse_endpoint('10.0.0.75:8443'))
+        self.assertEqual(('10.0.0.75', '8443'),
+                         univmax_conn.parse_endpoint('10.0.0.75', '8443'))
+        self.assertEqual(('10.0.0.75', '8443'),
+                         univmax_conn.parse_endpoint(('10.0.0.75', 8443)))
+        self.assertEqual(('fe80::1', '8443'),
+                         univmax_conn.parse_endpoint('[fe80::1]:8443'))
+        self.assertEqual(('fe80::1', '8443'),
+                         univmax_conn.parse_endpoint('fe80::1', '8443'))
+
+    def test_build_base_urls(self):
+        """Test build_base_urls removes duplicates and keeps order."""
+        self.assertEqual(
+            ['https://10.0.0.75:8443/univmax/restapi',
+             'https://10.0.0.76:8443/univmax/restapi',
+             'https://[fe80::1]:9000/univmax/restapi'],
+            univmax_conn.build_base_urls(
+                '10.0.0.75', '8443',
+                ['10.0.0.75:8443', '10.0.0.76', '[fe80::1]:9000']))
+
 
 class PyU4VUnivmaxConnTestConfigFile(testtools.TestCase):
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 """test_pyu4v_performance.py."""
 
+import copy
 import socket
 import testtools
 import time
@@ -23,6 +24,7 @@ from PyU4V import rest_requests
 from PyU4V.tests.unit_tests import pyu4v_fakes as pf
 from PyU4V.tests.unit_tests import pyu4v_performance_data as pd
 from PyU4V import univmax_conn
+from PyU4V.utils import columnar
 from PyU4V.utils import exception
 from PyU4V.utils import file_handler
 from PyU4V.utils import performance_category_map
@@ -434,7 +436,8 @@ class PyU4VPerformanceTest(testtools.TestCase):
 
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.FE_DIR,
-                resource_type=pc.KEYS, payload=ref_request_body)
+                resource_type=pc.KEYS, payload=ref_request_body,
+                read_only=True)
 
             self.assertEqual(key_response, self.p_data.fe_dir_keys)
 
@@ -458,7 +461,7 @@ class PyU4VPerformanceTest(testtools.TestCase):
                 category=pc.ARRAY)
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.ARRAY,
-                resource_type=pc.KEYS, payload=dict())
+                resource_type=pc.KEYS, payload=dict(), read_only=True)
             self.assertEqual(key_response, self.p_data.array_keys)
 
     def test_get_performance_key_list_exception(self):
@@ -544,6 +547,26 @@ class PyU4VPerformanceTest(testtools.TestCase):
             self.assertIsNone(start)
             self.assertIsNone(end)
 
+    def test_extract_timestamp_keys_key_cache(self):
+        """Test extract_timestamp_keys reuses cached key lists."""
+        with mock.patch.object(
+                self.perf, 'get_performance_key_list',
+                return_value=self.p_data.fe_dir_keys) as mck_keys:
+            for __ in range(2):
+                self.assertEqual(
+                    (self.p_data.first_date, self.p_data.last_date),
+                    self.perf.extract_timestamp_keys(
+                        array_id=self.p_data.array, category=pc.FE_DIR,
+                        key_tgt_id=self.p_data.fe_dir_id))
+            mck_keys.assert_called_once_with(
+                category=pc.FE_DIR, array_id=self.p_data.array,
+                director_id=None)
+            self.perf.set_key_cache(None)
+            self.perf.extract_timestamp_keys(
+                array_id=self.p_data.array, category=pc.FE_DIR,
+                key_tgt_id=self.p_data.fe_dir_id)
+            self.assertEqual(2, mck_keys.call_count)
+
     def test_format_time_input_no_end_time(self):
         """Test format_time_input no end time specified."""
         five_mins_ago = self.time_now - (pc.ONE_MINUTE * 5)
@@ -649,10 +672,123 @@ class PyU4VPerformanceTest(testtools.TestCase):
                 end_time=self.time_now, recency=True)
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.ARRAY,
-                resource_type=pc.METRICS, payload=ref_payload)
+                resource_type=pc.METRICS, payload=ref_payload,
+                read_only=True)
             self.assertTrue(response)
             self.assertEqual(response, ref_response)
 
+    def test_get_bulk_stats(self):
+        """Test get_bulk_stats resolves keys once and reports errors."""
+        sg_keys = copy.deepcopy(self.p_data.storage_group_keys)
+        sg_keys[pc.SG_INFO].append({
+            pc.SG_ID: 'test_sg_2', pc.FA_DATE: self.p_data.first_date,
+            pc.LA_DATE: self.p_data.last_date})
+        error = exception.ResourceNotFoundException()
+        with mock.patch.object(
+                self.perf, 'get_performance_key_list',
+                return_value=sg_keys) as mck_keys:
+            with mock.patch.object(
+                    self.perf, 'get_performance_stats',
+                    side_effect=[{'result': list()}, error]) as mck_stats:
+                response = self.perf.get_bulk_stats(
+                    pc.SG, metrics=['HostIOs'], max_workers=1)
+                mck_keys.assert_called_once_with(
+                    category=pc.SG, array_id=self.p_data.array,
+                    director_id=None, start_time=None, end_time=None)
+                mck_stats.assert_any_call(
+                    category=pc.SG, metrics=['HostIOs'],
+                    data_format=pc.AVERAGE, array_id=self.p_data.array,
+                    request_body={pc.SG_ID: self.p_data.storage_group_id},
+                    start_time=self.p_data.last_date,
+                    end_time=self.p_data.last_date, result_format=pc.ROWS)
+                self.assertEqual(
+                    {self.p_data.storage_group_id: {'result': list()},
+                     'test_sg_2': error}, response)
+                response = self.perf.get_bulk_stats(
+                    pc.SG, object_ids='missing_sg')
+                self.assertIsInstance(
+                    response['missing_sg'],
+                    exception.ResourceNotFoundException)
+                # Keys already retrieved by the caller are not requested
+                mck_keys.reset_mock()
+                mck_stats.side_effect = None
+                mck_stats.return_value = {'result': list()}
+                response = self.perf.get_bulk_stats(
+                    pc.SG, object_keys={'test_sg_2': sg_keys[pc.SG_INFO][1]})
+                mck_keys.assert_not_called()
+                self.assertEqual({'test_sg_2': {'result': list()}}, response)
+        self.assertRaises(exception.InvalidInputException,
+                          self.perf.get_bulk_stats, pc.FE_PORT)
+
+    def test_get_array_snapshot(self):
+        """Test get_array_snapshot reuses director keys for ports."""
+        keys = {pc.SG: self.p_data.storage_group_keys,
+                pc.FE_DIR: self.p_data.fe_dir_keys,
+                pc.FE_PORT: self.p_data.fe_port_keys}
+
+        def _get_keys(category, **kwargs):
+            if category not in keys:
+                raise exception.ResourceNotFoundException()
+            return keys[category]
+
+        with mock.patch.object(
+                self.perf, 'get_performance_key_list',
+                side_effect=_get_keys) as mck_keys:
+            with mock.patch.object(
+                    self.perf, 'get_performance_stats',
+                    side_effect=lambda **kwargs: kwargs[
+                        'request_body']) as mck_stats:
+                snapshot = self.perf.get_array_snapshot(
+                    categories=[pc.SG, 'feport', pc.DB],
+                    start_time=self.time_now, end_time=self.time_now)
+        port_id = '{d}:{p}'.format(
+            d=self.p_data.fe_dir_id, p=self.p_data.fe_port_id)
+        self.assertEqual(
+            {pc.SG: {self.p_data.storage_group_id: {
+                pc.SG_ID: self.p_data.storage_group_id}},
+             pc.FE_PORT: {port_id: {
+                 pc.PORT_ID: self.p_data.fe_port_id,
+                 pc.DIR_ID: self.p_data.fe_dir_id}},
+             pc.DB: dict()}, snapshot)
+        self.assertEqual(4, mck_keys.call_count)
+        mck_keys.assert_any_call(
+            category=pc.FE_PORT, array_id=self.p_data.array,
+            director_id=self.p_data.fe_dir_id, start_time=None,
+            end_time=None)
+        self.assertEqual(2, mck_stats.call_count)
+
+    def test_get_performance_stats_columnar_missing_numpy(self):
+        """Test get_performance_stats columnar format without NumPy."""
+        with mock.patch.object(columnar, 'numpy', None):
+            with mock.patch.object(self.perf, 'post_request') as mck_request:
+                self.assertRaises(
+                    exception.MissingDependencyException,
+                    self.perf.get_performance_stats, category=pc.ARRAY,
+                    metrics='PercentBusy', start_time=self.time_now,
+                    end_time=self.time_now, result_format=pc.COLUMNAR)
+                mck_request.assert_not_called()
+        self.assertRaises(
+            exception.InvalidInputException, self.perf.get_performance_stats,
+            category=pc.ARRAY, metrics='PercentBusy', result_format='table')
+
+    @testtools.skipIf(columnar.numpy is None, 'numpy is not installed')
+    def test_get_performance_stats_columnar(self):
+        """Test get_performance_stats columnar format."""
+        with mock.patch.object(
+                self.perf, 'post_request',
+                return_value=self.p_data.perf_metrics_resp):
+            response = self.perf.get_performance_stats(
+                category=pc.ARRAY, metrics=['PercentBusy', 'HostIOs'],
+                start_time=self.time_now, end_time=self.time_now,
+                result_format=pc.COLUMNAR)
+        result = response['result']
+        self.assertEqual('int64', str(result[pc.TIMESTAMP].dtype))
+        self.assertEqual([self.p_data.first_date, self.p_data.last_date],
+                         result[pc.TIMESTAMP].tolist())
+        self.assertEqual([0.025403459, 0.027849833],
+                         result['PercentBusy'].tolist())
+        self.assertTrue(all(columnar.numpy.isnan(result['HostIOs'])))
+
     def test_get_performance_stats_request_body_disk_tech(self):
         """Test get_performance_stats with request body variant 1."""
         array_category_info = CATEGORY_MAP.get(pc.ARRAY.upper())
@@ -675,7 +811,8 @@ class PyU4VPerformanceTest(testtools.TestCase):
                               'diskTechnology': self.p_data.disk_technology})
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.ARRAY,
-                resource_type=pc.METRICS, payload=ref_payload)
+                resource_type=pc.METRICS, payload=ref_payload,
+                read_only=True)
 
     def test_get_performance_stats_request_body_other_tgt_id(self):
         """Test get_performance_stats with request body variant 2."""
@@ -698,7 +835,8 @@ class PyU4VPerformanceTest(testtools.TestCase):
                               'portId': self.p_data.fe_port_id})
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.ARRAY,
-                resource_type=pc.METRICS, payload=ref_payload)
+                resource_type=pc.METRICS, payload=ref_payload,
+                read_only=True)
 
     def test_get_performance_stats_with_recency_exception(self):
         """Test get_performance_stats recency check exception."""
@@ -733,7 +871,7 @@ class PyU4VPerformanceTest(testtools.TestCase):
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.DAYS_TO_FULL,
                 payload={'symmetrixId': self.p_data.array,
-                         'category': pc.SRP})
+                         'category': pc.SRP}, read_only=True)
             self.assertFalse(response)
 
     def test_get_days_to_full_thin_pool(self):
@@ -745,7 +883,7 @@ class PyU4VPerformanceTest(testtools.TestCase):
             mck_request.assert_called_once_with(
                 category=pc.PERFORMANCE, resource_level=pc.DAYS_TO_FULL,
                 payload={'symmetrixId': self.p_data.array,
-                         'category': pc.THIN_POOL})
+                         'category': pc.THIN_POOL}, read_only=True)
             self.assertFalse(response)
 
     def test_get_days_to_full_exception(self):
@@ -256,7 +256,7 @@ class PyU4VPerformanceTest(testtools.TestCase):
                 mck_post.assert_called_once_with(
                     no_version=True, category=pc.PERFORMANCE,
                     resource_level=pc.REAL_TIME, resource_type=pc.METRICS,
-                    payload=ref_params)
+                    payload=ref_params, read_only=True)
                 self.assertEqual(ref_response, response)
 
     def test_get_array_metrics(self):
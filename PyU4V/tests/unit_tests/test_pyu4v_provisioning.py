@@ -1160,6 +1160,21 @@ class PyU4VProvisioningTest(testtools.TestCase):
                 resource_level='symmetrix', resource_level_id=self.data.array,
                 resource_type='storagegroup', payload=payload)
 
+    def test_get_volumes(self):
+        """Test get_volumes."""
+        device_ids = [self.data.device_id, self.data.device_id2]
+        with mock.patch.object(self.provisioning.common, 'get_resources',
+                               return_value=['vol1', 'vol2']) as mck_get:
+            self.assertEqual(['vol1', 'vol2'],
+                             self.provisioning.get_volumes(device_ids, 2))
+            mck_get.assert_called_once_with(
+                [{'category': constants.SLOPROVISIONING,
+                  'resource_level': constants.SYMMETRIX,
+                  'resource_level_id': self.data.array,
+                  'resource_type': constants.VOLUME,
+                  'resource_type_id': device_id} for device_id in device_ids],
+                max_workers=2, return_exceptions=True)
+
     def test_get_volume_effective_wwn_details(self):
         """Test get_volume_effective_wwn_details."""
         device_id = self.data.device_id
@@ -1807,12 +1822,8 @@ class PyU4VProvisioningTest(testtools.TestCase):
                             'result': [{'volumeId':
                                         str(self.data.device_id)},
                                        {'volumeId':
-                                        str(self.data.device_id2)},
-                                       {'volumeId':
-                                        str(self.data.device_id3)}]}}
-        page_list = [[{'volumeId': self.data.device_id},
-                      {'volumeId': self.data.device_id2}],
-                     [{'volumeId': self.data.device_id3}]]
+                                        str(self.data.device_id2)}]}}
+        page_list = [[{'volumeId': self.data.device_id3}]]
         with mock.patch.object(self.provisioning, 'get_resource',
                                return_value=return_value):
             with mock.patch.object(self.provisioning.common,
@@ -1823,6 +1834,25 @@ class PyU4VProvisioningTest(testtools.TestCase):
                                 self.data.device_id3]
                 self.assertEqual(ref_vol_list, vol_list)
 
+    def test_iter_volumes(self):
+        """Test iter_volumes yields device ids page by page."""
+        return_value = {'id': '123', 'count': 3, 'maxPageSize': 2,
+                        'resultList': {'result': [
+                            {'volumeId': self.data.device_id},
+                            {'volumeId': self.data.device_id2}]}}
+        page_list = [[{'volumeId': self.data.device_id3}]]
+        with mock.patch.object(self.provisioning, 'get_resource',
+                               return_value=return_value):
+            with mock.patch.object(self.provisioning.common,
+                                   'get_iterator_page_list',
+                                   side_effect=page_list) as mck_page:
+                volumes = self.provisioning.iter_volumes()
+                self.assertEqual(self.data.device_id, next(volumes))
+                mck_page.assert_not_called()
+                self.assertEqual([self.data.device_id2, self.data.device_id3],
+                                 list(volumes))
+                mck_page.assert_called_once_with('123', 3, 3)
+
     def test_get_vols_from_storage_group(self):
         """Test get_vols_from_storage_group."""
         vol_list = self.provisioning.get_vols_from_storagegroup(
@@ -1935,6 +1965,19 @@ class PyU4VProvisioningTest(testtools.TestCase):
         ref_result = self.data.job_list[0]
         self.assertEqual(ref_result, act_result)
 
+    def test_extend_volume_return_future(self):
+        """Test extend_volume returning a future for the job."""
+        device_id = self.data.device_id
+        with mock.patch.object(
+                self.provisioning, '_modify_volume',
+                return_value=self.data.job_list[0]) as mock_mod:
+            future = self.provisioning.extend_volume(
+                device_id, 3, return_future=True)
+            self.assertEqual(constants.ASYNCHRONOUS,
+                             mock_mod.call_args[0][1]['executionOption'])
+        self.assertEqual('12345', future.job_id)
+        self.assertEqual('SUCCEEDED', future.result(timeout=5)['status'])
+
     def test_extend_volume_rdf(self):
         """Test extend_volume."""
         device_id = self.data.device_id
@@ -95,6 +95,13 @@ class PyU4VReplicationTest(testtools.TestCase):
             self.data.storagegroup_name)
         self.assertEqual(self.data.sg_details_rep[0], rep_details)
 
+    def test_get_storage_group_replication_details_list(self):
+        """Test get_storage_group_replication_details_list."""
+        rep_details = (
+            self.replication.get_storage_group_replication_details_list(
+                [self.data.storagegroup_name] * 2, max_workers=2))
+        self.assertEqual([self.data.sg_details_rep[0]] * 2, rep_details)
+
     def test_get_storage_group_rep_list(self):
         """Test get_storage_group_rep_list sgs with snapshots."""
         with mock.patch.object(self.replication, 'get_resource') as mock_mod:
@@ -13,18 +13,25 @@
 # limitations under the License.
 """test_pyu4v_requests.py."""
 
+import gc
 import json
 import platform
 import requests
 import testtools
+import threading
 
+from concurrent import futures
 from unittest import mock
 
 from PyU4V import rest_requests
 from PyU4V.tests.unit_tests import pyu4v_common_data as pcd
 from PyU4V.tests.unit_tests import pyu4v_fakes as pf
+from PyU4V.utils import circuit_breaker
 from PyU4V.utils import constants
+from PyU4V.utils import deadline
 from PyU4V.utils import exception
+from PyU4V.utils import json_codec
+from PyU4V.utils import retry_policy
 
 
 class PyU4VRestRequestsTest(testtools.TestCase):
@@ -60,16 +67,20 @@ class PyU4VRestRequestsTest(testtools.TestCase):
         self.assertEqual(self.rest.timeout, 120)
         ref_headers = {'content-type': 'application/json',
                        'accept': 'application/json',
+                       'Accept-Encoding': 'gzip, deflate',
                        'application-type': None,
                        'user-agent': self.ua_details}
         self.assertEqual(self.rest.headers, ref_headers)
         self.assertIsInstance(self.rest.session,
                               type(requests.session()))
+        self.assertIsInstance(self.rest.retry_policy,
+                              retry_policy.RetryPolicy)
 
     def test_establish_rest_session(self):
         """Test establish REST session."""
         ref_headers = {'content-type': 'application/json',
                        'accept': 'application/json',
+                       'Accept-Encoding': 'gzip, deflate',
                        'application-type': 'test_app',
                        'user-agent': self.ua_details}
         temp_rest = rest_requests.RestRequests(
@@ -82,6 +93,97 @@ class PyU4VRestRequestsTest(testtools.TestCase):
         self.assertEqual('smc', temp_rest.session.auth.password)
         self.assertEqual(False, temp_rest.session.verify)
 
+    def test_rest_requests_init_pool_defaults(self):
+        """Test class RestRequests __init__ connection pool defaults."""
+        self.assertEqual(constants.SHARED_SESSION, self.rest.session_mode)
+        self.assertEqual(constants.DEFAULT_POOL_CONNECTIONS,
+                         self.rest.pool_connections)
+        self.assertEqual(constants.DEFAULT_POOL_MAXSIZE,
+                         self.rest.pool_maxsize)
+        self.assertFalse(self.rest.pool_block)
+        self.assertIs(self.rest.adapter,
+                      self.rest.session.get_adapter('https://fake'))
+        self.assertIs(self.rest.adapter,
+                      self.rest.session.get_adapter('http://fake'))
+
+    def test_rest_requests_init_pool_settings(self):
+        """Test class RestRequests __init__ custom connection pool."""
+        temp_rest = rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3, pool_connections=2, pool_maxsize=50,
+            pool_block=True, session_mode=constants.THREAD_SESSION)
+        self.assertEqual(2, temp_rest.pool_connections)
+        self.assertEqual(50, temp_rest.pool_maxsize)
+        self.assertTrue(temp_rest.pool_block)
+        self.assertEqual(50, temp_rest.adapter._pool_maxsize)
+        self.assertTrue(temp_rest.adapter._pool_block)
+
+    def test_rest_requests_init_invalid_session_mode(self):
+        """Test class RestRequests __init__ invalid session mode."""
+        self.assertRaises(
+            exception.InvalidInputException, rest_requests.RestRequests,
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3, session_mode='fake')
+
+    def test_get_session_shared(self):
+        """Test get_session shared mode returns the same session."""
+        sessions = list()
+
+        def _get():
+            sessions.append(self.rest.get_session())
+
+        threads = [threading.Thread(target=_get) for __ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for session in sessions:
+            self.assertIs(self.rest.session, session)
+
+    def test_get_session_thread(self):
+        """Test get_session thread mode returns a session per thread."""
+        self.rest.session_mode = constants.THREAD_SESSION
+        sessions = list()
+
+        def _get():
+            session = self.rest.get_session()
+            self.assertIs(session, self.rest.get_session())
+            sessions.append(session)
+
+        threads = [threading.Thread(target=_get) for __ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(3, len(set(id(x) for x in sessions)))
+        for session in sessions:
+            self.assertIs(self.rest.adapter,
+                          session.get_adapter('https://fake'))
+        # Sessions of exited threads are not kept
+        gc.collect()
+        self.assertEqual(dict(), self.rest._thread_sessions)
+
+    def test_get_session_thread_pool(self):
+        """Test thread sessions are released with their worker threads."""
+        self.rest.session_mode = constants.THREAD_SESSION
+        for __ in range(3):
+            with futures.ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda __: self.rest.get_session(), range(8)))
+        gc.collect()
+        self.assertEqual(dict(), self.rest._thread_sessions)
+
+    def test_close_session_thread(self):
+        """Test close_session closes per-thread sessions."""
+        self.rest.session_mode = constants.THREAD_SESSION
+        session = self.rest.get_session()
+        with mock.patch.object(session, 'close') as mck_close:
+            self.rest.close_session()
+            mck_close.assert_called_once()
+        self.assertEqual(dict(), self.rest._thread_sessions)
+        self.assertIsNot(session, self.rest.get_session())
+
     def test_establish_rest_session_with_headers(self):
         """Test establish_rest_session with headers."""
         ref_headers = {'test_headers': True}
@@ -127,11 +229,32 @@ class PyU4VRestRequestsTest(testtools.TestCase):
                 '/fake_uri', 'GET', request_object=request_object)
             mock_request.assert_called_once_with(
                 method='GET', timeout=120,
-                data=json.dumps(request_object, sort_keys=True, indent=4),
+                data=self.rest.codec.dumps(request_object),
                 url='http://10.10.10.10:8443/univmax/restapi/fake_uri')
             self.assertEqual(200, sc)
             self.assertEqual(self.data.server_version, response)
 
+    def test_rest_request_object_compact(self):
+        """Test REST request object is serialized without whitespace."""
+        self.rest.codec = json_codec.get_codec(json_codec.STDLIB)
+        with mock.patch.object(
+                self.rest.session, 'request',
+                return_value=pf.FakeResponse(
+                    200, self.data.server_version)) as mock_request:
+            self.rest.rest_request('/fake_uri', 'POST',
+                                   request_object={'b': 1, 'a': [1, 2]})
+            __, kwargs = mock_request.call_args
+            self.assertEqual('{"b":1,"a":[1,2]}', kwargs['data'])
+            self.assertEqual({'b': 1, 'a': [1, 2]}, json.loads(kwargs['data']))
+
+    def test_rest_requests_init_json_codec(self):
+        """Test class RestRequests __init__ with a named JSON codec."""
+        temp_rest = rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3, json_codec_name=json_codec.STDLIB)
+        self.assertIsInstance(temp_rest.codec, json_codec.JSONCodec)
+
     def test_rest_request_no_session(self):
         """Test REST requests, no existing session available."""
         with mock.patch.object(
@@ -188,44 +311,379 @@ class PyU4VRestRequestsTest(testtools.TestCase):
         self.assertRaises(exception.VolumeBackendAPIException,
                           self.rest.rest_request, '/fake_url', 'EXCEPTION')
 
+    def test_stream_request(self):
+        """Test stream_request decodes the result list incrementally."""
+        body = {'id': 'it_1', 'count': 3, 'maxPageSize': 1000,
+                'resultList': {'from': 1, 'to': 3, 'result': [
+                    {'volumeId': '00001'}, {'volumeId': '00002'},
+                    {'volumeId': '00003'}]}}
+        content = json.dumps(body).encode()
+        response = pf.FakeResponse(200, None, content=content)
+        response.iter_content = mock.Mock(return_value=[
+            content[i:i + 7] for i in range(0, len(content), 7)])
+        with mock.patch.object(
+                self.rest.session, 'request',
+                return_value=response) as mock_request:
+            with mock.patch.object(response, 'close') as mck_close:
+                stream, sc = self.rest.stream_request('/fake_uri', 'GET')
+                self.assertEqual(200, sc)
+                mck_close.assert_not_called()
+                self.assertEqual(body['resultList']['result'], list(stream))
+                mck_close.assert_called_once()
+            mock_request.assert_called_once_with(
+                method='GET', params=None, data=None, timeout=120,
+                stream=True,
+                url='http://10.10.10.10:8443/univmax/restapi/fake_uri')
+            response.iter_content.assert_called_once_with(
+                chunk_size=constants.STREAM_CHUNK_SIZE)
+        self.assertEqual({'id': 'it_1', 'count': 3, 'maxPageSize': 1000,
+                          'resultList': {'from': 1, 'to': 3}},
+                         stream.metadata)
+
+    def test_stream_request_error_status(self):
+        """Test stream_request returns the decoded body on error."""
+        response = pf.FakeResponse(404, {'message': 'not found'})
+        with mock.patch.object(self.rest.session, 'request',
+                               return_value=response):
+            with mock.patch.object(response, 'close') as mck_close:
+                message, sc = self.rest.stream_request('/fake_uri', 'GET')
+                mck_close.assert_called_once()
+        self.assertEqual(404, sc)
+        self.assertEqual({'message': 'not found'}, message)
+
+    def test_stream_request_timeout_exception(self):
+        """Test stream_request timeout exception scenario."""
+        self.rest.session = pf.FakeRequestsSession()
+        message, sc = self.rest.stream_request('/fake_url', 'TIMEOUT')
+        self.assertIsNone(sc)
+        self.assertIsNone(message)
+
+    def test_stream_request_other_exception(self):
+        """Test stream_request other exception scenario."""
+        self.rest.session = pf.FakeRequestsSession()
+        self.assertRaises(exception.VolumeBackendAPIException,
+                          self.rest.stream_request, '/fake_url', 'EXCEPTION')
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_retry_status(self, mck_sleep):
+        """Test GET requests are retried on retryable status codes."""
+        self.rest.retry_policy = retry_policy.RetryPolicy(jitter=False)
+        responses = [pf.FakeResponse(503, None), pf.FakeResponse(429, None),
+                     pf.FakeResponse(200, self.data.server_version)]
+        with mock.patch.object(self.rest.session, 'request',
+                               side_effect=responses) as mck_request:
+            response, sc = self.rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual(3, mck_request.call_count)
+        self.assertEqual([mock.call(0.5), mock.call(1.0)],
+                         mck_sleep.call_args_list)
+        self.assertEqual(200, sc)
+        self.assertEqual(self.data.server_version, response)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_retry_exhausted(self, mck_sleep):
+        """Test the last response is returned when retries are used up."""
+        with mock.patch.object(
+                self.rest.session, 'request',
+                return_value=pf.FakeResponse(
+                    504, {'message': 'timeout'})) as mck_request:
+            response, sc = self.rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual(3, mck_request.call_count)
+        self.assertEqual(2, mck_sleep.call_count)
+        self.assertEqual(504, sc)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_retry_after(self, mck_sleep):
+        """Test the Retry-After response header is honoured."""
+        busy = pf.FakeResponse(429, None)
+        busy.headers = {'Retry-After': '2'}
+        with mock.patch.object(
+                self.rest.session, 'request',
+                side_effect=[busy, pf.FakeResponse(200, {'a': 1})]):
+            self.rest.rest_request('/fake_uri', 'GET')
+        mck_sleep.assert_called_once_with(2.0)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_no_retry_not_idempotent(self, mck_sleep):
+        """Test POST requests are not retried unless marked safe."""
+        with mock.patch.object(
+                self.rest.session, 'request',
+                return_value=pf.FakeResponse(503, None)) as mck_request:
+            __, sc = self.rest.rest_request(
+                '/fake_uri', 'POST', request_object={'a': 1})
+            self.assertEqual(503, sc)
+            mck_request.assert_called_once()
+            mck_sleep.assert_not_called()
+            self.rest.rest_request('/fake_uri', 'POST',
+                                   request_object={'a': 1}, retry_safe=True)
+            self.assertEqual(4, mck_request.call_count)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_deadline(self, mck_sleep):
+        """Test requests use the remaining deadline budget."""
+        with mock.patch.object(
+                self.rest.session, 'request',
+                side_effect=[requests.exceptions.Timeout,
+                             pf.FakeResponse(200, {'a': 1})]) as mck_request:
+            with mock.patch.object(deadline.Deadline, 'get_remaining',
+                                   return_value=30):
+                with deadline.Deadline(30):
+                    response, sc = self.rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual({'a': 1}, response)
+        self.assertEqual(30, mck_request.call_args[1]['timeout'])
+        self.rest.retry_policy = retry_policy.RetryPolicy(jitter=False)
+        with mock.patch.object(
+                self.rest.session, 'request',
+                side_effect=requests.exceptions.Timeout) as mck_request:
+            with mock.patch.object(deadline.Deadline, 'get_remaining',
+                                   return_value=0.2):
+                with deadline.Deadline(30):
+                    self.assertRaises(exception.DeadlineExceededException,
+                                      self.rest.rest_request, '/fake_uri',
+                                      'GET')
+        mck_request.assert_called_once_with(
+            method='GET', url=mock.ANY, timeout=0.2)
+        self.assertEqual(1, mck_sleep.call_count)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_retry_timeout(self, mck_sleep):
+        """Test GET request timeouts and connection errors are retried."""
+        with mock.patch.object(
+                self.rest.session, 'request', side_effect=[
+                    requests.exceptions.Timeout,
+                    requests.exceptions.ConnectionError,
+                    pf.FakeResponse(200, {'a': 1})]) as mck_request:
+            response, sc = self.rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual(3, mck_request.call_count)
+        self.assertEqual({'a': 1}, response)
+        with mock.patch.object(
+                self.rest.session, 'request',
+                side_effect=requests.exceptions.Timeout) as mck_request:
+            response, sc = self.rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual(3, mck_request.call_count)
+        self.assertIsNone(sc)
+        self.assertIsNone(response)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_no_retry_ssl_error(self, mck_sleep):
+        """Test SSL errors are not retried."""
+        with mock.patch.object(
+                self.rest.session, 'request',
+                side_effect=requests.exceptions.SSLError) as mck_request:
+            self.assertRaises(requests.exceptions.SSLError,
+                              self.rest.rest_request, '/fake_uri', 'GET')
+        mck_request.assert_called_once()
+        mck_sleep.assert_not_called()
+
+    def test_rest_requests_init_circuit_breaker(self):
+        """Test RestRequests shares a circuit breaker per base url."""
+        self.addCleanup(circuit_breaker.reset_circuit_breakers)
+        self.assertIsNone(self.rest.endpoint_pool.preferred.circuit_breaker)
+        rest_1, rest_2 = [rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3, circuit_breaker=True,
+            breaker_failure_threshold=2) for __ in range(2)]
+        breaker = rest_1.endpoint_pool.preferred.circuit_breaker
+        self.assertIs(breaker, rest_2.endpoint_pool.preferred.circuit_breaker)
+        self.assertEqual(2, breaker.failure_threshold)
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_circuit_open(self, mck_sleep):
+        """Test requests fail fast once the circuit opens."""
+        breaker = circuit_breaker.CircuitBreaker(
+            self.rest.base_url, failure_threshold=2)
+        self.rest.endpoint_pool.preferred.circuit_breaker = breaker
+        with mock.patch.object(
+                self.rest.session, 'request',
+                return_value=pf.FakeResponse(503, None)) as mck_request:
+            self.assertRaises(exception.CircuitOpenException,
+                              self.rest.rest_request, '/fake_uri', 'GET')
+            self.assertEqual(2, mck_request.call_count)
+            self.assertRaises(exception.CircuitOpenException,
+                              self.rest.rest_request, '/fake_uri', 'POST',
+                              request_object={'a': 1})
+            self.assertRaises(exception.CircuitOpenException,
+                              self.rest.stream_request, '/fake_uri', 'GET')
+            self.assertEqual(2, mck_request.call_count)
+        self.assertEqual(circuit_breaker.OPEN, breaker.state)
+
+    def test_rest_request_circuit_success(self):
+        """Test successful requests reset the circuit failure count."""
+        breaker = circuit_breaker.CircuitBreaker(self.rest.base_url)
+        breaker.failure_count = 3
+        self.rest.endpoint_pool.preferred.circuit_breaker = breaker
+        with mock.patch.object(self.rest.session, 'request',
+                               return_value=pf.FakeResponse(404, None)):
+            self.rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual(0, breaker.failure_count)
+
+    def _get_multi_endpoint_client(self):
+        """Get a RestRequests client with two endpoints."""
+        return rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url=['http://10.10.10.10:8443/univmax/restapi',
+                      'http://10.10.10.11:8443/univmax/restapi'],
+            interval=1, retries=3)
+
+    def test_rest_request_read_load_balancing(self):
+        """Test reads go to the endpoint with fewest outstanding requests."""
+        rest = self._get_multi_endpoint_client()
+        primary, secondary = rest.endpoint_pool.endpoints
+        primary.outstanding = 1
+        with mock.patch.object(
+                rest.session, 'request',
+                return_value=pf.FakeResponse(200, {'a': 1})) as mck_request:
+            rest.rest_request('/fake_uri', 'GET')
+            rest.rest_request('/fake_uri', 'POST', request_object={'a': 1})
+            rest.rest_request('/fake_uri', 'POST', request_object={'a': 1},
+                              retry_safe=True)
+            rest.rest_request('/fake_uri', 'POST', request_object={'a': 1},
+                              read_only=True)
+        urls = [c[1]['url'] for c in mck_request.call_args_list]
+        self.assertEqual(['http://10.10.10.11:8443/univmax/restapi/fake_uri',
+                          'http://10.10.10.10:8443/univmax/restapi/fake_uri',
+                          'http://10.10.10.10:8443/univmax/restapi/fake_uri',
+                          'http://10.10.10.11:8443/univmax/restapi/fake_uri'],
+                         urls)
+        self.assertEqual(1, primary.outstanding)
+        self.assertEqual(0, secondary.outstanding)
+
+    def test_rest_request_write_failover(self):
+        """Test writes fail over when the preferred server is unreachable."""
+        rest = self._get_multi_endpoint_client()
+        with mock.patch.object(
+                rest.session, 'request', side_effect=[
+                    requests.exceptions.ConnectTimeout,
+                    pf.FakeResponse(201, {'a': 1})]) as mck_request:
+            __, sc = rest.rest_request(
+                '/fake_uri', 'POST', request_object={'a': 1})
+        self.assertEqual(201, sc)
+        self.assertEqual('http://10.10.10.11:8443/univmax/restapi/fake_uri',
+                         mck_request.call_args[1]['url'])
+        self.assertFalse(rest.endpoint_pool.get_stats()[
+            'http://10.10.10.10:8443/univmax/restapi']['healthy'])
+
+    def test_rest_request_write_no_failover_read_timeout(self):
+        """Test writes are not resent after a read timeout."""
+        rest = self._get_multi_endpoint_client()
+        with mock.patch.object(
+                rest.session, 'request',
+                side_effect=requests.exceptions.ReadTimeout) as mck_request:
+            message, sc = rest.rest_request(
+                '/fake_uri', 'PUT', request_object={'a': 1})
+        self.assertIsNone(sc)
+        mck_request.assert_called_once()
+        with mock.patch.object(
+                rest.session, 'request',
+                side_effect=requests.exceptions.ReadTimeout) as mck_request:
+            with mock.patch.object(rest_requests.time, 'sleep'):
+                message, sc = rest.rest_request(
+                    '/fake_uri', 'PUT', request_object={'a': 1},
+                    retry_safe=True)
+        self.assertIsNone(sc)
+        # Retry safe writes are retried on the preferred server only
+        self.assertEqual(
+            {'http://10.10.10.10:8443/univmax/restapi/fake_uri'},
+            {c[1]['url'] for c in mck_request.call_args_list})
+
+    @mock.patch.object(rest_requests.time, 'sleep')
+    def test_rest_request_read_failover(self, mck_sleep):
+        """Test reads fail over to another server on any failure."""
+        rest = self._get_multi_endpoint_client()
+        with mock.patch.object(
+                rest.session, 'request', side_effect=[
+                    requests.exceptions.ReadTimeout,
+                    pf.FakeResponse(200, {'a': 1})]) as mck_request:
+            message, sc = rest.rest_request('/fake_uri', 'GET')
+        self.assertEqual({'a': 1}, message)
+        self.assertEqual(2, mck_request.call_count)
+        mck_sleep.assert_not_called()
+
+    def test_rest_request_rate_limiter(self):
+        """Test requests are admitted and released by the rate limiter."""
+        rest = rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3, rate_limit=10, max_concurrency=2)
+        limiter = rest.endpoint_pool.preferred.rate_limiter
+        self.assertEqual(10, limiter.rate)
+        with mock.patch.object(
+                limiter, 'acquire', wraps=limiter.acquire) as mck_acquire:
+            with mock.patch.object(
+                    rest.session, 'request',
+                    return_value=pf.FakeResponse(200, {'a': 1})):
+                rest.rest_request('/fake_uri', 'GET',
+                                  priority=constants.PRIORITY_BACKGROUND)
+            with mock.patch.object(
+                    rest.session, 'request',
+                    side_effect=requests.exceptions.ReadTimeout):
+                rest.rest_request('/fake_uri', 'PUT', request_object={})
+        self.assertEqual(
+            [mock.call(constants.PRIORITY_BACKGROUND, timeout=None),
+             mock.call(None, timeout=None)],
+            mck_acquire.call_args_list)
+        stats = limiter.get_stats()
+        self.assertEqual(0, stats['active'])
+        self.assertEqual(
+            1, stats[constants.PRIORITY_BACKGROUND]['admitted'])
+
+    def test_stream_request_rate_limiter(self):
+        """Test streamed responses hold their slot until closed."""
+        rest = rest_requests.RestRequests(
+            username='smc', password='smc', verify=False,
+            base_url='http://10.10.10.10:8443/univmax/restapi',
+            interval=1, retries=3, max_concurrency=2)
+        limiter = rest.endpoint_pool.preferred.rate_limiter
+        response = pf.FakeResponse(200, None, content=b'file')
+        with mock.patch.object(rest.session, 'request',
+                               return_value=response):
+            download, __ = rest.file_transfer_request(
+                constants.POST, '/fake_uri', download=True)
+        self.assertEqual(1, limiter.get_stats()['active'])
+        download.close()
+        download.close()
+        self.assertEqual(0, limiter.get_stats()['active'])
+
     def test_file_transfer_request_download(self):
         """Test file_transfer_request download request."""
+        self.rest.session = pf.FakeRequestsSession()
         with mock.patch.object(
-                self.rest, 'establish_rest_session',
-                return_value=pf.FakeRequestsSession()) as mck_est:
-
-            response, sc = self.rest.file_transfer_request(
+                self.rest.session, 'request',
+                wraps=self.rest.session.request) as mck_request:
+            with mock.patch.object(
+                    self.rest, 'establish_rest_session') as mck_est:
+                response, sc = self.rest.file_transfer_request(
+                    method=constants.POST,
+                    uri='/system/settings/importfile',
+                    download=True,
+                    r_obj={'test_req': True})
+            mck_est.assert_not_called()
+            mck_request.assert_called_once_with(
                 method=constants.POST,
-                uri='/system/settings/importfile',
-                download=True,
-                r_obj={'test_req': True})
-
-            mck_est.assert_called_once_with(headers={
-                constants.CONTENT_TYPE: constants.APP_JSON,
-                constants.ACCEPT: constants.APP_OCT,
-                constants.USER_AGENT: rest_requests.ua_details,
-                constants.APP_TYPE: self.rest.headers.get(
-                    'application-type')})
+                url=self.rest.base_url + '/system/settings/importfile',
+                timeout=120, headers={constants.ACCEPT: constants.APP_OCT},
+                stream=True, data=b'{"test_req":true}', files=None)
             self.assertEqual(200, sc)
             self.assertEqual('OK', response.raw.reason)
 
     def test_file_transfer_request_upload(self):
         """Test file_transfer_request download request."""
+        self.rest.session = pf.FakeRequestsSession()
         with mock.patch.object(
-                self.rest, 'establish_rest_session',
-                return_value=pf.FakeRequestsSession()) as mck_est:
-
+                self.rest.session, 'request',
+                wraps=self.rest.session.request) as mck_request:
             response, sc = self.rest.file_transfer_request(
                 method=constants.POST,
                 uri='/system/settings/exportfile',
                 upload=True,
                 form_data={'test_req': True})
-
-            mck_est.assert_called_once_with(headers={
-                constants.ACCEPT_ENC: constants.APP_MPART,
-                constants.USER_AGENT: rest_requests.ua_details,
-                constants.APP_TYPE: self.rest.headers.get(
-                    'application-type')})
+            mck_request.assert_called_once_with(
+                method=constants.POST,
+                url=self.rest.base_url + '/system/settings/exportfile',
+                timeout=120, headers={
+                    constants.CONTENT_TYPE: None, constants.ACCEPT: None,
+                    constants.ACCEPT_ENC: constants.APP_MPART},
+                stream=False, data=None, files={'test_req': True})
             self.assertEqual(200, sc)
             self.assertEqual('OK', response.raw.reason)
 
@@ -238,7 +696,7 @@ class PyU4VRestRequestsTest(testtools.TestCase):
     def test_file_transfer_request_timeout_exception(self):
         """Test file_transfer timeout exception scenario."""
         with mock.patch.object(
-                self.rest, 'establish_rest_session',
+                self.rest.session, 'request',
                 side_effect=requests.Timeout):
             resp, sc = self.rest.file_transfer_request(
                 method=constants.POST, uri='/fake', download=True)
@@ -248,7 +706,7 @@ class PyU4VRestRequestsTest(testtools.TestCase):
     def test_file_transfer_request_ssl_exception(self):
         """Test file_transfer SSL error exception scenario."""
         with mock.patch.object(
-                self.rest, 'establish_rest_session',
+                self.rest.session, 'request',
                 side_effect=requests.exceptions.SSLError):
             self.assertRaises(
                 requests.exceptions.SSLError,
@@ -258,7 +716,7 @@ class PyU4VRestRequestsTest(testtools.TestCase):
     def test_file_transfer_request_connection_exception(self):
         """Test file_transfer HTTP error exception scenario."""
         with mock.patch.object(
-                self.rest, 'establish_rest_session',
+                self.rest.session, 'request',
                 side_effect=requests.exceptions.HTTPError):
             self.assertRaises(
                 requests.exceptions.HTTPError,
@@ -268,7 +726,7 @@ class PyU4VRestRequestsTest(testtools.TestCase):
     def test_file_transfer_request_other_exception(self):
         """Test file_transfer HTTP error exception scenario."""
         with mock.patch.object(
-                self.rest, 'establish_rest_session',
+                self.rest.session, 'request',
                 side_effect=exception.VolumeBackendAPIException):
             self.assertRaises(
                 exception.VolumeBackendAPIException,
@@ -459,7 +459,8 @@ class PyU4VSystemTest(testtools.TestCase):
                 payload=ref_req_body)
             mck_write.assert_called_once_with(
                 data=ref_response, file_extension=constants.PDF_SUFFIX,
-                file_name='test', dir_path='test')
+                file_name='test', dir_path='test',
+                chunk_size=constants.DOWNLOAD_CHUNK_SIZE)
             self.assertTrue(response[SUCCESS])
             self.assertIn('/test/test.pdf', str(response[AUDIT_RECORD_PATH]))
 
@@ -15,21 +15,44 @@
 
 import configparser
 import csv
+import json
 import os
+import requests
+import shutil
 import six
+import tempfile
 import testtools
+import threading
 import time
+import urllib3
 
+from concurrent import futures
 from pathlib import Path
 from unittest import mock
 
 from PyU4V.tests.unit_tests import pyu4v_common_data as pcd
 from PyU4V.tests.unit_tests import pyu4v_fakes as pf
+from PyU4V.utils import circuit_breaker
+from PyU4V.utils import columnar
 from PyU4V.utils import config_handler
 from PyU4V.utils import console
+from PyU4V.utils import endpoint_pool
 from PyU4V.utils import constants
+from PyU4V.utils import deadline
 from PyU4V.utils import exception
 from PyU4V.utils import file_handler
+from PyU4V.utils import job_tracker
+from PyU4V.utils import json_codec
+from PyU4V.utils import json_stream
+from PyU4V.utils import metadata_cache
+from PyU4V.utils import performance_collector
+from PyU4V.utils import performance_constants as pc
+from PyU4V.utils import performance_key_cache
+from PyU4V.utils import polling_policy
+from PyU4V.utils import rate_limiter
+from PyU4V.utils import response_cache
+from PyU4V.utils import retry_policy
+from PyU4V.utils import singleflight
 from PyU4V.utils import time_handler
 
 
@@ -314,13 +337,39 @@ class PyU4VUtilsTest(testtools.TestCase):
             ref_write_path, constants.FILE_WRITE_MODE)
         self.assertEqual(ref_write_path, response)
 
+    @mock.patch('builtins.open', new_callable=mock.mock_open)
+    def test_write_binary_data_to_file_chunk_size(self, mck_open):
+        """Test write_binary_data_to_file chunk size and response close."""
+        test_data = pf.FakeResponse(200, dict(), content=b'test_binary_data')
+        with mock.patch.object(
+                test_data, 'iter_content',
+                return_value=[b'test_', b'binary_data']) as mck_iter:
+            with mock.patch.object(test_data, 'close') as mck_close:
+                self.file.write_binary_data_to_file(
+                    data=test_data, file_extension=constants.PDF_SUFFIX,
+                    file_name='test_file')
+                mck_iter.assert_called_once_with(
+                    chunk_size=constants.DOWNLOAD_CHUNK_SIZE)
+                mck_close.assert_called_once()
+                self.file.write_binary_data_to_file(
+                    data=test_data, file_extension=constants.PDF_SUFFIX,
+                    file_name='test_file', chunk_size=4096)
+                mck_iter.assert_called_with(chunk_size=4096)
+        self.assertEqual(
+            [mock.call(b'test_'), mock.call(b'binary_data')] * 2,
+            mck_open().write.call_args_list)
+
     def test_write_binary_data_to_file_invalid_dir(self):
         """Test write_binary_data_to_file exception."""
-        self.assertRaises(
-            exception.InvalidInputException,
-            self.file.write_binary_data_to_file,
-            data=dict(), file_extension=None, file_name='test',
-            dir_path='fake')
+        test_data = pf.FakeResponse(200, dict(), content=b'test_binary_data')
+        with mock.patch.object(test_data, 'close') as mck_close:
+            self.assertRaises(
+                exception.InvalidInputException,
+                self.file.write_binary_data_to_file,
+                data=test_data, file_extension=None, file_name='test',
+                dir_path='fake')
+            # The response is closed even though nothing was written
+            mck_close.assert_called_once()
 
     # utils.time_handler
     def test_format_time_input_return_seconds_from_seconds(self):
@@ -368,3 +417,923 @@ class PyU4VUtilsTest(testtools.TestCase):
         self.assertRaises(
             exception.InvalidInputException,
             self.time.format_time_input, 123, True, True)
+
+    # utils.json_codec
+    def test_json_codec_dumps_compact(self):
+        """Test JSONCodec dumps uses compact separators."""
+        codec = json_codec.JSONCodec()
+        self.assertEqual('{"b":1,"a":[1,2]}',
+                         codec.dumps({'b': 1, 'a': [1, 2]}))
+        self.assertEqual({'b': 1}, codec.loads('{"b":1}'))
+
+    def test_json_codec_decode_response(self):
+        """Test JSONCodec decode_response."""
+        codec = json_codec.JSONCodec()
+        self.assertEqual(self.data.server_version, codec.decode_response(
+            pf.FakeResponse(200, self.data.server_version)))
+        self.assertRaises(ValueError, codec.decode_response,
+                          pf.FakeResponse(200, None))
+
+    @testtools.skipIf(json_codec.orjson is None, 'orjson is not installed')
+    def test_orjson_codec(self):
+        """Test OrjsonCodec encodes and decodes."""
+        codec = json_codec.get_codec(json_codec.ORJSON)
+        self.assertIsInstance(codec, json_codec.OrjsonCodec)
+        self.assertEqual(b'{"b":1}', codec.dumps({'b': 1}))
+        self.assertEqual(self.data.server_version, codec.decode_response(
+            pf.FakeResponse(200, self.data.server_version)))
+        self.assertRaises(ValueError, codec.decode_response,
+                          pf.FakeResponse(200, None))
+
+    def test_get_codec_auto(self):
+        """Test get_codec auto selection."""
+        with mock.patch.object(json_codec, 'orjson', None):
+            self.assertIsInstance(json_codec.get_codec(),
+                                  json_codec.JSONCodec)
+            self.assertRaises(exception.MissingDependencyException,
+                              json_codec.get_codec, json_codec.ORJSON)
+        with mock.patch.object(json_codec, 'orjson', mock.MagicMock()):
+            self.assertIsInstance(json_codec.get_codec(json_codec.AUTO),
+                                  json_codec.OrjsonCodec)
+
+    def test_get_codec_invalid(self):
+        """Test get_codec invalid codec name."""
+        self.assertRaises(exception.InvalidInputException,
+                          json_codec.get_codec, 'fake')
+
+    # utils.json_stream
+    def test_json_array_stream(self):
+        """Test JSONArrayStream across every chunk boundary."""
+        body = {'id': '123', 'count': 4,
+                'resultList': {'from': 1, 'result': [
+                    {'volumeId': '00001', 'cap_gb': 10.25,
+                     'name': u'vol\u00e9'},
+                    -1.5e3, None, True], 'to': 4},
+                'maxPageSize': 1000}
+        content = json.dumps(body, indent=4, ensure_ascii=False).encode()
+        for size in [1, 3, 64, len(content)]:
+            stream = json_stream.JSONArrayStream(
+                [content[i:i + size] for i in range(0, len(content), size)])
+            self.assertEqual(body['resultList']['result'], list(stream))
+            self.assertEqual({'id': '123', 'count': 4, 'maxPageSize': 1000,
+                              'resultList': {'from': 1, 'to': 4}},
+                             stream.metadata)
+
+    def test_json_array_stream_page_path(self):
+        """Test JSONArrayStream with an iterator page path."""
+        close = mock.Mock()
+        stream = json_stream.JSONArrayStream(
+            [b'{"from": 2, "to": 2, "result": [{"volumeId": "00002"}]}'],
+            path=json_stream.PAGE_RESULT_PATH, close_callback=close)
+        self.assertEqual([{'volumeId': '00002'}], list(stream))
+        close.assert_called_once()
+        self.assertRaises(ValueError, list, stream)
+
+    def test_json_array_stream_empty(self):
+        """Test JSONArrayStream with missing or empty result lists."""
+        for content in [b'{}', b'{"resultList": {"result": []}}',
+                        b'{"resultList": {"result": null}}']:
+            self.assertEqual(
+                list(), list(json_stream.JSONArrayStream([content])))
+
+    def test_json_array_stream_invalid(self):
+        """Test JSONArrayStream with invalid documents."""
+        close = mock.Mock()
+        for content in [b'{"resultList": {"result": [1, ', b'[1]',
+                        b'{"a": 1} x', b'{"resultList": {"result": 1}}']:
+            self.assertRaises(ValueError, list, json_stream.JSONArrayStream(
+                [content], close_callback=close))
+        self.assertEqual(4, close.call_count)
+
+    # utils.retry_policy
+    def test_retry_policy_defaults(self):
+        """Test RetryPolicy default settings."""
+        policy = retry_policy.RetryPolicy()
+        self.assertEqual(3, policy.total_attempts)
+        self.assertEqual([429, 502, 503, 504], policy.status_codes)
+        self.assertTrue(policy.is_retryable_method('get'))
+        self.assertFalse(policy.is_retryable_method(constants.POST))
+        self.assertTrue(policy.is_retryable_method(constants.POST, True))
+        self.assertTrue(policy.is_retryable_status(503))
+        self.assertFalse(policy.is_retryable_status(500))
+
+    def test_retry_policy_invalid(self):
+        """Test RetryPolicy invalid settings."""
+        self.assertRaises(exception.InvalidInputException,
+                          retry_policy.RetryPolicy, total_attempts=0)
+        self.assertRaises(exception.InvalidInputException,
+                          retry_policy.RetryPolicy, backoff_factor=-1)
+
+    def test_retry_policy_is_retryable_exception(self):
+        """Test RetryPolicy is_retryable_exception."""
+        policy = retry_policy.RetryPolicy(retry_on_connection_error=False)
+        self.assertTrue(policy.is_retryable_exception(
+            requests.exceptions.ReadTimeout()))
+        self.assertFalse(policy.is_retryable_exception(
+            requests.exceptions.ConnectionError()))
+        self.assertFalse(policy.is_retryable_exception(
+            requests.exceptions.SSLError()))
+        self.assertFalse(policy.is_retryable_exception(ValueError()))
+
+    def test_retry_policy_get_backoff(self):
+        """Test RetryPolicy get_backoff."""
+        policy = retry_policy.RetryPolicy(
+            backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual([1, 2, 4, 5],
+                         [policy.get_backoff(a) for a in range(1, 5)])
+        self.assertEqual(3.0, policy.get_backoff(1, retry_after='3'))
+        self.assertEqual(5, policy.get_backoff(1, retry_after='60'))
+        self.assertEqual(1, policy.get_backoff(1, retry_after='soon'))
+        policy.jitter = True
+        for attempt in range(1, 6):
+            self.assertTrue(0 <= policy.get_backoff(attempt) <= 5)
+
+    # utils.polling_policy
+    def test_polling_policy_get_interval(self):
+        """Test PollingPolicy intervals grow up to the maximum."""
+        policy = polling_policy.PollingPolicy()
+        self.assertEqual([0.5, 1, 2, 4, 5, 5], [
+            policy.get_interval(x, max_interval=5) for x in range(1, 7)])
+        policy = polling_policy.PollingPolicy(
+            initial_interval=1, multiplier=3, max_interval=10)
+        self.assertEqual([1, 3, 9, 10], [
+            policy.get_interval(x, max_interval=5) for x in range(1, 5)])
+        self.assertEqual(10, policy.get_interval(10000))
+
+    def test_polling_policy_job_hints(self):
+        """Test PollingPolicy job hints set the initial interval."""
+        policy = polling_policy.PollingPolicy(
+            job_hints={'Rename': 0.1, 'snapshot': 3})
+        self.assertEqual(0.1, policy.get_interval(
+            1, {'name': 'Rename Volume 00123'}))
+        self.assertEqual(0.2, policy.get_interval(
+            2, {'description': 'rename volume'}))
+        self.assertEqual(3, policy.get_interval(
+            1, {'name': 'Create Snapshot'}, max_interval=5))
+        self.assertEqual(0.5, policy.get_interval(1, {'jobId': '123'}))
+
+    def test_polling_policy_invalid(self):
+        """Test PollingPolicy invalid settings."""
+        self.assertRaises(exception.InvalidInputException,
+                          polling_policy.PollingPolicy, initial_interval=0)
+        self.assertRaises(exception.InvalidInputException,
+                          polling_policy.PollingPolicy, multiplier=0.5)
+        self.assertRaises(exception.InvalidInputException,
+                          polling_policy.PollingPolicy,
+                          job_hints={'rename': -1})
+
+    # utils.job_tracker
+    @staticmethod
+    def _get_job_tracker_common(retries=5, interval=0.001):
+        """Get mock common functions for a job tracker."""
+        return mock.Mock(
+            interval=1, retries=retries,
+            polling_policy=polling_policy.PollingPolicy(
+                initial_interval=interval, max_interval=interval))
+
+    def test_job_tracker_track(self):
+        """Test JobTracker completes futures from a background thread."""
+        common = self._get_job_tracker_common(interval=0.05)
+        common._is_job_finished.side_effect = [
+            (False, None, 0, 'RUNNING', None),
+            (True, 'done', 0, 'SUCCEEDED', ['task'])]
+        tracker = job_tracker.JobTracker(common)
+        callback = mock.Mock()
+        future = tracker.track({'jobId': '1', 'status': 'RUNNING'}, callback)
+        duplicate = tracker.track('1')
+        self.assertEqual((0, 'done', 'SUCCEEDED', ['task']),
+                         future.result(timeout=5))
+        self.assertEqual(future.result(), duplicate.result(timeout=5))
+        callback.assert_called_once_with(future)
+        self.assertEqual(2, common._is_job_finished.call_count)
+        self.assertEqual(0, tracker.get_stats()['tracked'])
+        done = tracker.track({'jobId': '2', 'status': 'SUCCEEDED'})
+        self.assertEqual((0, None, 'SUCCEEDED', None), done.result())
+
+    @mock.patch.object(job_tracker.threading, 'Thread')
+    def test_job_tracker_bulk_poll(self, mck_thread):
+        """Test JobTracker checks many jobs with a job list query."""
+        common = self._get_job_tracker_common()
+        running = {str(x) for x in range(6)}
+        common.get_resource.side_effect = lambda **kwargs: (
+            {'jobId': list(running)} if (
+                kwargs['params']['status'] == 'RUNNING') else dict())
+        common._is_job_finished.return_value = (
+            True, 'done', 0, 'SUCCEEDED', None)
+        tracker = job_tracker.JobTracker(common)
+        job_futures = [tracker.track(str(x)) for x in range(7)]
+        tracker._poll(list(tracker._jobs.values()))
+        common._is_job_finished.assert_called_once_with('6')
+        self.assertEqual(
+            len(constants.INCOMPLETE_LIST), common.get_resource.call_count)
+        self.assertTrue(job_futures[6].done())
+        self.assertFalse(job_futures[0].done())
+        running.clear()
+        tracker._poll(list(tracker._jobs.values()))
+        self.assertTrue(all(f.done() for f in job_futures))
+        self.assertEqual(7, common._is_job_finished.call_count)
+        self.assertEqual({'tracked': 0, 'polls': 2, 'bulk_polls': 2,
+                          'requests': 17}, tracker.get_stats())
+
+    @mock.patch.object(job_tracker.threading, 'Thread')
+    def test_job_tracker_timeout_and_error(self, mck_thread):
+        """Test JobTracker gives up on jobs and reports errors."""
+        common = self._get_job_tracker_common(retries=1)
+        common._is_job_finished.side_effect = [
+            (False, None, 0, 'RUNNING', None),
+            exception.VolumeBackendAPIException('error'),
+            (False, None, 0, 'RUNNING', None)]
+        tracker = job_tracker.JobTracker(common)
+        slow, broken = tracker.track('1'), tracker.track('2')
+        tracker._poll(list(tracker._jobs.values()))
+        self.assertIsInstance(broken.exception(),
+                              exception.VolumeBackendAPIException)
+        tracker._poll(list(tracker._jobs.values()))
+        self.assertEqual((-1, None, 'RUNNING', None), slow.result())
+        pending = tracker.track('3')
+        tracker.stop()
+        self.assertTrue(pending.cancelled())
+
+    @mock.patch.object(job_tracker.threading, 'Thread')
+    def test_job_tracker_cancelled_future(self, mck_thread):
+        """Test JobTracker finishes jobs whose futures were cancelled."""
+        common = self._get_job_tracker_common()
+        common._is_job_finished.return_value = (
+            True, 'done', 0, 'SUCCEEDED', None)
+        tracker = job_tracker.JobTracker(common)
+        future = job_tracker.JobFuture({'jobId': '1'}, 'extending volume')
+        tracked = tracker.track('1', future.set_job_outcome)
+        duplicate = tracker.track('1')
+        self.assertTrue(future.cancel())
+        self.assertTrue(duplicate.cancel())
+        tracker._poll(list(tracker._jobs.values()))
+        self.assertEqual((0, 'done', 'SUCCEEDED', None), tracked.result())
+        self.assertTrue(future.cancelled())
+        self.assertEqual(0, tracker.get_stats()['tracked'])
+        cancelled = tracker.track('2')
+        self.assertTrue(cancelled.cancel())
+        tracker._poll(list(tracker._jobs.values()))
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(0, tracker.get_stats()['tracked'])
+
+    def test_job_future_set_job_outcome(self):
+        """Test JobFuture completes from a job tracker outcome."""
+        outcome = futures.Future()
+        outcome.set_result((0, 'done', 'SUCCEEDED', ['task']))
+        future = job_tracker.JobFuture({'jobId': '1'}, 'extending volume')
+        future.set_job_outcome(outcome)
+        self.assertEqual({'jobId': '1', 'status': 'SUCCEEDED',
+                          'result': 'done', 'task': ['task']},
+                         future.result())
+        outcome = futures.Future()
+        outcome.set_result((-1, 'error', 'FAILED', None))
+        future = job_tracker.JobFuture({'jobId': '2'}, 'extending volume')
+        future.set_job_outcome(outcome)
+        self.assertIsInstance(future.exception(),
+                              exception.VolumeBackendAPIException)
+        outcome = futures.Future()
+        outcome.cancel()
+        future = job_tracker.JobFuture({'jobId': '3'})
+        future.set_job_outcome(outcome)
+        self.assertTrue(future.cancelled())
+        # A future cancelled by the caller ignores the job outcome
+        outcome = futures.Future()
+        outcome.set_result((0, 'done', 'SUCCEEDED', ['task']))
+        future = job_tracker.JobFuture({'jobId': '4'})
+        self.assertTrue(future.cancel())
+        future.set_job_outcome(outcome)
+        self.assertTrue(future.cancelled())
+
+    # utils.circuit_breaker
+    @mock.patch.object(circuit_breaker.time, 'monotonic', return_value=100)
+    def test_circuit_breaker_states(self, mck_time):
+        """Test CircuitBreaker closed, open and half-open transitions."""
+        breaker = circuit_breaker.CircuitBreaker(
+            'fake_url', failure_threshold=2, recovery_timeout=30)
+        self.assertEqual(circuit_breaker.CLOSED, breaker.state)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(circuit_breaker.OPEN, breaker.state)
+        self.assertRaises(exception.CircuitOpenException,
+                          breaker.before_request)
+        mck_time.return_value = 130
+        self.assertEqual(circuit_breaker.HALF_OPEN, breaker.state)
+        breaker.before_request()
+        self.assertRaises(exception.CircuitOpenException,
+                          breaker.before_request)
+        breaker.record_failure()
+        self.assertEqual(circuit_breaker.OPEN, breaker.state)
+        mck_time.return_value = 160
+        breaker.before_request()
+        breaker.record_success()
+        self.assertEqual(circuit_breaker.CLOSED, breaker.state)
+        self.assertEqual(0, breaker.failure_count)
+
+    @mock.patch.object(circuit_breaker.time, 'monotonic', return_value=100)
+    def test_circuit_breaker_release(self, mck_time):
+        """Test CircuitBreaker release frees a half-open trial slot."""
+        breaker = circuit_breaker.CircuitBreaker(
+            'fake_url', failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.release()
+        breaker.before_request()
+        self.assertTrue(breaker.is_failure_status(503))
+        self.assertFalse(breaker.is_failure_status(404))
+        self.assertTrue(breaker.is_failure_exception(
+            requests.exceptions.ConnectTimeout()))
+        self.assertFalse(breaker.is_failure_exception(
+            requests.exceptions.SSLError()))
+
+    def test_circuit_breaker_invalid(self):
+        """Test CircuitBreaker invalid settings."""
+        self.assertRaises(exception.InvalidInputException,
+                          circuit_breaker.CircuitBreaker, 'fake_url',
+                          failure_threshold=0)
+
+    def test_get_circuit_breaker(self):
+        """Test get_circuit_breaker returns one breaker per base url."""
+        self.addCleanup(circuit_breaker.reset_circuit_breakers)
+        breaker = circuit_breaker.get_circuit_breaker('url_1')
+        self.assertIs(breaker, circuit_breaker.get_circuit_breaker('url_1'))
+        self.assertIsNot(breaker,
+                         circuit_breaker.get_circuit_breaker('url_2'))
+
+    # utils.endpoint_pool
+    def test_endpoint_pool_select(self):
+        """Test EndpointPool select for reads and writes."""
+        pool = endpoint_pool.EndpointPool(['url_1', 'url_2'])
+        first = pool.select(read_only=True)
+        second = pool.select(read_only=True)
+        self.assertEqual(['url_1', 'url_2'],
+                         [first.base_url, second.base_url])
+        self.assertEqual('url_1', pool.select().base_url)
+        self.assertEqual('url_2', pool.select(
+            read_only=True, exclude=[pool.preferred]).base_url)
+        for endpoint in [first, second, pool.preferred, second]:
+            pool.release(endpoint)
+        self.assertEqual({'url_1': {'outstanding': 0, 'total_requests': 2,
+                                    'healthy': True},
+                          'url_2': {'outstanding': 0, 'total_requests': 2,
+                                    'healthy': True}}, pool.get_stats())
+
+    @mock.patch.object(endpoint_pool.time, 'monotonic', return_value=100)
+    def test_endpoint_pool_mark_down(self, mck_time):
+        """Test EndpointPool avoids endpoints which are marked down."""
+        pool = endpoint_pool.EndpointPool(['url_1', 'url_2'], cooldown=30)
+        pool.mark_down(pool.preferred)
+        self.assertEqual('url_2', pool.select().base_url)
+        self.assertTrue(pool.can_fail_over([pool.preferred]))
+        self.assertFalse(pool.can_fail_over(pool.endpoints[1:]))
+        mck_time.return_value = 130
+        self.assertEqual('url_1', pool.select().base_url)
+        pool.mark_down(pool.preferred)
+        pool.mark_up(pool.preferred)
+        self.assertIsNone(pool.preferred.down_until)
+
+    def test_endpoint_pool_invalid(self):
+        """Test EndpointPool requires an endpoint."""
+        self.assertRaises(exception.InvalidInputException,
+                          endpoint_pool.EndpointPool, list())
+
+    def test_is_connect_failure(self):
+        """Test is_connect_failure."""
+        new_conn = requests.exceptions.ConnectionError(
+            urllib3.exceptions.MaxRetryError(
+                None, 'url', urllib3.exceptions.NewConnectionError(
+                    None, 'refused')))
+        self.assertTrue(endpoint_pool.is_connect_failure(new_conn))
+        self.assertTrue(endpoint_pool.is_connect_failure(
+            requests.exceptions.ConnectTimeout()))
+        self.assertFalse(endpoint_pool.is_connect_failure(
+            requests.exceptions.ConnectionError('Connection aborted')))
+        self.assertFalse(endpoint_pool.is_connect_failure(
+            requests.exceptions.ReadTimeout()))
+        self.assertFalse(endpoint_pool.is_connect_failure(
+            requests.exceptions.SSLError()))
+
+    # utils.rate_limiter
+    @mock.patch.object(rate_limiter.time, 'monotonic', return_value=100)
+    def test_rate_limiter_token_bucket(self, mck_time):
+        """Test RateLimiter waits for a token once the burst is used."""
+        limiter = rate_limiter.RateLimiter(rate=2, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(0.5, limiter._get_token_delay())
+        mck_time.return_value = 100.5
+        self.assertEqual(0, limiter._get_token_delay())
+        mck_time.return_value = 110
+        limiter._get_token_delay()
+        self.assertEqual(1, limiter.tokens)
+
+    def test_rate_limiter_priority_order(self):
+        """Test RateLimiter admits waiting requests in priority order."""
+        limiter = rate_limiter.RateLimiter(max_concurrency=1)
+        limiter.acquire()
+        admitted = list()
+
+        def _acquire(priority):
+            limiter.acquire(priority)
+            admitted.append(priority)
+            limiter.release()
+
+        threads = list()
+        for priority in [rate_limiter.BACKGROUND, rate_limiter.NORMAL,
+                         rate_limiter.INTERACTIVE]:
+            thread = threading.Thread(target=_acquire, args=(priority,))
+            thread.start()
+            threads.append(thread)
+            while limiter.get_stats()[priority]['queue_depth'] < 1:
+                time.sleep(0.001)
+        limiter.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([rate_limiter.INTERACTIVE, rate_limiter.NORMAL,
+                          rate_limiter.BACKGROUND], admitted)
+        stats = limiter.get_stats()
+        self.assertEqual(0, stats['active'])
+        self.assertEqual(2, stats[rate_limiter.NORMAL]['admitted'])
+        for priority in rate_limiter.PRIORITY_CLASSES:
+            self.assertEqual(0, stats[priority]['queue_depth'])
+            self.assertEqual(1, stats[priority]['max_queue_depth'])
+        self.assertTrue(stats[rate_limiter.BACKGROUND]['max_wait'] > 0)
+
+    def test_rate_limiter_invalid(self):
+        """Test RateLimiter invalid settings and priority."""
+        self.assertRaises(exception.InvalidInputException,
+                          rate_limiter.RateLimiter, rate=0)
+        self.assertRaises(exception.InvalidInputException,
+                          rate_limiter.RateLimiter, max_concurrency=0)
+        self.assertRaises(exception.InvalidInputException,
+                          rate_limiter.RateLimiter().acquire, 'urgent')
+
+    def test_endpoint_pool_rate_limiter(self):
+        """Test EndpointPool creates a rate limiter per endpoint."""
+        self.assertIsNone(
+            endpoint_pool.EndpointPool(['url_1']).preferred.rate_limiter)
+        pool = endpoint_pool.EndpointPool(
+            ['url_1', 'url_2'], rate_limit=5, max_concurrency=2)
+        first, second = [e.rate_limiter for e in pool.endpoints]
+        self.assertIsNot(first, second)
+        self.assertEqual(5, first.rate)
+        self.assertEqual(2, first.max_concurrency)
+        self.assertIn('rate_limiter', pool.get_stats()['url_2'])
+
+    # utils.singleflight
+    def test_singleflight_coalesces_concurrent_calls(self):
+        """Test SingleFlight shares one call between concurrent callers."""
+        flight = singleflight.SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        func = mock.Mock(side_effect=lambda: (
+            started.set(), release.wait(), {'a': [1]})[2])
+        results = list()
+
+        def _call():
+            results.append(flight.do('key', func))
+
+        leader = threading.Thread(target=_call)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=_call) for __ in range(3)]
+        for follower in followers:
+            follower.start()
+        while flight.get_stats()['coalesced'] < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+        func.assert_called_once()
+        self.assertEqual([{'a': [1]}] * 4, results)
+        # Every caller, leader included, has its own copy of the result
+        self.assertEqual(4, len(set(id(result) for result in results)))
+        self.assertEqual(4, len(set(id(result['a']) for result in results)))
+        self.assertEqual({'calls': 1, 'coalesced': 3, 'in_flight': 0},
+                         flight.get_stats())
+        # Results are only copied for waiters
+        with mock.patch.object(singleflight.copy, 'deepcopy') as mck_copy:
+            flight.do('key', func)
+            mck_copy.assert_not_called()
+        self.assertEqual(2, func.call_count)
+
+    def test_singleflight_leader_deadline(self):
+        """Test waiters call again if the leader's deadline expires."""
+        flight = singleflight.SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def _leader_call():
+            started.set()
+            release.wait()
+            raise exception.DeadlineExceededException(data='leader')
+
+        func = mock.Mock(side_effect=[_leader_call, lambda: {'a': 1}])
+        errors, results = list(), list()
+
+        def _leader():
+            try:
+                flight.do('key', lambda: func()())
+            except exception.DeadlineExceededException as error:
+                errors.append(error)
+
+        leader = threading.Thread(target=_leader)
+        leader.start()
+        started.wait()
+        waiter = threading.Thread(target=lambda: results.append(
+            flight.do('key', lambda: func()())))
+        waiter.start()
+        while not flight.get_stats()['coalesced']:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        waiter.join()
+        self.assertEqual(1, len(errors))
+        self.assertEqual([{'a': 1}], results)
+        self.assertEqual(2, func.call_count)
+        self.assertEqual(0, flight.get_stats()['in_flight'])
+
+    def test_singleflight_exception(self):
+        """Test SingleFlight raises call exceptions and clears the key."""
+        flight = singleflight.SingleFlight()
+        func = mock.Mock(side_effect=exception.VolumeBackendAPIException)
+        self.assertRaises(exception.VolumeBackendAPIException,
+                          flight.do, 'key', func)
+        self.assertEqual(0, flight.get_stats()['in_flight'])
+
+    def test_singleflight_waiter_deadline(self):
+        """Test SingleFlight waiters give up when their deadline expires."""
+        flight = singleflight.SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        func = mock.Mock(side_effect=lambda: (
+            started.set(), release.wait(), {'a': 1})[2])
+        results = list()
+        leader = threading.Thread(
+            target=lambda: results.append(flight.do('key', func)))
+        leader.start()
+        started.wait()
+        try:
+            with deadline.Deadline(0.01):
+                self.assertRaises(exception.DeadlineExceededException,
+                                  flight.do, 'key', func)
+        finally:
+            release.set()
+            leader.join()
+        func.assert_called_once()
+        self.assertEqual([{'a': 1}], results)
+        self.assertEqual(0, flight.get_stats()['in_flight'])
+
+    def test_singleflight_make_key(self):
+        """Test SingleFlight make_key ignores param ordering."""
+        self.assertEqual(
+            singleflight.SingleFlight.make_key('/uri', {'a': 1, 'b': 2}),
+            singleflight.SingleFlight.make_key('/uri', {'b': 2, 'a': 1}))
+        self.assertNotEqual(
+            singleflight.SingleFlight.make_key('/uri', {'a': 1}),
+            singleflight.SingleFlight.make_key('/uri', None))
+
+    # utils.response_cache
+    @mock.patch.object(response_cache.time, 'monotonic', return_value=100)
+    def test_response_cache_ttl_and_lru(self, mck_time):
+        """Test ResponseCache expires and evicts responses."""
+        cache = response_cache.ResponseCache(max_entries=2, ttls={'job': 0})
+        load = mock.Mock(side_effect=lambda uri: {'uri': uri})
+        for uri in ['/92/system/symmetrix/1', '/92/system/symmetrix/1']:
+            self.assertEqual({'uri': uri}, cache.get_or_load(
+                uri, None, constants.SYMMETRIX, load, uri))
+        self.assertEqual(1, load.call_count)
+        cache.get_or_load('/92/system/job/1', None, 'job', load, 'j')
+        self.assertEqual(2, load.call_count)
+        cache.get_or_load('/srp/1', None, constants.SRP, load, 's1')
+        cache.get_or_load('/srp/2', None, constants.SRP, load, 's2')
+        self.assertEqual(1, cache.get_stats()['evictions'])
+        mck_time.return_value = 401
+        cache.get_or_load('/srp/2', None, constants.SRP, load, 's2')
+        self.assertEqual(5, load.call_count)
+        self.assertEqual({'size': 2, 'max_entries': 2, 'hits': 1,
+                          'misses': 4, 'hit_ratio': 0.2, 'evictions': 1,
+                          'invalidations': 0}, cache.get_stats())
+
+    def test_response_cache_invalidate(self):
+        """Test ResponseCache invalidates parents and children of a uri."""
+        cache = response_cache.ResponseCache()
+        uris = ['/92/sloprovisioning/symmetrix/1',
+                '/92/sloprovisioning/symmetrix/1/srp',
+                '/92/sloprovisioning/symmetrix/1/srp/SRP_1',
+                '/92/sloprovisioning/symmetrix/1/slo',
+                '/92/system/symmetrix/1']
+        for uri in uris:
+            cache.get_or_load(uri, None, constants.SRP, dict)
+        self.assertEqual(3, cache.invalidate(
+            '/91/sloprovisioning/symmetrix/1/srp'))
+        self.assertEqual(2, cache.invalidate())
+        load = mock.Mock(side_effect=lambda: cache.invalidate() or dict())
+        cache.get_or_load(uris[0], None, constants.SRP, load)
+        self.assertEqual(0, cache.get_stats()['size'])
+        self.assertRaises(exception.InvalidInputException,
+                          response_cache.ResponseCache, max_entries=0)
+
+    # utils.metadata_cache
+    def _get_metadata_cache(self, **kwargs):
+        """Get a metadata cache in a temporary directory."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        return metadata_cache.MetadataCache(
+            path=os.path.join(cache_dir, 'cache', 'metadata.db'), **kwargs)
+
+    def test_metadata_cache_persists(self):
+        """Test MetadataCache entries are shared between instances."""
+        cache = self._get_metadata_cache(ttls={'no_cache': 0})
+        load = mock.Mock(return_value={'symmetrixId': ['000197800123']})
+        for __ in range(2):
+            cache.get_or_load('https://u4v', None, 'array_list', None, load)
+        reopened = metadata_cache.MetadataCache(path=cache.path)
+        self.assertEqual(
+            {'symmetrixId': ['000197800123']}, reopened.get_or_load(
+                'https://u4v', None, 'array_list', None, load))
+        reopened.get_or_load('https://u4v', '1', 'array_list', None, load)
+        reopened.get_or_load(
+            'https://u4v', None, 'array_list', {'a': 1}, load)
+        self.assertEqual(3, load.call_count)
+        cache.get_or_load('https://u4v', None, 'no_cache', None, load)
+        cache.get_or_load('https://u4v', None, 'no_cache', None, load)
+        self.assertEqual(5, load.call_count)
+        self.assertEqual({'path': cache.path, 'hits': 1, 'misses': 1,
+                          'errors': 0}, cache.get_stats())
+        self.assertEqual(3, cache.invalidate(endpoint='https://u4v'))
+
+    @mock.patch.object(metadata_cache.time, 'time', return_value=100)
+    def test_metadata_cache_version_check(self, mck_time):
+        """Test MetadataCache drops entries when a version changes."""
+        cache = self._get_metadata_cache()
+        version = metadata_cache.UNISPHERE_VERSION
+        cache.get_or_load('https://u4v', None, version, None,
+                          lambda: {'version': 'V9.2.0.0'})
+        cache.get_or_load('https://u4v', '1', 'director_list', None, dict)
+        mck_time.return_value = 100 + cache.get_ttl(version) + 1
+        cache.get_or_load('https://u4v', None, version, None,
+                          lambda: {'version': 'V9.2.1.0'})
+        load = mock.Mock(return_value=dict())
+        cache.get_or_load('https://u4v', '1', 'director_list', None, load)
+        load.assert_called_once()
+        with mock.patch.object(constants, 'PYU4V_VERSION', '10.0.0.0'):
+            reopened = metadata_cache.MetadataCache(path=cache.path)
+            reopened.get_or_load('https://u4v', '1', 'director_list', None,
+                                 load)
+        self.assertEqual(2, load.call_count)
+
+    def test_metadata_cache_error(self):
+        """Test MetadataCache falls back to loading on database errors."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache = metadata_cache.MetadataCache(path=cache_dir)
+        self.assertEqual([1], cache.get_or_load(
+            'https://u4v', None, 'array_list', None, lambda: [1]))
+        self.assertEqual(1, cache.get_stats()['errors'])
+        self.assertRaises(exception.InvalidInputException,
+                          metadata_cache.MetadataCache, default_ttl=-1)
+
+    # utils.deadline
+    @mock.patch.object(deadline.time, 'monotonic', return_value=100)
+    def test_deadline_budget(self, mck_time):
+        """Test Deadline limits timeouts and nests."""
+        self.assertIsNone(deadline.get_current())
+        self.assertEqual(120, deadline.get_timeout(120))
+        with deadline.Deadline(60) as outer:
+            self.assertEqual(60, deadline.get_timeout(120))
+            with deadline.Deadline(90):
+                self.assertEqual(60, deadline.get_remaining())
+            with deadline.Deadline(10):
+                self.assertEqual(10, deadline.get_remaining())
+            with deadline.Deadline():
+                self.assertEqual(60, deadline.get_remaining())
+            self.assertIs(outer, deadline.get_current())
+            mck_time.return_value = 150
+            self.assertEqual(5, deadline.get_timeout(5))
+            self.assertRaises(exception.DeadlineExceededException,
+                              deadline.check, 'a retry', 10)
+            mck_time.return_value = 160
+            self.assertTrue(deadline.is_expired())
+            self.assertRaises(exception.DeadlineExceededException,
+                              deadline.get_timeout, 5)
+        self.assertIsNone(deadline.get_current())
+        self.assertRaises(exception.InvalidInputException,
+                          deadline.Deadline, 0)
+
+    def test_deadline_wrap_and_decorator(self):
+        """Test deadlines are carried to worker threads and decorators."""
+        results = list()
+
+        @deadline.with_deadline
+        def _operation(value, deadline=None):
+            worker = threading.Thread(target=deadline_wrap(
+                lambda: results.append(deadline_current())))
+            worker.start()
+            worker.join()
+            return value
+
+        deadline_wrap, deadline_current = deadline.wrap, deadline.get_current
+        self.assertEqual(1, _operation(1, 30))
+        self.assertEqual(2, _operation(2, deadline=30))
+        self.assertEqual(3, _operation(3))
+        self.assertEqual(30, results[0].timeout)
+        self.assertEqual(30, results[1].timeout)
+        self.assertIsNone(results[2])
+
+    def test_rate_limiter_acquire_timeout(self):
+        """Test RateLimiter stops waiting after the timeout."""
+        limiter = rate_limiter.RateLimiter(max_concurrency=1)
+        limiter.acquire()
+        self.assertRaises(exception.DeadlineExceededException,
+                          limiter.acquire, timeout=0.01)
+        limiter.release()
+        limiter.acquire(timeout=0.01)
+        self.assertEqual(0, limiter.get_stats()[
+            rate_limiter.NORMAL]['queue_depth'])
+
+    @mock.patch('time.time', return_value=1000)
+    def test_performance_key_cache(self, mck_time):
+        """Test PerformanceKeyCache index, expiry and reloads."""
+        cache = performance_key_cache.PerformanceKeyCache(
+            interval=300, delay=30)
+        key_list = {'storageGroupInfo': [
+            {'storageGroupId': 'SG1', 'firstAvailableDate': 1,
+             'lastAvailableDate': 2},
+            {'storageGroupId': 'SG10', 'firstAvailableDate': 3,
+             'lastAvailableDate': 4}]}
+        load = mock.MagicMock(return_value=key_list)
+        self.assertEqual(1230, cache.get_expiry())
+        self.assertEqual((1, 2), cache.get_timestamps(
+            '000', 'StorageGroup', None, 'SG1', load))
+        self.assertEqual((3, 4), cache.get_timestamps(
+            '000', 'STORAGEGROUP', None, 'SG10', load))
+        self.assertEqual((3, 4), cache.get_timestamps(
+            '000', 'StorageGroup', None, 'G10', load))
+        self.assertEqual(1, load.call_count)
+        # Objects not in the cached key list cause a reload
+        self.assertEqual((None, None), cache.get_timestamps(
+            '000', 'StorageGroup', None, 'SG2', load))
+        self.assertEqual(2, load.call_count)
+        mck_time.return_value = 1230
+        cache.get_timestamps('000', 'StorageGroup', None, 'SG1', load)
+        self.assertEqual(3, load.call_count)
+        self.assertEqual({'size': 1, 'hits': 2, 'misses': 3},
+                         cache.get_stats())
+        self.assertEqual(1, cache.invalidate('000'))
+        self.assertRaises(exception.InvalidInputException,
+                          performance_key_cache.PerformanceKeyCache,
+                          interval=300, delay=300)
+
+    def test_performance_collector_watermarks(self):
+        """Test PerformanceCollector collects only data after watermarks."""
+        state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_dir)
+        state_file = os.path.join(state_dir, 'state.json')
+        last_time = 1600000200000
+        object_keys = {
+            sg: {pc.SG_ID: sg, pc.FA_DATE: 1500000000000,
+                 pc.LA_DATE: last_time} for sg in ('SG1', 'SG2')}
+        performance = mock.MagicMock(array_id=pcd.CommonData.array)
+        performance.get_last_available_timestamp.return_value = last_time
+        performance.get_category_object_keys.return_value = object_keys
+        error = exception.VolumeBackendAPIException()
+        performance.get_bulk_stats.side_effect = [
+            {'SG1': {'result': list()}, 'SG2': error},
+            {'SG2': {'result': list()}}]
+        collector = performance_collector.PerformanceCollector(
+            performance, state_file=state_file)
+
+        self.assertEqual({'SG1': {'result': list()}, 'SG2': error},
+                         collector.collect('storagegroup'))
+        performance.get_bulk_stats.assert_called_with(
+            pc.SG, object_ids=['SG1', 'SG2'], metrics=pc.KPI,
+            director_id=None, array_id=pcd.CommonData.array,
+            data_format=pc.AVERAGE, start_time=last_time - pc.ONE_HOUR,
+            end_time=last_time, max_workers=None, result_format=pc.ROWS,
+            object_keys=object_keys)
+        # Watermarks are loaded from the state file, failed objects retry
+        collector = performance_collector.PerformanceCollector(
+            performance, state_file=state_file)
+        self.assertEqual(last_time, collector.get_watermark(pc.SG, 'SG1'))
+        self.assertIsNone(collector.get_watermark(pc.SG, 'SG2'))
+        collector.collect(pc.SG)
+        performance.get_bulk_stats.assert_called_with(
+            pc.SG, object_ids=['SG2'], metrics=pc.KPI, director_id=None,
+            array_id=pcd.CommonData.array, data_format=pc.AVERAGE,
+            start_time=last_time - pc.ONE_HOUR, end_time=last_time,
+            max_workers=None, result_format=pc.ROWS, object_keys=object_keys)
+        # No new data on the array, nothing else is requested
+        performance.get_category_object_keys.reset_mock()
+        self.assertEqual(dict(), collector.collect(pc.SG, ['SG1', 'SG2']))
+        performance.get_category_object_keys.assert_not_called()
+        self.assertEqual(2, performance.get_bulk_stats.call_count)
+        # New data is collected from after the watermark
+        next_time = last_time + 5 * pc.ONE_MINUTE
+        performance.get_last_available_timestamp.return_value = next_time
+        for keys in object_keys.values():
+            keys[pc.LA_DATE] = next_time
+        performance.get_bulk_stats.side_effect = None
+        performance.get_bulk_stats.return_value = dict()
+        collector.collect(pc.SG, 'SG1')
+        performance.get_bulk_stats.assert_called_with(
+            pc.SG, object_ids=['SG1'], metrics=pc.KPI, director_id=None,
+            array_id=pcd.CommonData.array, data_format=pc.AVERAGE,
+            start_time=last_time + pc.ONE_MINUTE, end_time=next_time,
+            max_workers=None, result_format=pc.ROWS, object_keys=object_keys)
+        collector.reset(pc.SG)
+        self.assertIsNone(collector.get_watermark(pc.SG, 'SG1'))
+
+    def _get_performance_collector(self, last_time, object_keys):
+        """Get a performance collector with a mock performance class."""
+        state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_dir)
+        performance = mock.MagicMock(array_id=pcd.CommonData.array)
+        performance.get_last_available_timestamp.return_value = last_time
+        performance.get_category_object_keys.return_value = object_keys
+        return performance_collector.PerformanceCollector(
+            performance, state_file=os.path.join(state_dir, 'state.json'))
+
+    def test_performance_collector_no_data(self):
+        """Test PerformanceCollector with no performance data on the array."""
+        collector = self._get_performance_collector(None, dict())
+        self.assertEqual(dict(), collector.collect(pc.SG))
+        collector.performance.get_category_object_keys.assert_not_called()
+        collector.performance.get_bulk_stats.assert_not_called()
+        self.assertFalse(os.path.exists(collector.state_file))
+
+    def test_performance_collector_failed_object(self):
+        """Test PerformanceCollector keeps the watermark of failed objects."""
+        last_time = 1600000200000
+        object_keys = {'SG1': {pc.SG_ID: 'SG1', pc.FA_DATE: 1500000000000,
+                               pc.LA_DATE: last_time}}
+        collector = self._get_performance_collector(last_time, object_keys)
+        collector.watermarks = {pcd.CommonData.array: {
+            pc.SG: {'SG1': last_time - pc.ONE_HOUR}}}
+        error = exception.VolumeBackendAPIException()
+        collector.performance.get_bulk_stats.return_value = {'SG1': error}
+        self.assertEqual({'SG1': error}, collector.collect(pc.SG))
+        self.assertEqual(last_time - pc.ONE_HOUR,
+                         collector.get_watermark(pc.SG, 'SG1'))
+        collector.collect(pc.SG)
+        self.assertEqual(2, collector.performance.get_bulk_stats.call_count)
+        collector.performance.get_bulk_stats.assert_called_with(
+            pc.SG, object_ids=['SG1'], metrics=pc.KPI, director_id=None,
+            array_id=pcd.CommonData.array, data_format=pc.AVERAGE,
+            start_time=last_time - pc.ONE_HOUR + pc.ONE_MINUTE,
+            end_time=last_time, max_workers=None, result_format=pc.ROWS,
+            object_keys=object_keys)
+
+    def test_performance_collector_corrupt_state(self):
+        """Test PerformanceCollector starts afresh from a corrupt state."""
+        collector = self._get_performance_collector(None, dict())
+        for state in ('{"version": 1, "water', '["SG1"]',
+                      '{"version": 99, "watermarks": {"000": {}}}'):
+            with open(collector.state_file, 'w') as state_file:
+                state_file.write(state)
+            collector = performance_collector.PerformanceCollector(
+                collector.performance, state_file=collector.state_file)
+            self.assertEqual(dict(), collector.watermarks)
+        collector.watermarks = {pcd.CommonData.array: {pc.SG: {'SG1': 1}}}
+        collector.save()
+        collector = performance_collector.PerformanceCollector(
+            collector.performance, state_file=collector.state_file)
+        self.assertEqual(1, collector.get_watermark(pc.SG, 'SG1'))
+        self.assertFalse(os.path.exists(collector.state_file + '.tmp'))
+
+    def test_performance_collector_explicit_ids(self):
+        """Test PerformanceCollector skips requested objects up to date."""
+        last_time = 1600000200000
+        collector = self._get_performance_collector(last_time, dict())
+        collector.watermarks = {pcd.CommonData.array: {
+            pc.SG: {'SG1': last_time, 'SG2': last_time - pc.ONE_MINUTE}}}
+        self.assertEqual(dict(), collector.collect(pc.SG, 'SG1'))
+        collector.performance.get_category_object_keys.assert_not_called()
+        collector.performance.get_bulk_stats.assert_not_called()
+        collector.performance.get_bulk_stats.return_value = dict()
+        collector.collect(pc.SG, ['SG1', 'SG2'])
+        collector.performance.get_category_object_keys.assert_called_once()
+        collector.performance.get_bulk_stats.assert_called_once_with(
+            pc.SG, object_ids=['SG2'], metrics=pc.KPI, director_id=None,
+            array_id=pcd.CommonData.array, data_format=pc.AVERAGE,
+            start_time=last_time, end_time=last_time, max_workers=None,
+            result_format=pc.ROWS, object_keys=dict())
+
+    # utils.columnar
+    @mock.patch.object(columnar, 'numpy', pf.FakeNumpy())
+    def test_columnar_build_columns(self):
+        """Test build_columns grows, fills and trims the metric arrays."""
+        results = [{pc.TIMESTAMP: 1000 + x, 'HostIOs': float(x)} for x in (
+            range(5))]
+        results[2]['PercentBusy'] = 0.5
+        for count in (None, 2, 5, 8):
+            columns = columnar.build_columns(
+                iter(results), ['HostIOs', 'PercentBusy'], count=count)
+            self.assertEqual([1000, 1001, 1002, 1003, 1004],
+                             columns[pc.TIMESTAMP].tolist())
+            self.assertEqual('int64', columns[pc.TIMESTAMP].dtype)
+            self.assertEqual([0.0, 1.0, 2.0, 3.0, 4.0],
+                             columns['HostIOs'].tolist())
+            self.assertEqual('float64', columns['PercentBusy'].dtype)
+            self.assertEqual([True, True, False, True, True],
+                             columnar.numpy.isnan(columns['PercentBusy']))
+        columns = columnar.build_columns(iter(list()), ['HostIOs'])
+        self.assertEqual(list(), columns['HostIOs'].tolist())
+        self.assertEqual(list(), columns[pc.TIMESTAMP].tolist())
@@ -0,0 +1,114 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+JSON codec benchmark.
+
+Compares the wire size and CPU time of the legacy indented and key sorted
+request serialization against the compact codecs in PyU4V.utils.json_codec
+using the largest payloads PyU4V builds. No array connection is required.
+
+Usage: python -m PyU4V.tools.benchmark_json_codec [iterations]
+"""
+
+from __future__ import print_function
+
+import json
+import sys
+import timeit
+
+from PyU4V.utils import json_codec
+from PyU4V.utils import performance_category_map
+
+LEGACY = 'legacy'
+DEFAULT_ITERATIONS = 200
+
+
+def build_performance_payload():
+    """Build the largest performance request body, all metrics for Array.
+
+    :returns: request body -- dict
+    """
+    category = performance_category_map.performance_data['ARRAY']
+    return {'symmetrixId': '000197800123',
+            'startDate': 1600000000000, 'endDate': 1600086400000,
+            'dataFormat': 'Average', 'metrics': category['metrics_all']}
+
+
+def build_bulk_volume_payload(count=1000):
+    """Build a bulk volume payload, as returned by an iterator page.
+
+    :param count: number of volumes -- int
+    :returns: response body -- dict
+    """
+    return {'count': count, 'from': 1, 'to': count, 'maxPageSize': count,
+            'resultList': {'result': [
+                {'volumeId': '{:05X}'.format(i), 'wwn': '6000097000019780'
+                 '0123533030{:06X}'.format(i), 'cap_gb': 10.0,
+                 'allocated_percent': i % 100, 'type': 'TDEV',
+                 'emulation': 'FBA', 'status': 'Ready', 'reserved': False,
+                 'pinned': False, 'encapsulated': False,
+                 'storageGroupId': ['sg_{}'.format(i % 50)]}
+                for i in range(count)]}}
+
+
+def get_encoders():
+    """Get the encoders to benchmark, keyed by name.
+
+    :returns: encoders -- dict
+    """
+    encoders = {LEGACY: lambda obj: json.dumps(obj, sort_keys=True, indent=4)}
+    for name in json_codec.CODECS:
+        try:
+            encoders[name] = json_codec.get_codec(name).dumps
+        except Exception:
+            print('Skipping codec {n}, it is not installed.'.format(n=name))
+    return encoders
+
+
+def benchmark_payload(label, payload, iterations):
+    """Print size and encode/decode timings for a payload.
+
+    :param label: payload description -- str
+    :param payload: payload -- dict
+    :param iterations: iterations per measurement -- int
+    """
+    print('\n{label}'.format(label=label))
+    print('{:<8} {:>10} {:>12} {:>12}'.format(
+        'codec', 'bytes', 'encode us', 'decode us'))
+    for name, dumps in get_encoders().items():
+        body = dumps(payload)
+        size = len(body.encode() if isinstance(body, str) else body)
+        loads = json.loads if name == LEGACY else (
+            json_codec.CODECS[name].loads)
+        encode = timeit.timeit(
+            lambda: dumps(payload), number=iterations) / iterations
+        decode = timeit.timeit(
+            lambda: loads(body), number=iterations) / iterations
+        print('{:<8} {:>10} {:>12.1f} {:>12.1f}'.format(
+            name, size, encode * 1e6, decode * 1e6))
+
+
+def main(iterations=DEFAULT_ITERATIONS):
+    """Run the benchmark.
+
+    :param iterations: iterations per measurement -- int
+    """
+    benchmark_payload('Performance request, Array metrics=ALL',
+                      build_performance_payload(), iterations)
+    benchmark_payload('Bulk volume iterator page, 1000 volumes',
+                      build_bulk_volume_payload(), iterations)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS)
@@ -48,6 +48,119 @@ PORT = constants.PORT
 VERIFY = constants.VERIFY
 
 
+def load_connection_settings(
+        username=None, password=None, server_ip=None, port=None, verify=None,
+        array_id=None, remote_array=None, remote_array_2=None):
+    """Load connection settings from input parameters and PyU4V.conf.
+
+    Input parameters take precedence over settings in PyU4V.conf.
+
+    :param username: Unisphere username -- str
+    :param password: Unisphere password -- str
+    :param server_ip: Unisphere server IP address -- str
+    :param port: Unisphere server port -- str
+    :param verify: SSL verification setting -- bool or str
+    :param array_id: array serial number -- str
+    :param remote_array: remote array serial number -- str
+    :param remote_array_2: second remote array serial number -- str
+    :returns: connection settings -- dict
+    :raises: MissingConfigurationException
+    """
+    config = config_handler.set_logger_and_config(file_path)
+    # Set array ID
+    if not array_id:
+        try:
+            array_id = config.get(SETUP, ARRAY)
+        except Exception:
+            LOG.warning(
+                'No array id specified. Please set array ID using '
+                'U4VConn.set_array_id(array_id).')
+    # Set environment config
+    if config is not None:
+        if not username:
+            username = config.get(SETUP, USERNAME)
+        if not password:
+            password = config.get(SETUP, PASSWORD)
+        if not server_ip:
+            server_ip = config.get(SETUP, SERVER_IP)
+        if not port:
+            port = config.get(SETUP, PORT)
+        # Optional Parameters for SRDF Remote array configurations
+        if not remote_array and config.has_option(SETUP, R_ARRAY):
+            remote_array = config.get(SETUP, R_ARRAY)
+        if not remote_array_2 and config.has_option(SETUP, R_ARRAY_2):
+            remote_array_2 = config.get(SETUP, R_ARRAY_2)
+
+    # Set verification
+    if verify is None:
+        try:
+            verify = config.get(SETUP, VERIFY)
+            if verify.lower() == 'false':
+                verify = False
+            elif verify.lower() == 'true':
+                verify = True
+        except Exception:
+            verify = True
+    if None in [username, password, server_ip, port]:
+        raise exception.MissingConfigurationException
+
+    return {USERNAME: username, PASSWORD: password, SERVER_IP: server_ip,
+            PORT: port, VERIFY: verify, ARRAY: array_id,
+            R_ARRAY: remote_array, R_ARRAY_2: remote_array_2}
+
+
+def parse_endpoint(endpoint, default_port=None):
+    """Parse a Unisphere endpoint into server IP and port.
+
+    :param endpoint: endpoint, "ip:port", "ip" or (ip, port) -- str or tuple
+    :param default_port: port used if the endpoint has none -- str
+    :returns: server IP, port -- str, str
+    """
+    if isinstance(endpoint, str):
+        host, sep, port = endpoint.rpartition(':')
+        if not sep or (host.count(':') and not host.endswith(']')):
+            host, port = endpoint, default_port
+    else:
+        host, port = endpoint
+    return str(host).strip('[]'), str(port) if port else port
+
+
+def build_base_urls(server_ip, port, endpoints=None):
+    """Build the Unisphere base urls for a connection.
+
+    :param server_ip: preferred Unisphere server IP address -- str
+    :param port: preferred Unisphere server port -- str
+    :param endpoints: additional Unisphere servers managing the same arrays,
+                      each "ip:port" or (ip, port) -- list
+    :returns: base urls in order of preference -- list
+    """
+    servers = [(str(server_ip), str(port))]
+    for endpoint in endpoints if endpoints else list():
+        server = parse_endpoint(endpoint, port)
+        if server not in servers:
+            servers.append(server)
+    return ['https://{server_ip}:{port}/univmax/restapi'.format(
+        server_ip='[{ip}]'.format(ip=ip) if ':' in ip else ip, port=p)
+        for ip, p in servers]
+
+
+def check_unisphere_version(uni_ver, major_ver):
+    """Check a Unisphere version against the minimum supported version.
+
+    :param uni_ver: Unisphere version e.g. "V9.2.0.0" -- str
+    :param major_ver: Unisphere major version e.g. "92" -- str
+    :raises: SystemExit
+    """
+    if int(major_ver) < int(constants.UNISPHERE_VERSION):
+        msg = ('Unisphere version {uv} does not meet the minimum '
+               'requirement of v9.2.0.x Please upgrade your version of '
+               'Unisphere to use this SDK. Exiting...'.format(uv=uni_ver))
+        sys.exit(msg)
+    else:
+        LOG.debug('Unisphere version {uv} passes minimum requirement '
+                  'check.'.format(uv=uni_ver))
+
+
 class U4VConn(object):
     """U4VConn."""
 
@@ -56,63 +169,110 @@ class U4VConn(object):
                  u4v_version=constants.UNISPHERE_VERSION,
                  interval=5, retries=200, array_id=None,
                  application_type=app_type, remote_array=None,
-                 remote_array_2=None):
-        """__init__."""
-        config = config_handler.set_logger_and_config(file_path)
+                 remote_array_2=None, pool_connections=None,
+                 pool_maxsize=None, pool_block=False,
+                 session_mode=constants.SHARED_SESSION, json_codec_name=None,
+                 retry_policy=None, circuit_breaker=False,
+                 breaker_failure_threshold=(
+                     constants.DEFAULT_BREAKER_FAILURE_THRESHOLD),
+                 breaker_recovery_timeout=(
+                     constants.DEFAULT_BREAKER_RECOVERY_TIMEOUT),
+                 endpoints=None,
+                 endpoint_cooldown=constants.DEFAULT_ENDPOINT_COOLDOWN,
+                 coalesce_requests=True, rate_limit=None, rate_burst=None,
+                 max_concurrency=None, download_chunk_size=None,
+                 polling_policy=None, response_cache=None,
+                 metadata_cache=None):
+        """__init__.
+
+        :param pool_connections: number of connection pools to cache -- int
+        :param pool_maxsize: max connections kept alive per pool -- int
+        :param pool_block: block when the pool has no free connections
+                           instead of opening a throwaway one -- bool
+        :param session_mode: 'shared' to use one session across all threads
+                             or 'thread' for a session per thread, both modes
+                             share the same connection pool -- str
+        :param json_codec_name: JSON codec used for request and response
+                                bodies, one of 'auto', 'json' or 'orjson',
+                                'auto' uses orjson if installed -- str
+        :param retry_policy: transport retry policy, defaults to retrying
+                             GET requests up to three times, pass
+                             RetryPolicy(total_attempts=1) to disable
+                             retries -- RetryPolicy
+        :param circuit_breaker: fail fast with CircuitOpenException while
+                                the Unisphere server is failing, the breaker
+                                is shared by all clients of the server --
+                                bool
+        :param breaker_failure_threshold: consecutive failures before the
+                                          circuit opens -- int
+        :param breaker_recovery_timeout: seconds before an open circuit
+                                         allows a trial request -- float
+        :param endpoints: additional Unisphere servers which manage the same
+                          arrays, each "ip:port" or (ip, port), reads are
+                          spread across healthy servers by least outstanding
+                          requests and writes fail over when the preferred
+                          server is unreachable -- list
+        :param endpoint_cooldown: seconds an unreachable server is avoided
+                                  -- float
+        :param coalesce_requests: concurrent identical GET requests share a
+                                  single call to Unisphere -- bool
+        :param rate_limit: maximum requests per second to each Unisphere
+                           server, waiting requests are admitted in order of
+                           priority, interactive provisioning calls before
+                           background performance collection -- float
+        :param rate_burst: requests which may be sent at once before the
+                           rate limit applies -- int
+        :param max_concurrency: maximum requests in progress to each
+                                Unisphere server -- int
+        :param download_chunk_size: bytes read at a time when writing
+                                    downloaded files to disk -- int
+        :param polling_policy: asynchronous job polling policy, defaults to
+                               a first check after 0.5 seconds doubling up
+                               to interval seconds -- PollingPolicy
+        :param response_cache: cache of slow changing GET responses such as
+                               arrays, SRPs and service levels, entries are
+                               invalidated by writes to the same uri prefix
+                               -- ResponseCache
+        :param metadata_cache: persistent cache of static metadata such as
+                               the Unisphere version, array list, director
+                               and port lists and performance keys, shared
+                               between process runs -- MetadataCache
+        """
+        if endpoints and not server_ip:
+            server_ip, port = parse_endpoint(endpoints[0], port)
+        settings = load_connection_settings(
+            username=username, password=password, server_ip=server_ip,
+            port=port, verify=verify, array_id=array_id,
+            remote_array=remote_array, remote_array_2=remote_array_2)
         self.end_date = int(round(time.time() * 1000))
         self.start_date = (self.end_date - 3600000)
-        self.array_id = array_id
-        # Set array ID
-        if not self.array_id:
-            try:
-                self.array_id = config.get(SETUP, ARRAY)
-            except Exception:
-                LOG.warning(
-                    'No array id specified. Please set array ID using '
-                    'U4VConn.set_array_id(array_id).')
-        # Set environment config
-        if config is not None:
-            if not username:
-                username = config.get(SETUP, USERNAME)
-            if not password:
-                password = config.get(SETUP, PASSWORD)
-            if not server_ip:
-                server_ip = config.get(SETUP, SERVER_IP)
-            if not port:
-                port = config.get(SETUP, PORT)
-            # Optional Parameters for SRDF Remote array configurations
-            if config.has_option(SETUP, R_ARRAY):
-                if not remote_array:
-                    self.remote_array = config.get(SETUP, R_ARRAY)
-            else:
-                self.remote_array = None
-            if config.has_option(SETUP, R_ARRAY_2):
-                if not remote_array_2:
-                    self.remote_array_2 = config.get(SETUP, R_ARRAY_2)
-            else:
-                self.remote_array_2 = None
-
-        # Set verification
-        if verify is None:
-            try:
-                verify = config.get(SETUP, VERIFY)
-                if verify.lower() == 'false':
-                    verify = False
-                elif verify.lower() == 'true':
-                    verify = True
-            except Exception:
-                verify = True
-        if None in [username, password, server_ip, port]:
-            raise exception.MissingConfigurationException
+        self.array_id = settings[ARRAY]
+        self.remote_array = settings[R_ARRAY]
+        self.remote_array_2 = settings[R_ARRAY_2]
+        username, password = settings[USERNAME], settings[PASSWORD]
+        verify = settings[VERIFY]
         # Initialise REST session
-        base_url = 'https://{server_ip}:{port}/univmax/restapi'.format(
-            server_ip=server_ip, port=port)
+        base_url = build_base_urls(
+            settings[SERVER_IP], settings[PORT], endpoints)
 
         self.rest_client = RestRequests(
             username, password, verify, base_url, interval, retries,
-            application_type)
+            application_type, pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize, pool_block=pool_block,
+            session_mode=session_mode, json_codec_name=json_codec_name,
+            retry_policy=retry_policy, circuit_breaker=circuit_breaker,
+            breaker_failure_threshold=breaker_failure_threshold,
+            breaker_recovery_timeout=breaker_recovery_timeout,
+            endpoint_cooldown=endpoint_cooldown,
+            coalesce_requests=coalesce_requests, rate_limit=rate_limit,
+            rate_burst=rate_burst, max_concurrency=max_concurrency,
+            download_chunk_size=download_chunk_size,
+            polling_policy=polling_policy, response_cache=response_cache,
+            metadata_cache=metadata_cache)
         self.request = self.rest_client.rest_request
         self.common = CommonFunctions(self.rest_client)
+        # One job tracker polls the jobs of every function class
+        self.job_tracker = self.rest_client.get_job_tracker(self.common)
         self.provisioning = ProvisioningFunctions(self.array_id,
                                                   self.rest_client)
         self.performance = PerformanceFunctions(self.array_id,
@@ -162,11 +322,4 @@ class U4VConn(object):
         :raises: SystemExit
         """
         uni_ver, major_ver = self.common.get_uni_version()
-        if int(major_ver) < int(constants.UNISPHERE_VERSION):
-            msg = ('Unisphere version {uv} does not meet the minimum '
-                   'requirement of v9.2.0.x Please upgrade your version of '
-                   'Unisphere to use this SDK. Exiting...'.format(uv=uni_ver))
-            sys.exit(msg)
-        else:
-            LOG.debug('Unisphere version {uv} passes minimum requirement '
-                      'check.'.format(uv=uni_ver))
+        check_unisphere_version(uni_ver, major_ver)
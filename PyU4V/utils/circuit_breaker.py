@@ -0,0 +1,194 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""circuit_breaker.py."""
+
+import logging
+import threading
+import time
+
+import requests.exceptions as r_exc
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+CLOSED = constants.CIRCUIT_CLOSED
+OPEN = constants.CIRCUIT_OPEN
+HALF_OPEN = constants.CIRCUIT_HALF_OPEN
+
+_breakers = dict()
+_breakers_lock = threading.Lock()
+
+
+class CircuitBreaker(object):
+    """Circuit breaker for a single Unisphere server.
+
+    The circuit is closed while requests succeed. Once failure_threshold
+    consecutive requests fail the circuit opens and requests fail fast with
+    CircuitOpenException. After recovery_timeout seconds the circuit is
+    half-open and a limited number of trial requests are let through, a
+    successful trial closes the circuit and a failed one opens it again.
+    """
+
+    def __init__(self, name,
+                 failure_threshold=constants.DEFAULT_BREAKER_FAILURE_THRESHOLD,
+                 recovery_timeout=constants.DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+                 half_open_max_calls=constants.DEFAULT_BREAKER_HALF_OPEN_CALLS,
+                 failure_status_codes=constants.DEFAULT_RETRY_STATUS_CODES):
+        """__init__.
+
+        :param name: circuit name, the Unisphere base url -- str
+        :param failure_threshold: consecutive failures before the circuit
+                                  opens -- int
+        :param recovery_timeout: seconds before an open circuit lets a trial
+                                 request through -- float
+        :param half_open_max_calls: concurrent trial requests allowed while
+                                    half-open -- int
+        :param failure_status_codes: response status codes counted as
+                                     failures -- list
+        :raises: InvalidInputException
+        """
+        if int(failure_threshold) < 1 or int(half_open_max_calls) < 1 or (
+                recovery_timeout < 0):
+            msg = ('Circuit breaker failure_threshold and half_open_max_calls '
+                   'must be at least 1 and recovery_timeout cannot be '
+                   'negative.')
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.name = name
+        self.failure_threshold = int(failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = int(half_open_max_calls)
+        self.failure_status_codes = list(failure_status_codes)
+        self.failure_count = 0
+        self.opened_at = None
+        self._state = CLOSED
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Get the current circuit state.
+
+        :returns: state, one of closed, open or half-open -- str
+        """
+        with self._lock:
+            return self._get_state()
+
+    def _get_state(self):
+        """Get the current circuit state, lock must be held.
+
+        :returns: state -- str
+        """
+        if self._state == OPEN and (
+                time.monotonic() - self.opened_at >= self.recovery_timeout):
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+            LOG.info('Circuit breaker for {n} is half-open, allowing trial '
+                     'requests.'.format(n=self.name))
+        return self._state
+
+    def before_request(self):
+        """Check a request may be sent.
+
+        :raises: CircuitOpenException
+        """
+        with self._lock:
+            state = self._get_state()
+            if state == CLOSED:
+                return
+            if (state == HALF_OPEN
+                    and self._half_open_calls < self.half_open_max_calls):
+                self._half_open_calls += 1
+                return
+        raise exception.CircuitOpenException(data=self.name)
+
+    def is_failure_status(self, status_code):
+        """Check if a response status code counts as a failure.
+
+        :param status_code: status code -- int
+        :returns: failure -- bool
+        """
+        return status_code in self.failure_status_codes
+
+    @staticmethod
+    def is_failure_exception(error):
+        """Check if a transport exception counts as a failure.
+
+        SSL errors are configuration problems rather than server health
+        problems so they do not count towards opening the circuit.
+
+        :param error: exception raised by the request -- Exception
+        :returns: failure -- bool
+        """
+        return isinstance(error, (r_exc.Timeout, r_exc.ConnectionError)) and (
+            not isinstance(error, r_exc.SSLError))
+
+    def record_success(self):
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            if self._state != CLOSED:
+                LOG.info('Circuit breaker for {n} is closed.'.format(
+                    n=self.name))
+            self._state = CLOSED
+            self.failure_count = 0
+            self._half_open_calls = 0
+
+    def release(self):
+        """Release a trial request slot without recording an outcome."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_failure(self):
+        """Record a failed request, opening the circuit if required."""
+        with self._lock:
+            self.failure_count += 1
+            if self._state == HALF_OPEN or (
+                    self.failure_count >= self.failure_threshold):
+                if self._state != OPEN:
+                    LOG.warning(
+                        'Circuit breaker for {n} is open after {c} '
+                        'consecutive failures, requests will fail fast for '
+                        '{t} seconds.'.format(
+                            n=self.name, c=self.failure_count,
+                            t=self.recovery_timeout))
+                self._state = OPEN
+                self.opened_at = time.monotonic()
+                self._half_open_calls = 0
+
+
+def get_circuit_breaker(base_url, **kwargs):
+    """Get the circuit breaker shared by all clients of a Unisphere server.
+
+    The breaker is created with the supplied settings on first use, later
+    calls for the same base url return the existing breaker.
+
+    :param base_url: Unisphere base url -- str
+    :param kwargs: CircuitBreaker settings -- dict
+    :returns: circuit breaker -- CircuitBreaker
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(base_url)
+        if not breaker:
+            breaker = CircuitBreaker(base_url, **kwargs)
+            _breakers[base_url] = breaker
+        return breaker
+
+
+def reset_circuit_breakers():
+    """Remove all shared circuit breakers."""
+    with _breakers_lock:
+        _breakers.clear()
@@ -0,0 +1,84 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""columnar.py."""
+
+import logging
+
+from PyU4V.utils import exception
+from PyU4V.utils import performance_constants as pc
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LOG = logging.getLogger(__name__)
+
+NUMPY = 'numpy'
+# Initial capacity of the arrays if the number of results is unknown
+DEFAULT_CAPACITY = 1000
+
+
+def check_available():
+    """Check that NumPy is installed.
+
+    :raises: MissingDependencyException
+    """
+    if numpy is None:
+        raise exception.MissingDependencyException(data=NUMPY)
+
+
+def build_columns(results, metrics, count=None):
+    """Build NumPy arrays from performance results.
+
+    Results are copied into the arrays one at a time as they are iterated,
+    so when results are yielded page by page the rows of only one page are
+    held in memory. Missing metric values are NaN.
+
+    :param results: performance results, one dict per timestamp -- iterable
+    :param metrics: metric names -- list
+    :param count: number of results if known, used to size the arrays --
+                  int
+    :returns: int64 timestamp array and a float64 array per metric keyed by
+              metric name -- dict
+    :raises: MissingDependencyException
+    """
+    check_available()
+    capacity = count if count else DEFAULT_CAPACITY
+    timestamps = numpy.empty(capacity, dtype=numpy.int64)
+    columns = {metric: numpy.full(capacity, numpy.nan, dtype=numpy.float64)
+               for metric in metrics}
+    size = 0
+    for result in results:
+        if size == capacity:
+            # More results than expected, grow the arrays
+            capacity *= 2
+            timestamps.resize(capacity, refcheck=False)
+            for column in columns.values():
+                column.resize(capacity, refcheck=False)
+                column[size:] = numpy.nan
+        timestamps[size] = result.get(pc.TIMESTAMP)
+        for metric, column in columns.items():
+            value = result.get(metric)
+            if value is not None:
+                column[size] = value
+        size += 1
+    LOG.debug('Built {cnt} metric columns of {size} results.'.format(
+        cnt=len(columns), size=size))
+    if size != capacity:
+        timestamps.resize(size, refcheck=False)
+        for column in columns.values():
+            column.resize(size, refcheck=False)
+    columns[pc.TIMESTAMP] = timestamps
+    return columns
@@ -37,6 +37,36 @@ APP_TYPE = 'application-type'
 APP_JSON = 'application/json'
 APP_OCT = 'application/octet-stream'
 APP_MPART = 'multipart/form-data'
+GZIP_DEFLATE = 'gzip, deflate'
+STREAM_CHUNK_SIZE = 65536
+DOWNLOAD_CHUNK_SIZE = 1048576
+
+# Transport constants
+SHARED_SESSION = 'shared'
+THREAD_SESSION = 'thread'
+SESSION_MODES = [SHARED_SESSION, THREAD_SESSION]
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_MAX_BACKOFF = 10
+DEFAULT_RETRY_STATUS_CODES = [429, 502, 503, 504]
+IDEMPOTENT_METHODS = [GET]
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half-open'
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_RECOVERY_TIMEOUT = 30
+DEFAULT_BREAKER_HALF_OPEN_CALLS = 1
+DEFAULT_ENDPOINT_COOLDOWN = 30
+DEFAULT_ITERATOR_WORKERS = 4
+DEFAULT_BULK_WORKERS = 8
+DEFAULT_POLL_INITIAL_INTERVAL = 0.5
+DEFAULT_POLL_MULTIPLIER = 2
+PRIORITY_INTERACTIVE = 'interactive'
+PRIORITY_NORMAL = 'normal'
+PRIORITY_BACKGROUND = 'background'
+PRIORITY_CLASSES = [PRIORITY_INTERACTIVE, PRIORITY_NORMAL, PRIORITY_BACKGROUND]
 
 # Unisphere REST URI constants
 PYU4V_VERSION = '9.2.1.3'
@@ -86,6 +116,31 @@ ALERT = 'alert'
 ALERT_SUMMARY = 'alert_summary'
 COMPLIANCE = 'compliance'
 
+# Response cache constants
+DEFAULT_RESPONSE_CACHE_SIZE = 256
+DEFAULT_RESPONSE_CACHE_TTLS = {SYMMETRIX: 300, SRP: 300, DIRECTOR: 300,
+                               SLO: 600, WORKLOADTYPE: 600}
+
+# Metadata cache constants
+METADATA_CACHE_FILE = 'metadata_cache.db'
+METADATA_CACHE_LOCK_TIMEOUT = 5
+METADATA_UNISPHERE_VERSION = 'unisphere_version'
+METADATA_ARRAY_LIST = 'array_list'
+METADATA_DIRECTOR_LIST = 'director_list'
+METADATA_PORT_LIST = 'port_list'
+METADATA_PERFORMANCE_KEYS = 'performance_keys'
+METADATA_REAL_TIME_CATEGORIES = 'real_time_categories'
+METADATA_REAL_TIME_METRICS = 'real_time_metrics'
+METADATA_REAL_TIME_KEYS = 'real_time_keys'
+DEFAULT_METADATA_CACHE_TTL = 3600
+DEFAULT_METADATA_CACHE_TTLS = {
+    METADATA_DIRECTOR_LIST: 86400, METADATA_PERFORMANCE_KEYS: 0,
+    METADATA_REAL_TIME_CATEGORIES: 86400, METADATA_REAL_TIME_METRICS: 86400,
+    METADATA_REAL_TIME_KEYS: 900}
+
+# Performance collector constants
+PERFORMANCE_COLLECTOR_FILE = 'performance_collector.json'
+
 # Status Codes
 STATUS_200 = 200
 STATUS_201 = 201
@@ -93,6 +148,7 @@ STATUS_202 = 202
 STATUS_204 = 204
 STATUS_401 = 401
 STATUS_404 = 404
+SUCCESS_STATUS_CODES = [STATUS_200, STATUS_201, STATUS_202, STATUS_204]
 
 # Job constants
 INCOMPLETE_LIST = ['created', 'scheduled', 'running',
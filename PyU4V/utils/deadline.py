@@ -0,0 +1,177 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""deadline.py."""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class Deadline(object):
+    """Overall time budget for an operation made up of many requests.
+
+    Used as a context manager, every REST request sent by the current
+    thread while the deadline is active uses at most the remaining budget
+    as its timeout, retries and job polling stop once the budget is spent
+    and DeadlineExceededException is raised. Nested deadlines can only
+    shorten the budget. A deadline of None sets no budget.
+
+    with Deadline(60):
+        conn.performance.get_performance_stats(...)
+    """
+
+    def __init__(self, timeout=None):
+        """__init__.
+
+        :param timeout: seconds the operation may take -- float
+        :raises: InvalidInputException
+        """
+        if timeout is not None and timeout <= 0:
+            msg = 'Deadline timeout must be greater than 0.'
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.timeout = timeout
+        self.expires = (
+            time.monotonic() + timeout if timeout is not None else None)
+        self._previous = None
+
+    def get_remaining(self):
+        """Get the seconds left in the budget.
+
+        :returns: remaining seconds, None if there is no budget -- float
+        """
+        if self.expires is None:
+            return None
+        return max(self.expires - time.monotonic(), 0)
+
+    def __enter__(self):
+        """Make this the deadline of the current thread."""
+        self._previous = get_current()
+        if self._previous and (self.expires is None or (
+                self._previous.expires is not None
+                and self._previous.expires < self.expires)):
+            # An enclosing deadline which expires first still applies
+            self.expires = self._previous.expires
+            self.timeout = self._previous.timeout
+        _local.deadline = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Restore the deadline of the enclosing operation."""
+        _local.deadline = self._previous
+        self._previous = None
+
+
+def get_current():
+    """Get the deadline of the current thread.
+
+    :returns: deadline, None if not set -- Deadline
+    """
+    return getattr(_local, 'deadline', None)
+
+
+def get_remaining():
+    """Get the seconds left before the current deadline.
+
+    :returns: remaining seconds, None if there is no deadline -- float
+    """
+    deadline = get_current()
+    return deadline.get_remaining() if deadline else None
+
+
+def check(reason=None, delay=0):
+    """Check that the current deadline leaves time to continue.
+
+    :param reason: what the time is needed for -- str
+    :param delay: seconds which must still remain -- float
+    :raises: DeadlineExceededException
+    """
+    remaining = get_remaining()
+    if remaining is not None and remaining <= delay:
+        msg = 'the {t} second budget does not leave time for {r}'.format(
+            t=get_current().timeout, r=reason if reason else 'the operation')
+        LOG.error('Operation deadline exceeded, {m}.'.format(m=msg))
+        raise exception.DeadlineExceededException(data=msg)
+
+
+def get_timeout(timeout, reason=None):
+    """Limit a timeout to the time left before the current deadline.
+
+    :param timeout: timeout in seconds -- float
+    :param reason: what the timeout is for -- str
+    :returns: timeout in seconds -- float
+    :raises: DeadlineExceededException
+    """
+    check(reason)
+    remaining = get_remaining()
+    return timeout if remaining is None else min(timeout, remaining)
+
+
+def is_expired():
+    """Check if the current deadline has passed.
+
+    :returns: expired -- bool
+    """
+    remaining = get_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def wrap(func):
+    """Run a function under the current deadline in another thread.
+
+    :param func: function called from a worker thread -- callable
+    :returns: wrapped function -- callable
+    """
+    deadline = get_current()
+    if not deadline:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = get_current()
+        _local.deadline = deadline
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.deadline = previous
+
+    return wrapper
+
+
+def with_deadline(func):
+    """Run a function under a deadline taken from its deadline argument.
+
+    :param func: function with a deadline parameter in seconds -- callable
+    :returns: decorated function -- callable
+    """
+    position = list(inspect.signature(func).parameters).index('deadline')
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        timeout = args[position] if len(args) > position else (
+            kwargs.get('deadline'))
+        if timeout is None:
+            return func(*args, **kwargs)
+        with Deadline(timeout):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,215 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""endpoint_pool.py."""
+
+import logging
+import threading
+import time
+
+import requests.exceptions as r_exc
+import urllib3
+
+from PyU4V.utils import circuit_breaker as cb
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+from PyU4V.utils import rate_limiter as rl
+
+LOG = logging.getLogger(__name__)
+
+
+def is_connect_failure(error):
+    """Check if a request failed before it reached the server.
+
+    Only failures to establish a connection qualify, requests which time
+    out or are dropped after being sent may have been processed.
+
+    :param error: exception raised by the request -- Exception
+    :returns: connection failure -- bool
+    """
+    if isinstance(error, r_exc.ConnectTimeout):
+        return True
+    if isinstance(error, r_exc.SSLError) or not isinstance(
+            error, r_exc.ConnectionError):
+        return False
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, 'reason', reason)
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+class Endpoint(object):
+    """A single Unisphere server."""
+
+    def __init__(self, base_url, circuit_breaker=None, rate_limiter=None):
+        """__init__.
+
+        :param base_url: Unisphere base url -- str
+        :param circuit_breaker: circuit breaker for the server --
+                                CircuitBreaker
+        :param rate_limiter: rate limiter for the server -- RateLimiter
+        """
+        self.base_url = base_url
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.outstanding = 0
+        self.total_requests = 0
+        self.down_until = None
+
+
+class EndpointPool(object):
+    """Unisphere servers which manage the same arrays.
+
+    Read requests are spread across healthy servers by least outstanding
+    requests, write requests go to the first healthy server in the order
+    supplied. A server is unhealthy while it is marked down after a failed
+    connection or while its circuit breaker is open.
+    """
+
+    def __init__(self, base_urls, cooldown=constants.DEFAULT_ENDPOINT_COOLDOWN,
+                 circuit_breaker=False,
+                 breaker_failure_threshold=(
+                     constants.DEFAULT_BREAKER_FAILURE_THRESHOLD),
+                 breaker_recovery_timeout=(
+                     constants.DEFAULT_BREAKER_RECOVERY_TIMEOUT),
+                 rate_limit=None, rate_burst=None, max_concurrency=None):
+        """__init__.
+
+        :param base_urls: Unisphere base urls in order of preference -- list
+        :param cooldown: seconds a server is avoided after a failed
+                         connection -- float
+        :param circuit_breaker: use a circuit breaker per server -- bool
+        :param breaker_failure_threshold: consecutive failures before a
+                                          circuit opens -- int
+        :param breaker_recovery_timeout: seconds before an open circuit
+                                         allows a trial request -- float
+        :param rate_limit: requests per second per server -- float
+        :param rate_burst: requests allowed in a burst per server -- int
+        :param max_concurrency: requests in progress per server -- int
+        :raises: InvalidInputException
+        """
+        if not base_urls:
+            msg = 'At least one Unisphere endpoint must be supplied.'
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.cooldown = cooldown
+        self.endpoints = list()
+        for base_url in base_urls:
+            breaker = cb.get_circuit_breaker(
+                base_url, failure_threshold=breaker_failure_threshold,
+                recovery_timeout=breaker_recovery_timeout) if (
+                circuit_breaker) else None
+            limiter = rl.RateLimiter(
+                rate=rate_limit, burst=rate_burst,
+                max_concurrency=max_concurrency) if (
+                rate_limit or max_concurrency) else None
+            self.endpoints.append(Endpoint(base_url, breaker, limiter))
+        self._lock = threading.Lock()
+
+    @property
+    def preferred(self):
+        """Get the preferred endpoint.
+
+        :returns: endpoint -- Endpoint
+        """
+        return self.endpoints[0]
+
+    def _is_healthy(self, endpoint):
+        """Check if an endpoint is healthy, lock must be held.
+
+        :param endpoint: endpoint -- Endpoint
+        :returns: healthy -- bool
+        """
+        if endpoint.down_until and time.monotonic() < endpoint.down_until:
+            return False
+        return not endpoint.circuit_breaker or (
+            endpoint.circuit_breaker.state != cb.OPEN)
+
+    def select(self, read_only=False, exclude=None):
+        """Select an endpoint for a request and count it as outstanding.
+
+        Endpoints in exclude, usually those which have already failed the
+        request, are only used if no other endpoint is healthy.
+
+        :param read_only: request does not modify the array -- bool
+        :param exclude: endpoints to avoid -- list
+        :returns: endpoint -- Endpoint
+        """
+        exclude = exclude if exclude else list()
+        with self._lock:
+            healthy = [e for e in self.endpoints if self._is_healthy(e)]
+            candidates = [e for e in healthy if e not in exclude] or (
+                healthy or self.endpoints)
+            if read_only:
+                endpoint = min(candidates, key=lambda e: e.outstanding)
+            else:
+                endpoint = candidates[0]
+            endpoint.outstanding += 1
+            endpoint.total_requests += 1
+            return endpoint
+
+    def can_fail_over(self, tried):
+        """Check if a healthy endpoint remains which has not been tried.
+
+        :param tried: endpoints already tried -- list
+        :returns: failover possible -- bool
+        """
+        with self._lock:
+            return any(e not in tried and self._is_healthy(e)
+                       for e in self.endpoints)
+
+    def release(self, endpoint):
+        """Count a request to an endpoint as complete.
+
+        :param endpoint: endpoint -- Endpoint
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+
+    def mark_down(self, endpoint):
+        """Avoid an endpoint for the cooldown period.
+
+        :param endpoint: endpoint -- Endpoint
+        """
+        if len(self.endpoints) > 1:
+            LOG.warning('Unisphere server {url} is unreachable, it will not '
+                        'be used for {cd} seconds.'.format(
+                            url=endpoint.base_url, cd=self.cooldown))
+        with self._lock:
+            endpoint.down_until = time.monotonic() + self.cooldown
+
+    def mark_up(self, endpoint):
+        """Clear any cooldown on an endpoint.
+
+        :param endpoint: endpoint -- Endpoint
+        """
+        with self._lock:
+            endpoint.down_until = None
+
+    def get_stats(self):
+        """Get the outstanding and total requests per endpoint.
+
+        Rate limiter queue depth and wait times are included for endpoints
+        with a rate limiter.
+
+        :returns: endpoint statistics keyed by base url -- dict
+        """
+        with self._lock:
+            stats = {e.base_url: {
+                'outstanding': e.outstanding,
+                'total_requests': e.total_requests,
+                'healthy': self._is_healthy(e)} for e in self.endpoints}
+        for endpoint in self.endpoints:
+            if endpoint.rate_limiter:
+                stats[endpoint.base_url]['rate_limiter'] = (
+                    endpoint.rate_limiter.get_stats())
+        return stats
@@ -94,3 +94,23 @@ class MissingConfigurationException(PyU4VException):
 
     message = ('PyU4V settings not be loaded, please check file location or '
                'univmax_conn input parameters.')
+
+
+class MissingDependencyException(PyU4VException):
+    """MissingDependencyException."""
+
+    message = ('Optional dependency %(data)s is not installed, please install '
+               'it to use this PyU4V feature.')
+
+
+class CircuitOpenException(PyU4VException):
+    """CircuitOpenException."""
+
+    message = ('Circuit breaker is open for Unisphere server %(data)s, the '
+               'request was not sent.')
+
+
+class DeadlineExceededException(PyU4VException):
+    """DeadlineExceededException."""
+
+    message = 'Operation deadline exceeded, %(data)s.'
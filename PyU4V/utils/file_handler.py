@@ -144,40 +144,51 @@ def write_dict_to_csv_file(
     write_to_csv_file(file_path, data_for_file, delimiter, quotechar)
 
 
-def write_binary_data_to_file(data, file_extension, file_name, dir_path=None):
+def write_binary_data_to_file(data, file_extension, file_name, dir_path=None,
+                              chunk_size=None):
     """Write Unisphere binary data to file.
 
+    The response is streamed to file and closed once written, releasing its
+    connection back to the pool.
+
     :param data: Unisphere REST response with data for writing -- json response
     :param file_extension: file extension used for writing to file -- str
     :param file_name: file name -- str
     :param dir_path: file write directory path -- str
+    :param chunk_size: read size in bytes -- int
     :returns: file name and write directory -- str
     """
-    # Set file write directory
-    if dir_path:
-        try:
-            path = Path(dir_path)
-            assert path.is_dir() is True
-        except (TypeError, AssertionError) as error:
-            msg = ('Invalid file path supplied for download '
-                   'location: {f}'.format(f=dir_path))
-            LOG.error(msg)
-            raise exception.InvalidInputException(msg) from error
-    else:
-        # No path set, use current working directory
-        path = Path.cwd()
-
-    # Set download file name with .zip extension
-    f_name = Path(file_name)
-    pdf_name = f_name.with_suffix(file_extension)
-    # Join directory & OS idempotent path
-    file_write_path = Path.joinpath(path, pdf_name)
-
-    # Write binary file data to zip file
-    with open(file_write_path, FILE_WRITE_MODE) as fd:
-        LOG.info('Writing settings to: {p}'.format(p=file_write_path))
-        for chunk in data.iter_content(chunk_size=128):
-            fd.write(chunk)
+    try:
+        # Set file write directory
+        if dir_path:
+            try:
+                path = Path(dir_path)
+                assert path.is_dir() is True
+            except (TypeError, AssertionError) as error:
+                msg = ('Invalid file path supplied for download '
+                       'location: {f}'.format(f=dir_path))
+                LOG.error(msg)
+                raise exception.InvalidInputException(msg) from error
+        else:
+            # No path set, use current working directory
+            path = Path.cwd()
+
+        # Set download file name with .zip extension
+        f_name = Path(file_name)
+        pdf_name = f_name.with_suffix(file_extension)
+        # Join directory & OS idempotent path
+        file_write_path = Path.joinpath(path, pdf_name)
+
+        # Write binary file data to zip file
+        chunk_size = (
+            chunk_size if chunk_size else constants.DOWNLOAD_CHUNK_SIZE)
+        with open(file_write_path, FILE_WRITE_MODE) as fd:
+            LOG.info('Writing settings to: {p}'.format(p=file_write_path))
+            for chunk in data.iter_content(chunk_size=chunk_size):
+                fd.write(chunk)
+    finally:
+        # Release the pooled connection even if the file is not written
+        data.close()
 
     LOG.info('File writing complete.')
     return file_write_path
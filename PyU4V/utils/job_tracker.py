@@ -0,0 +1,296 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""job_tracker.py."""
+
+import logging
+import six
+import threading
+import time
+
+from concurrent import futures
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+INCOMPLETE_LIST = constants.INCOMPLETE_LIST
+SUCCEEDED = constants.SUCCEEDED
+SYSTEM = constants.SYSTEM
+JOB = constants.JOB
+
+
+class _TrackedJob(object):
+    """A job waiting for completion."""
+
+    def __init__(self, job, future):
+        """__init__."""
+        self.job = job
+        self.job_id = job['jobId']
+        self.future = future
+        self.polls = 0
+        self.next_check = None
+        self.last_status = None, None, None
+
+
+class JobFuture(futures.Future):
+    """Future for the outcome of an asynchronous Unisphere job.
+
+    Once the job succeeds the result is the final job details, a dict with
+    the jobId, status, result and task keys. If the job fails the future
+    raises VolumeBackendAPIException. A request which Unisphere completed
+    without starting a job resolves immediately with its response.
+    """
+
+    def __init__(self, job, operation=None):
+        """__init__.
+
+        :param job: job details or request response -- dict
+        :param operation: operation being performed -- str
+        """
+        super(JobFuture, self).__init__()
+        self.job = job
+        self.job_id = job.get('jobId') if job else None
+        self.operation = operation
+
+    def set_job_outcome(self, outcome):
+        """Complete the future from a job tracker outcome.
+
+        :param outcome: finished job tracker future -- Future
+        """
+        if outcome.cancelled():
+            self.cancel()
+            return
+        if not self.set_running_or_notify_cancel():
+            # Cancelled by the caller while the job was tracked
+            return
+        if outcome.exception():
+            self.set_exception(outcome.exception())
+            return
+        rc, result, status, task = outcome.result()
+        if rc != 0:
+            exception_message = (
+                'Error {op}. Status code: {sc}. Error: {err}. '
+                'Status: {st}.'.format(
+                    op=self.operation, sc=rc, err=six.text_type(result),
+                    st=status))
+            LOG.error(exception_message)
+            self.set_exception(exception.VolumeBackendAPIException(
+                data=exception_message))
+            return
+        self.set_result({'jobId': self.job_id, 'status': status,
+                         'result': result, 'task': task})
+
+
+class JobTracker(object):
+    """Wait for many asynchronous jobs from a single background poller.
+
+    Jobs are registered with track() which returns a future. One daemon
+    thread polls every tracked job according to the polling policy and
+    completes its future with the same (rc, result, status, task) tuple as
+    CommonFunctions.wait_for_job_complete. When more jobs are due than there
+    are incomplete job states the job list is queried by status instead, so
+    running jobs cost a fixed number of requests per poll and only finished
+    jobs are requested individually.
+    """
+
+    def __init__(self, common, bulk_query=True):
+        """__init__.
+
+        :param common: common functions used to query jobs --
+                       CommonFunctions
+        :param bulk_query: query the job list by status when many jobs are
+                           due -- bool
+        """
+        self.common = common
+        self.bulk_query = bulk_query
+        self._jobs = dict()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+        self.polls = 0
+        self.bulk_polls = 0
+        self.requests = 0
+
+    def track(self, job, callback=None):
+        """Start tracking a job.
+
+        :param job: job details or job id -- dict or str
+        :param callback: called with the future once the job is
+                         finished -- callable
+        :returns: future for the job outcome -- concurrent.futures.Future
+        """
+        job = job if isinstance(job, dict) else {
+            'jobId': job, 'status': INCOMPLETE_LIST[0]}
+        future = futures.Future()
+        if callback:
+            future.add_done_callback(callback)
+        if job.get('status', '').lower() == SUCCEEDED:
+            future.set_result(
+                (0, job.get('result'), job['status'], job.get('task')))
+            return future
+
+        tracked = _TrackedJob(job, future)
+        with self._condition:
+            existing = self._jobs.get(tracked.job_id)
+            if existing:
+                # Share the result with the caller already waiting
+                existing.future.add_done_callback(
+                    lambda done: self._copy_outcome(done, future))
+                return future
+            tracked.next_check = time.monotonic() + self._get_interval(
+                tracked)
+            self._jobs[tracked.job_id] = tracked
+            self._stopped = False
+            if not self._thread or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='PyU4V-job-tracker', daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return future
+
+    @staticmethod
+    def _copy_outcome(source, target):
+        """Copy the outcome of one future to another.
+
+        :param source: finished future -- Future
+        :param target: future to complete -- Future
+        """
+        if source.cancelled():
+            target.cancel()
+        elif not target.set_running_or_notify_cancel():
+            return
+        elif source.exception():
+            target.set_exception(source.exception())
+        else:
+            target.set_result(source.result())
+
+    def _get_interval(self, tracked):
+        """Get the interval before the next status check of a job.
+
+        :param tracked: tracked job -- _TrackedJob
+        :returns: interval in seconds -- float
+        """
+        return self.common.polling_policy.get_interval(
+            tracked.polls + 1, tracked.job, self.common.interval)
+
+    def _run(self):
+        """Poll tracked jobs until there are none left or stop is called."""
+        while True:
+            with self._condition:
+                if self._stopped or not self._jobs:
+                    return
+                now = time.monotonic()
+                next_check = min(t.next_check for t in self._jobs.values())
+                if next_check > now:
+                    self._condition.wait(next_check - now)
+                    continue
+                due = [t for t in self._jobs.values() if t.next_check <= now]
+            self._poll(due)
+
+    def _get_incomplete_job_ids(self):
+        """Get the ids of all jobs which are not finished.
+
+        :returns: job ids -- set
+        """
+        job_ids = set()
+        for status in INCOMPLETE_LIST:
+            self.requests += 1
+            response = self.common.get_resource(
+                category=SYSTEM, resource_level=JOB,
+                params={'status': status.upper()})
+            job_ids.update(response.get('jobId', list()) if response else [])
+        return job_ids
+
+    def _poll(self, due):
+        """Check the status of jobs which are due.
+
+        :param due: tracked jobs to check -- list
+        """
+        self.polls += 1
+        incomplete_ids = None
+        if self.bulk_query and len(due) > len(INCOMPLETE_LIST):
+            try:
+                incomplete_ids = self._get_incomplete_job_ids()
+                self.bulk_polls += 1
+            except Exception as error:
+                LOG.warning('Unable to list incomplete jobs, checking jobs '
+                            'individually: {e}'.format(e=error))
+
+        for tracked in due:
+            outcome = None
+            try:
+                if incomplete_ids is None or (
+                        tracked.job_id not in incomplete_ids):
+                    self.requests += 1
+                    is_complete, result, rc, status, task = (
+                        self.common._is_job_finished(tracked.job_id))
+                    tracked.last_status = result, status, task
+                    if is_complete:
+                        outcome = (rc,) + tracked.last_status
+                tracked.polls += 1
+                if not outcome and tracked.polls > self.common.retries:
+                    LOG.error('Job {j} did not complete after {cnt} '
+                              'tries.'.format(j=tracked.job_id,
+                                              cnt=tracked.polls))
+                    outcome = (-1,) + tracked.last_status
+            except Exception as error:
+                exception_message = 'Issue encountered waiting for job.'
+                LOG.exception(exception_message)
+                api_error = exception.VolumeBackendAPIException(
+                    data=exception_message)
+                api_error.__cause__ = error
+                self._finish(tracked, error=api_error)
+                continue
+            if outcome:
+                self._finish(tracked, outcome)
+            else:
+                tracked.next_check = time.monotonic() + self._get_interval(
+                    tracked)
+
+    def _finish(self, tracked, outcome=None, error=None):
+        """Stop tracking a job and complete its future.
+
+        :param tracked: tracked job -- _TrackedJob
+        :param outcome: rc, result, status and task -- tuple
+        :param error: exception to raise from the future -- Exception
+        """
+        with self._condition:
+            self._jobs.pop(tracked.job_id, None)
+        self.common.invalidate_job_resource(tracked.job)
+        if not tracked.future.set_running_or_notify_cancel():
+            return
+        if error:
+            tracked.future.set_exception(error)
+        else:
+            tracked.future.set_result(outcome)
+
+    def get_stats(self):
+        """Get the number of tracked jobs and requests made.
+
+        :returns: statistics -- dict
+        """
+        with self._condition:
+            return {'tracked': len(self._jobs), 'polls': self.polls,
+                    'bulk_polls': self.bulk_polls, 'requests': self.requests}
+
+    def stop(self):
+        """Stop polling, futures of jobs still tracked are cancelled."""
+        with self._condition:
+            self._stopped = True
+            tracked_jobs = list(self._jobs.values())
+            self._jobs.clear()
+            self._condition.notify_all()
+        for tracked in tracked_jobs:
+            tracked.future.cancel()
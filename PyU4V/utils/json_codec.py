@@ -0,0 +1,125 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""json_codec.py."""
+
+import json
+import logging
+
+from PyU4V.utils import exception
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOG = logging.getLogger(__name__)
+
+STDLIB = 'json'
+ORJSON = 'orjson'
+AUTO = 'auto'
+
+
+class JSONCodec(object):
+    """Standard library JSON codec using compact wire serialization."""
+
+    name = STDLIB
+
+    @staticmethod
+    def dumps(obj):
+        """Serialize an object to a compact JSON string.
+
+        :param obj: object to serialize -- dict
+        :returns: JSON document -- str
+        """
+        return json.dumps(obj, separators=(',', ':'))
+
+    @staticmethod
+    def loads(data):
+        """Deserialize a JSON document.
+
+        :param data: JSON document -- str or bytes
+        :returns: deserialized object -- dict
+        :raises: ValueError
+        """
+        return json.loads(data)
+
+    def decode_response(self, response):
+        """Decode the JSON body of a requests response.
+
+        :param response: REST response -- requests.Response
+        :returns: deserialized body -- dict
+        :raises: ValueError
+        """
+        return response.json()
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson backed JSON codec."""
+
+    name = ORJSON
+
+    @staticmethod
+    def dumps(obj):
+        """Serialize an object to a compact JSON document.
+
+        :param obj: object to serialize -- dict
+        :returns: JSON document -- bytes
+        """
+        return orjson.dumps(obj)
+
+    @staticmethod
+    def loads(data):
+        """Deserialize a JSON document.
+
+        :param data: JSON document -- str or bytes
+        :returns: deserialized object -- dict
+        :raises: ValueError
+        """
+        return orjson.loads(data)
+
+    def decode_response(self, response):
+        """Decode the JSON body of a requests response.
+
+        orjson decodes directly from the raw response bytes which skips the
+        text decoding step done by response.json().
+
+        :param response: REST response -- requests.Response
+        :returns: deserialized body -- dict
+        :raises: ValueError
+        """
+        return self.loads(response.content)
+
+
+CODECS = {STDLIB: JSONCodec, ORJSON: OrjsonCodec}
+
+
+def get_codec(name=None):
+    """Get a JSON codec by name.
+
+    If no name or 'auto' is supplied the fastest installed codec is used.
+
+    :param name: codec name, one of 'auto', 'json', 'orjson' -- str
+    :returns: codec -- JSONCodec
+    :raises: InvalidInputException, MissingDependencyException
+    """
+    if not name or name == AUTO:
+        name = ORJSON if orjson is not None else STDLIB
+    if name not in CODECS:
+        msg = ('Invalid JSON codec "{n}" supplied, valid options are '
+               '{opts}.'.format(n=name, opts=[AUTO] + list(CODECS)))
+        LOG.error(msg)
+        raise exception.InvalidInputException(msg)
+    if name == ORJSON and orjson is None:
+        raise exception.MissingDependencyException(data=ORJSON)
+    return CODECS[name]()
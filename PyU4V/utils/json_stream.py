@@ -0,0 +1,227 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""json_stream.py."""
+
+import codecs
+import json
+import logging
+
+LOG = logging.getLogger(__name__)
+
+RESULT_LIST_PATH = ('resultList', 'result')
+PAGE_RESULT_PATH = ('result',)
+WHITESPACE = ' \t\n\r'
+DELIMITERS = WHITESPACE + ',:]}'
+
+
+class JSONArrayStream(object):
+    """Incrementally decode the items of an array nested in a JSON document.
+
+    The document is read chunk by chunk and only one array item is decoded
+    at a time, so large responses such as iterator pages never need to be
+    held in memory as a full string and a full object tree. Every other
+    value in the document is decoded normally and made available in
+    metadata once iteration has finished, for example the iterator id and
+    count of a volume list response.
+    """
+
+    def __init__(self, chunks, path=RESULT_LIST_PATH, close_callback=None):
+        """__init__.
+
+        :param chunks: JSON document chunks -- iterable of bytes or str
+        :param path: object keys leading to the array -- tuple
+        :param close_callback: called when the stream is exhausted -- callable
+        """
+        self.chunks = iter(chunks)
+        self.path = tuple(path)
+        self.close_callback = close_callback
+        self.metadata = dict()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._started = False
+
+    def __iter__(self):
+        """Iterate over the array items.
+
+        :returns: array items -- generator
+        :raises: ValueError
+        """
+        if self._started:
+            raise ValueError('A JSONArrayStream can only be iterated once.')
+        self._started = True
+        try:
+            for item in self._walk_object(self.metadata, 0):
+                yield item
+            self._skip_whitespace()
+            if not self._at_end():
+                raise ValueError(
+                    'Unexpected data after JSON document at position '
+                    '{p}.'.format(p=self.pos))
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the underlying response."""
+        if self.close_callback:
+            callback, self.close_callback = self.close_callback, None
+            callback()
+
+    def _fill(self):
+        """Read the next chunk into the buffer.
+
+        :returns: if more data was read -- bool
+        """
+        if self.eof:
+            return False
+        # Drop consumed data so the buffer only ever holds the unparsed tail
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = self.text_decoder.decode(chunk)
+            if chunk:
+                self.buffer += chunk
+                return True
+        self.buffer += self.text_decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def _at_end(self):
+        """Check if the whole document has been consumed.
+
+        :returns: document consumed -- bool
+        """
+        return self.pos >= len(self.buffer) and not self._fill()
+
+    def _skip_whitespace(self):
+        """Advance past any whitespace."""
+        while True:
+            while (self.pos < len(self.buffer)
+                   and self.buffer[self.pos] in WHITESPACE):
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return
+
+    def _next_char(self):
+        """Consume the next non whitespace character.
+
+        :returns: character -- str
+        :raises: ValueError
+        """
+        self._skip_whitespace()
+        if self.pos >= len(self.buffer):
+            raise ValueError('Unexpected end of JSON document.')
+        char = self.buffer[self.pos]
+        self.pos += 1
+        return char
+
+    def _expect(self, expected):
+        """Consume the next character and check it is the one expected.
+
+        :param expected: expected characters -- str
+        :returns: character -- str
+        :raises: ValueError
+        """
+        char = self._next_char()
+        if char not in expected:
+            raise ValueError(
+                'Expected one of "{e}" but found "{c}" in JSON document at '
+                'position {p}.'.format(e=expected, c=char, p=self.pos - 1))
+        return char
+
+    def _decode_value(self):
+        """Decode the next complete JSON value.
+
+        A value is only accepted once a delimiter follows it, or the document
+        has ended, so that numbers split across chunks are not cut short.
+
+        :returns: value -- object
+        :raises: ValueError
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                if self.eof or (end < len(self.buffer)
+                                and self.buffer[end] in DELIMITERS):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                value, self.pos = self.decoder.raw_decode(
+                    self.buffer, self.pos)
+                return value
+
+    def _walk_object(self, container, depth):
+        """Walk an object on the path to the array.
+
+        :param container: decoded metadata for this object -- dict
+        :param depth: position of this object in the path -- int
+        :returns: array items -- generator
+        :raises: ValueError
+        """
+        self._expect('{')
+        self._skip_whitespace()
+        if self.buffer[self.pos:self.pos + 1] == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ValueError('JSON object keys must be strings.')
+            self._expect(':')
+            if key == self.path[depth] and depth == len(self.path) - 1:
+                for item in self._walk_array():
+                    yield item
+            elif key == self.path[depth]:
+                self._skip_whitespace()
+                if self.buffer[self.pos:self.pos + 1] == '{':
+                    container[key] = dict()
+                    for item in self._walk_object(container[key], depth + 1):
+                        yield item
+                else:
+                    container[key] = self._decode_value()
+            else:
+                container[key] = self._decode_value()
+            if self._expect(',}') == '}':
+                return
+
+    def _walk_array(self):
+        """Decode the target array one item at a time.
+
+        :returns: array items -- generator
+        :raises: ValueError
+        """
+        self._skip_whitespace()
+        if self.buffer[self.pos:self.pos + 1] != '[':
+            value = self._decode_value()
+            if value is not None:
+                raise ValueError(
+                    'Expected a JSON array at {p}.'.format(
+                        p='.'.join(self.path)))
+            return
+        self.pos += 1
+        self._skip_whitespace()
+        if self.buffer[self.pos:self.pos + 1] == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._expect(',]') == ']':
+                return
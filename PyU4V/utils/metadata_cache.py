@@ -0,0 +1,227 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""metadata_cache.py."""
+
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+UNISPHERE_VERSION = constants.METADATA_UNISPHERE_VERSION
+SCHEMA_VERSION = '1'
+
+
+class MetadataCache(object):
+    """Persistent cache of static Unisphere metadata in a SQLite database.
+
+    Metadata such as the Unisphere version, array list, director and port
+    lists and real-time performance keys is stored per Unisphere endpoint
+    and array so it survives between process runs. Each kind of metadata
+    has its own TTL. The database is emptied if it was written by another
+    version of PyU4V, and the entries of an endpoint are removed when its
+    Unisphere version changes. Cache errors are logged and the metadata is
+    fetched from Unisphere instead.
+    """
+
+    def __init__(self, path=None, ttls=None,
+                 default_ttl=constants.DEFAULT_METADATA_CACHE_TTL):
+        """__init__.
+
+        :param path: database file, defaults to
+                     ~/.PyU4V/metadata_cache.db -- str
+        :param ttls: seconds metadata is cached keyed by kind, merged with
+                     the default TTLs, a TTL of 0 disables caching of that
+                     kind -- dict
+        :param default_ttl: seconds metadata of other kinds is cached --
+                            float
+        :raises: InvalidInputException
+        """
+        ttls = ttls if ttls else dict()
+        if default_ttl < 0 or any(ttl < 0 for ttl in ttls.values()):
+            msg = 'Metadata cache TTLs must not be negative.'
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.path = path if path else os.path.normpath(
+            '{home_path}/.PyU4V/{file}'.format(
+                home_path=os.path.expanduser('~'),
+                file=constants.METADATA_CACHE_FILE))
+        self.ttls = dict(constants.DEFAULT_METADATA_CACHE_TTLS)
+        self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._initialised = False
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open the database, creating it if required.
+
+        :returns: connection -- sqlite3.Connection
+        """
+        with self._lock:
+            if not self._initialised:
+                self._initialise()
+        connection = sqlite3.connect(
+            self.path, timeout=constants.METADATA_CACHE_LOCK_TIMEOUT)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _initialise(self):
+        """Create the database and check its version, lock must be held."""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        version = '{schema}/{pyu4v}'.format(
+            schema=SCHEMA_VERSION, pyu4v=constants.PYU4V_VERSION)
+        connection = sqlite3.connect(
+            self.path, timeout=constants.METADATA_CACHE_LOCK_TIMEOUT)
+        try:
+            with connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS settings '
+                    '(name TEXT PRIMARY KEY, value TEXT)')
+                row = connection.execute(
+                    'SELECT value FROM settings WHERE name = ?',
+                    ('version',)).fetchone()
+                if not row or row[0] != version:
+                    LOG.debug('Metadata cache {p} was written by another '
+                              'version, emptying.'.format(p=self.path))
+                    connection.execute('DROP TABLE IF EXISTS metadata')
+                    connection.execute(
+                        'INSERT OR REPLACE INTO settings VALUES (?, ?)',
+                        ('version', version))
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS metadata '
+                    '(endpoint TEXT, array_id TEXT, kind TEXT, key TEXT, '
+                    'value TEXT, expires REAL, '
+                    'PRIMARY KEY (endpoint, array_id, kind, key))')
+        finally:
+            connection.close()
+        self._initialised = True
+
+    def get_ttl(self, kind):
+        """Get the seconds metadata of a kind is cached.
+
+        :param kind: metadata kind e.g. array_list -- str
+        :returns: TTL, 0 if not cached -- float
+        """
+        return self.ttls.get(kind, self.default_ttl)
+
+    def get_or_load(self, endpoint, array_id, kind, key, load, *args,
+                    **kwargs):
+        """Get cached metadata, or load and cache it.
+
+        :param endpoint: Unisphere base url -- str
+        :param array_id: array id, None for endpoint metadata -- str
+        :param kind: metadata kind e.g. array_list -- str
+        :param key: JSON serializable value which distinguishes metadata
+                    of the same kind e.g. a category or filters, None if
+                    not required
+        :param load: function which gets the metadata -- callable
+        :param args: load arguments -- tuple
+        :param kwargs: load keyword arguments -- dict
+        :returns: metadata, must be JSON serializable
+        """
+        ttl = self.get_ttl(kind)
+        if not ttl:
+            return load(*args, **kwargs)
+        row_key = (endpoint, array_id or str(), kind, json.dumps(
+            key, sort_keys=True, default=str) if key is not None else str())
+        previous = None
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    'SELECT value, expires FROM metadata WHERE endpoint = ? '
+                    'AND array_id = ? AND kind = ? AND key = ?',
+                    row_key).fetchone()
+            if row and row[1] > time.time():
+                self.hits += 1
+                return json.loads(row[0])
+            previous = json.loads(row[0]) if row else None
+        except (sqlite3.Error, OSError, ValueError) as error:
+            self._log_error(error)
+            return load(*args, **kwargs)
+
+        self.misses += 1
+        value = load(*args, **kwargs)
+        try:
+            with self._connect() as connection:
+                if kind == UNISPHERE_VERSION and previous and (
+                        previous != value):
+                    LOG.debug('Unisphere version of {e} changed, removing '
+                              'its cached metadata.'.format(e=endpoint))
+                    connection.execute(
+                        'DELETE FROM metadata WHERE endpoint = ?',
+                        (endpoint,))
+                connection.execute(
+                    'INSERT OR REPLACE INTO metadata VALUES '
+                    '(?, ?, ?, ?, ?, ?)',
+                    row_key + (json.dumps(value), time.time() + ttl))
+        except (sqlite3.Error, OSError, TypeError, ValueError) as error:
+            self._log_error(error)
+        return value
+
+    def _log_error(self, error):
+        """Log a cache error, the metadata is fetched from Unisphere.
+
+        :param error: exception raised by the cache -- Exception
+        """
+        self.errors += 1
+        LOG.warning('Metadata cache {p} unavailable: {e}'.format(
+            p=self.path, e=error))
+
+    def invalidate(self, endpoint=None, array_id=None, kind=None):
+        """Remove cached metadata.
+
+        :param endpoint: Unisphere base url, None for all endpoints -- str
+        :param array_id: array id, None for all arrays -- str
+        :param kind: metadata kind, None for all kinds -- str
+        :returns: number of entries removed -- int
+        """
+        conditions, values = list(), list()
+        for column, value in (('endpoint', endpoint),
+                              ('array_id', array_id), ('kind', kind)):
+            if value is not None:
+                conditions.append('{c} = ?'.format(c=column))
+                values.append(value)
+        statement = 'DELETE FROM metadata'
+        if conditions:
+            statement += ' WHERE ' + ' AND '.join(conditions)
+        try:
+            with self._connect() as connection:
+                return connection.execute(statement, values).rowcount
+        except (sqlite3.Error, OSError) as error:
+            self._log_error(error)
+            return 0
+
+    def get_stats(self):
+        """Get cache hit, miss and error counts.
+
+        :returns: statistics -- dict
+        """
+        return {'path': self.path, 'hits': self.hits,
+                'misses': self.misses, 'errors': self.errors}
@@ -0,0 +1,264 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""performance_collector.py."""
+
+import collections
+import json
+import logging
+import os
+import threading
+
+from PyU4V.utils import constants
+from PyU4V.utils import deadline as dl
+from PyU4V.utils import exception
+from PyU4V.utils import performance_category_map
+from PyU4V.utils import performance_constants as pc
+
+LOG = logging.getLogger(__name__)
+
+CATEGORY_MAP = performance_category_map.performance_data
+STATE_VERSION = 1
+VERSION = 'version'
+WATERMARKS = 'watermarks'
+
+
+class PerformanceCollector(object):
+    """Incremental collector of performance statistics.
+
+    The timestamp of the last statistics collected for each array, category
+    and object is kept as a watermark and saved to a local state file. Each
+    collection only requests the intervals after an object's watermark.
+    Objects with no data after their watermark are skipped, and if the last
+    available timestamp of the array is not after the watermarks of the
+    requested objects nothing else is requested. Objects without a
+    watermark are collected from initial_window milliseconds before their
+    last available timestamp. Watermarks only advance for objects collected
+    without error.
+
+    collector = PerformanceCollector(conn.performance)
+    stats = collector.collect('StorageGroup')
+    """
+
+    def __init__(self, performance, state_file=None,
+                 initial_window=pc.ONE_HOUR):
+        """__init__.
+
+        :param performance: performance functions -- PerformanceFunctions
+        :param state_file: watermark state file, defaults to
+                           ~/.PyU4V/performance_collector.json -- str
+        :param initial_window: milliseconds of data collected for objects
+                               without a watermark -- int
+        :raises: InvalidInputException
+        """
+        if initial_window <= 0:
+            msg = 'Performance collector initial window must be positive.'
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.performance = performance
+        self.state_file = state_file if state_file else os.path.normpath(
+            '{home_path}/.PyU4V/{file}'.format(
+                home_path=os.path.expanduser('~'),
+                file=constants.PERFORMANCE_COLLECTOR_FILE))
+        self.initial_window = initial_window
+        self._lock = threading.Lock()
+        self.watermarks = self._load()
+
+    def _load(self):
+        """Load the watermarks from the state file.
+
+        A missing or unreadable state file starts with no watermarks.
+
+        :returns: watermarks keyed by array, category and object -- dict
+        """
+        try:
+            with open(self.state_file) as state_file:
+                state = json.load(state_file)
+        except FileNotFoundError:
+            return dict()
+        except (OSError, ValueError) as error:
+            LOG.warning('Performance collector state {f} could not be read, '
+                        'starting without watermarks: {e}'.format(
+                            f=self.state_file, e=error))
+            return dict()
+        if not isinstance(state, dict) or (
+                state.get(VERSION) != STATE_VERSION):
+            LOG.warning('Performance collector state {f} has an unknown '
+                        'format, starting without watermarks.'.format(
+                            f=self.state_file))
+            return dict()
+        return state.get(WATERMARKS, dict())
+
+    def save(self):
+        """Save the watermarks to the state file.
+
+        The state is written to a temporary file which then replaces the
+        state file so an interrupted save does not lose the watermarks.
+        """
+        directory = os.path.dirname(self.state_file)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        temp_file = '{f}.tmp'.format(f=self.state_file)
+        with self._lock:
+            with open(temp_file, 'w') as state_file:
+                json.dump({VERSION: STATE_VERSION,
+                           WATERMARKS: self.watermarks}, state_file)
+            os.replace(temp_file, self.state_file)
+
+    @staticmethod
+    def get_state_id(object_id, director_id=None):
+        """Get the id an object's watermark is kept under.
+
+        :param object_id: object id -- str
+        :param director_id: director id of port categories -- str
+        :returns: state id -- str
+        """
+        return '{dir}:{obj}'.format(dir=director_id, obj=object_id) if (
+            director_id) else str(object_id)
+
+    def get_watermark(self, category, object_id, director_id=None,
+                      array_id=None):
+        """Get the timestamp of the last statistics collected for an object.
+
+        :param category: category id -- str
+        :param object_id: object id -- str
+        :param director_id: director id of port categories -- str
+        :param array_id: array id -- str
+        :returns: timestamp in milliseconds since epoch, None if never
+                  collected -- int
+        """
+        array_id = array_id if array_id else self.performance.array_id
+        category = CATEGORY_MAP[category.upper()][pc.CATEGORY]
+        with self._lock:
+            return self.watermarks.get(array_id, dict()).get(
+                category, dict()).get(self.get_state_id(
+                    object_id, director_id))
+
+    def reset(self, category=None, array_id=None):
+        """Remove watermarks so the next collection starts afresh.
+
+        :param category: category id, None for all categories -- str
+        :param array_id: array id, None for all arrays -- str
+        """
+        if category:
+            category = CATEGORY_MAP[category.upper()][pc.CATEGORY]
+        with self._lock:
+            for array in list(self.watermarks):
+                if array_id and array != array_id:
+                    continue
+                if category:
+                    self.watermarks[array].pop(category, None)
+                else:
+                    del self.watermarks[array]
+        self.save()
+
+    @dl.with_deadline
+    def collect(self, category, object_ids=pc.ALL, metrics=pc.KPI,
+                director_id=None, array_id=None, data_format=pc.AVERAGE,
+                max_workers=None, result_format=pc.ROWS, deadline=None):
+        """Collect the statistics of objects since their watermarks.
+
+        :param category: category id -- str
+        :param object_ids: object ids, 'ALL' for every object in the
+                           category keys -- str/list
+        :param metrics: performance metrics, options are individual metrics,
+                        a list of metrics, 'KPI' for KPI metrics only, and
+                        'ALL' for all metrics -- str/list
+        :param director_id: director id, required for port categories -- str
+        :param array_id: array id -- str
+        :param data_format: response data format 'Average' or 'Maximum' -- str
+        :param max_workers: maximum concurrent requests, defaults to
+                            8 -- int
+        :param result_format: 'rows' or 'columnar' -- str
+        :param deadline: seconds the whole collection may take -- float
+        :returns: new performance metrics or exceptions keyed by object id,
+                  objects with no new data are not included, empty if the
+                  array has no performance data -- dict
+        :raises: InvalidInputException, ResourceNotFoundException,
+                 DeadlineExceededException, MissingDependencyException
+        """
+        array_id = array_id if array_id else self.performance.array_id
+        self.performance.validate_category(category)
+        category = CATEGORY_MAP[category.upper()][pc.CATEGORY]
+        with self._lock:
+            watermarks = dict(self.watermarks.get(array_id, dict()).get(
+                category, dict()))
+
+        # 1. Skip the collection if the array has no data after the
+        # watermarks of the requested objects
+        last_time = self.performance.get_last_available_timestamp(array_id)
+        if last_time is None:
+            LOG.debug('No performance data available for array {arr}.'.format(
+                arr=array_id))
+            return dict()
+        last_time = int(last_time)
+        explicit_ids = not (isinstance(object_ids, str) and (
+            object_ids.upper() == pc.ALL.upper()))
+        if explicit_ids:
+            object_ids = [object_ids] if isinstance(object_ids, str) else (
+                object_ids)
+            object_ids = [str(object_id) for object_id in object_ids]
+            if all(watermarks.get(self.get_state_id(
+                    object_id, director_id), 0) >= last_time
+                    for object_id in object_ids):
+                LOG.debug('No new {cat} performance data to collect.'.format(
+                    cat=category))
+                return dict()
+
+        # 2. Find the objects with new data and group them by time range
+        oldest = min(watermarks.values()) if watermarks else None
+        key_start = oldest + pc.ONE_MINUTE if oldest else (
+            last_time - self.initial_window)
+        object_keys = self.performance.get_category_object_keys(
+            category, array_id=array_id, director_id=director_id,
+            start_time=min(key_start, last_time), end_time=last_time)
+        if not explicit_ids:
+            object_ids = [array_id] if category == pc.ARRAY else list(
+                object_keys)
+        time_ranges = collections.OrderedDict()
+        for object_id in object_ids:
+            p_keys = object_keys.get(object_id, dict())
+            end_time = min(int(p_keys.get(pc.LA_DATE) or last_time),
+                           last_time)
+            watermark = watermarks.get(self.get_state_id(
+                object_id, director_id))
+            if watermark and watermark >= end_time:
+                continue
+            start_time = watermark + pc.ONE_MINUTE if watermark else max(
+                end_time - self.initial_window,
+                int(p_keys.get(pc.FA_DATE) or 0))
+            time_ranges.setdefault((start_time, end_time), list()).append(
+                object_id)
+
+        # 3. Collect each time range and advance the watermarks
+        results = dict()
+        for (start_time, end_time), range_ids in time_ranges.items():
+            range_results = self.performance.get_bulk_stats(
+                category, object_ids=range_ids, metrics=metrics,
+                director_id=director_id, array_id=array_id,
+                data_format=data_format, start_time=start_time,
+                end_time=end_time, max_workers=max_workers,
+                result_format=result_format, object_keys=object_keys)
+            results.update(range_results)
+            with self._lock:
+                category_marks = self.watermarks.setdefault(
+                    array_id, dict()).setdefault(category, dict())
+                for object_id, result in range_results.items():
+                    if not isinstance(result, Exception):
+                        category_marks[self.get_state_id(
+                            object_id, director_id)] = end_time
+        if results:
+            self.save()
+        LOG.debug('Collected new {cat} performance data of {cnt} '
+                  'objects.'.format(cat=category, cnt=len(results)))
+        return results
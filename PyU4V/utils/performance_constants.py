@@ -38,10 +38,14 @@ END_DATE_SN = 'end_date'
 FA_DATE = 'firstAvailableDate'
 LA_DATE = 'lastAvailableDate'
 DATA_FORMAT = 'dataFormat'
+ROWS = 'rows'
+COLUMNAR = 'columnar'
 RESULT = 'result'
 REP_LEVEL = 'reporting_level'
 ONE_MINUTE = 60000
 ONE_HOUR = 3600000
+DIAGNOSTIC_INTERVAL = 300
+KEY_CACHE_REFRESH_DELAY = 30
 
 # Director Tags
 BE_DIR_TAGS = ['DF', 'DX']
@@ -192,6 +196,33 @@ TIMES = 'times'
 TIMESTAMP = 'timestamp'
 THIN_POOL = 'ThinPool'
 
+# Object id key in the performance keys and in the stats request of each
+# category, Array stats need no object id in the request
+STATS_OBJECT_IDS = {
+    ARRAY: (SYMM_ID, None), BE_DIR: (DIR_ID, DIR_ID),
+    BE_EMU: (BE_EMU_ID, BE_EMU_ID), BE_PORT: (PORT_ID, PORT_ID),
+    BOARD: (BOARD_ID, BOARD_ID), CACHE_PART: (CACHE_PART_ID, CACHE_PART_ID),
+    DB: (DB_ID, DB_ID), DEV_GRP: (DEV_GRP_ID, DEV_GRP_ID),
+    DISK_GRP: (DISK_GRP_ID, DISK_GRP_ID), EDS_DIR: (DIR_ID, DIR_ID),
+    EDS_EMU: (EDS_EMU_ID, EDS_EMU_ID), EXT_DISK: (DISK_ID, DISK_ID),
+    FE_DIR: (DIR_ID, DIR_ID), FE_EMU: (FE_EMU_ID, FE_EMU_ID),
+    FE_PORT: (PORT_ID, PORT_ID), FICON_EMU: (FICON_EMU_ID, FICON_EMU_ID),
+    FICON_EMU_THR: (FICON_EMU_THR_ID, FICON_EMU_THR_ID),
+    FICON_PORT_THR: (FICON_PORT_THR_ID, FICON_PORT_THR_ID),
+    HOST: (HOST_ID, HOST_ID), IM_DIR: (DIR_ID, DIR_ID),
+    IM_EMU: (IM_EMU_ID, IM_EMU_ID), INIT: (INIT_ID, INIT_ID),
+    IP_INT: (IP_INT_ID, IP_INT_ID),
+    ISCSI_TGT: (ISCSI_TGT_ID_KEY, ISCSI_TGT_ID_METRICS), MV: (MV_ID, MV_ID),
+    PG: (PG_ID, PG_ID), RDFA: (RA_GRP_ID, RA_GRP_ID),
+    RDFS: (RA_GRP_ID, RA_GRP_ID), RDF_DIR: (DIR_ID, DIR_ID),
+    RDF_EMU: (RDF_EMU_ID, RDF_EMU_ID), RDF_PORT: (PORT_ID, PORT_ID),
+    STORAGE_CONT: (STORAGE_CONT_ID, STORAGE_CONT_ID), SG: (SG_ID, SG_ID),
+    STORAGE_RES: (STORAGE_RES_ID, STORAGE_RES_ID), SRP: (SRP_ID, SRP_ID),
+    THIN_POOL: (POOL_ID, POOL_ID)}
+# Port keys are listed per director of the director category
+PORT_CATEGORIES = {BE_PORT: BE_DIR, FE_PORT: FE_DIR, RDF_PORT: RDF_DIR}
+TIME_RANGE_KEY_CATEGORIES = [HOST, INIT]
+
 # Threshold constants
 ALERT = 'alert'
 ALERT_ERR = 'alertError'
@@ -0,0 +1,180 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""performance_key_cache.py."""
+
+import logging
+import re
+import threading
+import time
+
+from PyU4V.utils import exception
+from PyU4V.utils import performance_constants as pc
+
+LOG = logging.getLogger(__name__)
+
+KEY_REGEX = re.compile(r'\A[\w]*(Info)$')
+
+
+class _Entry(object):
+    """A cached performance key list and its timestamp index."""
+
+    def __init__(self, key_list, index, expires):
+        """__init__."""
+        self.key_list = key_list
+        self.index = index
+        self.expires = expires
+
+
+class PerformanceKeyCache(object):
+    """Cache of performance key lists indexed by object id.
+
+    Key lists are cached per array, category and director. Performance
+    data is collected at the diagnostic interval, so the first and last
+    available timestamps of the objects in a key list only change at
+    interval boundaries. Cached key lists expire at the next boundary plus
+    a delay which allows Unisphere to process the new data. Each key list
+    is indexed by object id so the timestamps of an object are found in a
+    single lookup.
+    """
+
+    def __init__(self, interval=pc.DIAGNOSTIC_INTERVAL,
+                 delay=pc.KEY_CACHE_REFRESH_DELAY):
+        """__init__.
+
+        :param interval: seconds between performance data collections --
+                         int
+        :param delay: seconds after an interval boundary before key lists
+                      are refreshed -- int
+        :raises: InvalidInputException
+        """
+        if interval <= 0 or not 0 <= delay < interval:
+            msg = ('Performance key cache interval must be greater than 0 '
+                   'and delay must be between 0 and the interval.')
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.interval = interval
+        self.delay = delay
+        self._entries = dict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_expiry(self, now=None):
+        """Get the time key lists loaded now expire.
+
+        :param now: seconds since epoch, defaults to the current time --
+                    float
+        :returns: seconds since epoch -- float
+        """
+        now = time.time() if now is None else now
+        boundary = (now - self.delay) // self.interval * self.interval
+        return boundary + self.interval + self.delay
+
+    @staticmethod
+    def build_index(key_list):
+        """Index the timestamps of a key list by object id.
+
+        Every string value of an object's keys is indexed, if more than one
+        object has the same value the last object is used.
+
+        :param key_list: performance key list response -- dict
+        :returns: first and last available timestamps keyed by id -- dict
+        """
+        index = dict()
+        for key, time_keys in key_list.items():
+            if not KEY_REGEX.search(key) or not time_keys:
+                continue
+            for p_keys in time_keys:
+                timestamps = (p_keys.get(pc.FA_DATE), p_keys.get(pc.LA_DATE))
+                for value in p_keys.values():
+                    if isinstance(value, str):
+                        index.pop(value, None)
+                        index[value] = timestamps
+        return index
+
+    @staticmethod
+    def find(index, tgt_id):
+        """Find the timestamps of an object in an index.
+
+        Ids which do not match exactly are matched as a substring of the
+        indexed ids, as done by get_timestamps_from_key_list.
+
+        :param index: index from build_index -- dict
+        :param tgt_id: object id -- str
+        :returns: first and last available timestamps, None if not
+                  found -- tuple
+        """
+        timestamps = index.get(tgt_id)
+        if timestamps is None:
+            for value, value_timestamps in index.items():
+                if tgt_id in value:
+                    timestamps = value_timestamps
+        return timestamps
+
+    def get_timestamps(self, array_id, category, director_id, tgt_id, load):
+        """Get the timestamps of an object, loading its key list if needed.
+
+        A key list which does not contain the object is loaded again in
+        case the object was created since the key list was cached.
+
+        :param array_id: array id -- str
+        :param category: performance category -- str
+        :param director_id: director id -- str
+        :param tgt_id: object id -- str
+        :param load: function which gets the key list -- callable
+        :returns: first and last available timestamps -- tuple
+        """
+        key = (array_id, category.upper(), director_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.expires <= time.time():
+                entry = None
+        if entry:
+            timestamps = self.find(entry.index, tgt_id)
+            if timestamps is not None:
+                with self._lock:
+                    self.hits += 1
+                return timestamps
+
+        with self._lock:
+            self.misses += 1
+        expires = self.get_expiry()
+        key_list = load()
+        entry = _Entry(key_list, self.build_index(key_list), expires)
+        with self._lock:
+            self._entries[key] = entry
+        timestamps = self.find(entry.index, tgt_id)
+        return timestamps if timestamps is not None else (None, None)
+
+    def invalidate(self, array_id=None):
+        """Remove cached key lists.
+
+        :param array_id: array id, None for all arrays -- str
+        :returns: number of key lists removed -- int
+        """
+        with self._lock:
+            keys = [key for key in self._entries if (
+                array_id is None or key[0] == array_id)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def get_stats(self):
+        """Get cache size, hit and miss counts.
+
+        :returns: statistics -- dict
+        """
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits,
+                    'misses': self.misses}
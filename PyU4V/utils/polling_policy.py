@@ -0,0 +1,90 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""polling_policy.py."""
+
+import logging
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+
+class PollingPolicy(object):
+    """Adaptive polling policy for asynchronous Unisphere jobs.
+
+    The first status check is made after a short initial interval, each
+    further check waits multiplier times longer than the last up to the
+    maximum interval. Job hints map a case insensitive fragment of a job
+    name or description to the initial interval for matching jobs, for
+    example {'rename': 0.25, 'snapshot': 2}.
+    """
+
+    def __init__(self,
+                 initial_interval=constants.DEFAULT_POLL_INITIAL_INTERVAL,
+                 multiplier=constants.DEFAULT_POLL_MULTIPLIER,
+                 max_interval=None, job_hints=None):
+        """__init__.
+
+        :param initial_interval: seconds before the first status check --
+                                 float
+        :param multiplier: growth factor between status checks -- float
+        :param max_interval: maximum seconds between status checks, defaults
+                             to the connection interval -- float
+        :param job_hints: initial intervals keyed by job name or description
+                          fragment -- dict
+        :raises: InvalidInputException
+        """
+        hints = job_hints if job_hints else dict()
+        if initial_interval <= 0 or multiplier < 1 or (
+                max_interval is not None and max_interval <= 0) or any(
+                interval <= 0 for interval in hints.values()):
+            msg = ('Polling policy intervals must be greater than 0 and '
+                   'multiplier must be at least 1.')
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.initial_interval = initial_interval
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self.job_hints = {key.lower(): value for key, value in hints.items()}
+
+    def get_initial_interval(self, job=None):
+        """Get the interval before the first status check of a job.
+
+        :param job: job details -- dict
+        :returns: interval in seconds -- float
+        """
+        if job and self.job_hints:
+            details = ' '.join(
+                str(job.get(key, '')) for key in ('name', 'description'))
+            details = details.lower()
+            for fragment, interval in self.job_hints.items():
+                if fragment in details:
+                    return interval
+        return self.initial_interval
+
+    def get_interval(self, attempt, job=None, max_interval=None):
+        """Get the interval before a status check.
+
+        :param attempt: number of the status check, starting at 1 -- int
+        :param job: job details -- dict
+        :param max_interval: maximum interval used if the policy does not
+                             set one -- float
+        :returns: interval in seconds -- float
+        """
+        # The exponent is bounded so very long waits cannot overflow
+        interval = self.get_initial_interval(job) * (
+            self.multiplier ** min(attempt - 1, 64))
+        cap = self.max_interval if self.max_interval else max_interval
+        return min(interval, cap) if cap else interval
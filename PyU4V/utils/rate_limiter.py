@@ -0,0 +1,175 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""rate_limiter.py."""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+INTERACTIVE = constants.PRIORITY_INTERACTIVE
+NORMAL = constants.PRIORITY_NORMAL
+BACKGROUND = constants.PRIORITY_BACKGROUND
+PRIORITY_CLASSES = constants.PRIORITY_CLASSES
+
+
+class RateLimiter(object):
+    """Token bucket rate limiter with a concurrency limit and priorities.
+
+    Requests wait in a single queue ordered by priority class and then by
+    arrival, so an interactive request waiting behind background requests
+    is always admitted first. A request is admitted once it is at the head
+    of the queue, a token is available and fewer than max_concurrency
+    requests are in progress.
+    """
+
+    def __init__(self, rate=None, burst=None, max_concurrency=None):
+        """__init__.
+
+        :param rate: requests per second, None for no rate limit -- float
+        :param burst: maximum tokens held, defaults to one second of
+                      requests -- int
+        :param max_concurrency: maximum requests in progress, None for no
+                                limit -- int
+        :raises: InvalidInputException
+        """
+        if (rate is not None and rate <= 0) or (
+                max_concurrency is not None and int(max_concurrency) < 1) or (
+                burst is not None and burst < 1):
+            msg = ('Rate limiter rate must be greater than 0 and burst and '
+                   'max_concurrency must be at least 1.')
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.rate = rate
+        self.burst = burst if burst else (max(rate, 1) if rate else None)
+        self.max_concurrency = (
+            int(max_concurrency) if max_concurrency else None)
+        self.tokens = self.burst
+        self.active = 0
+        self._last_refill = time.monotonic()
+        self._queue = list()
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stats = {priority: {
+            'queue_depth': 0, 'max_queue_depth': 0, 'admitted': 0,
+            'total_wait': 0.0, 'max_wait': 0.0}
+            for priority in PRIORITY_CLASSES}
+
+    @staticmethod
+    def get_rank(priority):
+        """Get the queue rank of a priority class, lower ranks go first.
+
+        :param priority: priority class -- str
+        :returns: rank -- int
+        :raises: InvalidInputException
+        """
+        priority = priority if priority else NORMAL
+        if priority not in PRIORITY_CLASSES:
+            msg = ('Invalid request priority "{p}" supplied, valid options '
+                   'are {opts}.'.format(p=priority, opts=PRIORITY_CLASSES))
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        return PRIORITY_CLASSES.index(priority)
+
+    def _get_token_delay(self):
+        """Take a token if one is available, lock must be held.
+
+        :returns: seconds until a token is available, 0 if taken -- float
+        """
+        if not self.rate:
+            return 0
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def acquire(self, priority=None, timeout=None):
+        """Wait until a request may be sent.
+
+        :param priority: priority class, one of interactive, normal or
+                         background -- str
+        :param timeout: maximum seconds to wait, None to wait until
+                        admitted -- float
+        :returns: seconds spent waiting -- float
+        :raises: InvalidInputException, DeadlineExceededException
+        """
+        priority = priority if priority else NORMAL
+        entry = (self.get_rank(priority), next(self._sequence))
+        stats = self._stats[priority]
+        start = time.monotonic()
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+            stats['queue_depth'] += 1
+            stats['max_queue_depth'] = max(
+                stats['max_queue_depth'], stats['queue_depth'])
+            try:
+                while True:
+                    delay = None
+                    if self._queue[0] == entry and (
+                            not self.max_concurrency
+                            or self.active < self.max_concurrency):
+                        delay = self._get_token_delay()
+                        if not delay:
+                            break
+                    if timeout is not None:
+                        remaining = start + timeout - time.monotonic()
+                        if remaining <= 0:
+                            raise exception.DeadlineExceededException(
+                                data='no time remaining to wait for the '
+                                     'rate limiter')
+                        delay = min(delay, remaining) if delay else remaining
+                    self._condition.wait(delay)
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                stats['queue_depth'] -= 1
+                # The next request in the queue may now be admitted
+                self._condition.notify_all()
+            self.active += 1
+            waited = time.monotonic() - start
+            stats['admitted'] += 1
+            stats['total_wait'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+        return waited
+
+    def release(self):
+        """Mark an admitted request as complete."""
+        with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    def get_stats(self):
+        """Get queue depth and wait time statistics per priority class.
+
+        :returns: statistics -- dict
+        """
+        with self._condition:
+            stats = {'active': self.active, 'rate': self.rate,
+                     'max_concurrency': self.max_concurrency}
+            for priority, p_stats in self._stats.items():
+                stats[priority] = dict(p_stats)
+                stats[priority]['average_wait'] = (
+                    p_stats['total_wait'] / p_stats['admitted']
+                    if p_stats['admitted'] else 0.0)
+            return stats
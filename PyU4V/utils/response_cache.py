@@ -0,0 +1,183 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""response_cache.py."""
+
+import collections
+import copy
+import json
+import logging
+import threading
+import time
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+
+class _Entry(object):
+    """A cached response."""
+
+    def __init__(self, path, value, expires):
+        """__init__."""
+        self.path = path
+        self.value = value
+        self.expires = expires
+
+
+class ResponseCache(object):
+    """Bounded LRU cache of GET responses with a TTL per resource type.
+
+    Only resource types with a TTL are cached, by default slow changing
+    objects such as arrays, SRPs, directors, service levels and workload
+    types, so job status and other volatile resources are always fetched.
+    Responses are keyed by uri and query params. Writes invalidate every
+    entry whose uri is the written uri, one of its parents or one of its
+    children, ignoring the Unisphere version in the uri.
+    """
+
+    def __init__(self, max_entries=constants.DEFAULT_RESPONSE_CACHE_SIZE,
+                 ttls=None):
+        """__init__.
+
+        :param max_entries: maximum responses held, the least recently used
+                            response is evicted first -- int
+        :param ttls: seconds responses are cached keyed by resource type,
+                     merged with the default TTLs, a TTL of 0 disables
+                     caching of that type -- dict
+        :raises: InvalidInputException
+        """
+        ttls = ttls if ttls else dict()
+        if max_entries < 1 or any(ttl < 0 for ttl in ttls.values()):
+            msg = ('Response cache max_entries must be at least 1 and TTLs '
+                   'must not be negative.')
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.max_entries = max_entries
+        self.ttls = dict(constants.DEFAULT_RESPONSE_CACHE_TTLS)
+        self.ttls.update(ttls)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(uri, params=None):
+        """Build a cache key from a uri and query params.
+
+        :param uri: target uri -- str
+        :param params: query params -- dict
+        :returns: key -- str
+        """
+        return json.dumps((uri, params), sort_keys=True, default=str)
+
+    @staticmethod
+    def get_path(uri):
+        """Get the segments of a uri without the Unisphere version.
+
+        :param uri: target uri -- str
+        :returns: uri segments -- tuple
+        """
+        segments = uri.strip('/').split('/')
+        if segments and segments[0].isdigit():
+            segments = segments[1:]
+        return tuple(segments)
+
+    def get_ttl(self, resource_type):
+        """Get the seconds responses of a resource type are cached.
+
+        :param resource_type: resource type e.g. srp -- str
+        :returns: TTL, 0 if not cached -- float
+        """
+        return self.ttls.get(resource_type, 0)
+
+    def get_or_load(self, uri, params, resource_type, load, *args, **kwargs):
+        """Get a cached response, or load and cache it.
+
+        :param uri: target uri -- str
+        :param params: query params -- dict
+        :param resource_type: resource type e.g. srp -- str
+        :param load: function which gets the response -- callable
+        :param args: load arguments -- tuple
+        :param kwargs: load keyword arguments -- dict
+        :returns: response -- dict
+        """
+        ttl = self.get_ttl(resource_type)
+        if not ttl:
+            return load(*args, **kwargs)
+        key = self.make_key(uri, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # Callers get their own copy so the cached response can
+                # not be modified
+                return copy.deepcopy(entry.value)
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = load(*args, **kwargs)
+        with self._lock:
+            # A write during the load may have changed the response
+            if generation == self._generation:
+                self._entries[key] = _Entry(
+                    self.get_path(uri), copy.deepcopy(value),
+                    time.monotonic() + ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self, uri=None):
+        """Remove responses affected by a write to a uri.
+
+        :param uri: written uri, None to remove every response -- str
+        :returns: number of responses removed -- int
+        """
+        with self._lock:
+            self._generation += 1
+            if uri is None:
+                keys = list(self._entries)
+            else:
+                path = self.get_path(uri)
+                keys = [key for key, entry in self._entries.items() if (
+                    entry.path[:len(path)] == path
+                    or path[:len(entry.path)] == entry.path)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+        if keys:
+            LOG.debug('Removed {cnt} cached responses.'.format(cnt=len(keys)))
+        return len(keys)
+
+    def get_stats(self):
+        """Get cache hit, miss, eviction and invalidation counts.
+
+        :returns: statistics -- dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'size': len(self._entries),
+                    'max_entries': self.max_entries,
+                    'hits': self.hits, 'misses': self.misses,
+                    'hit_ratio': self.hits / lookups if lookups else 0.0,
+                    'evictions': self.evictions,
+                    'invalidations': self.invalidations}
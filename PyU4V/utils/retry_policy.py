@@ -0,0 +1,123 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""retry_policy.py."""
+
+import logging
+import random
+
+import requests.exceptions as r_exc
+
+from PyU4V.utils import constants
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+
+class RetryPolicy(object):
+    """Transport level retry policy for REST requests.
+
+    Requests which fail with a timeout, a connection error or a retryable
+    status code are sent again after an exponentially growing delay with
+    full jitter applied. Only idempotent methods are retried automatically,
+    any other request is only retried when the caller marks it safe.
+    """
+
+    def __init__(self, total_attempts=constants.DEFAULT_RETRY_ATTEMPTS,
+                 backoff_factor=constants.DEFAULT_RETRY_BACKOFF,
+                 max_backoff=constants.DEFAULT_RETRY_MAX_BACKOFF,
+                 jitter=True,
+                 status_codes=constants.DEFAULT_RETRY_STATUS_CODES,
+                 idempotent_methods=constants.IDEMPOTENT_METHODS,
+                 retry_on_timeout=True, retry_on_connection_error=True):
+        """__init__.
+
+        :param total_attempts: attempts including the first request -- int
+        :param backoff_factor: delay before the first retry in seconds,
+                               doubled for each further retry -- float
+        :param max_backoff: maximum delay between attempts in seconds --
+                            float
+        :param jitter: randomise delays between zero and the backoff -- bool
+        :param status_codes: response status codes to retry -- list
+        :param idempotent_methods: methods retried automatically -- list
+        :param retry_on_timeout: retry requests which time out -- bool
+        :param retry_on_connection_error: retry connection errors -- bool
+        :raises: InvalidInputException
+        """
+        if int(total_attempts) < 1 or backoff_factor < 0 or max_backoff < 0:
+            msg = ('Retry policy total_attempts must be at least 1 and '
+                   'backoff_factor and max_backoff cannot be negative.')
+            LOG.error(msg)
+            raise exception.InvalidInputException(msg)
+        self.total_attempts = int(total_attempts)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = list(status_codes)
+        self.idempotent_methods = [m.upper() for m in idempotent_methods]
+        self.retry_on_timeout = retry_on_timeout
+        self.retry_on_connection_error = retry_on_connection_error
+
+    def is_retryable_method(self, method, retry_safe=False):
+        """Check if requests with this method may be retried.
+
+        :param method: request method -- str
+        :param retry_safe: request explicitly marked safe to retry -- bool
+        :returns: retryable -- bool
+        """
+        return bool(retry_safe) or (
+            str(method).upper() in self.idempotent_methods)
+
+    def is_retryable_status(self, status_code):
+        """Check if a response status code should be retried.
+
+        :param status_code: status code -- int
+        :returns: retryable -- bool
+        """
+        return status_code in self.status_codes
+
+    def is_retryable_exception(self, error):
+        """Check if a transport exception should be retried.
+
+        SSL errors are never retried as they will not resolve themselves.
+
+        :param error: exception raised by the request -- Exception
+        :returns: retryable -- bool
+        """
+        if isinstance(error, r_exc.SSLError):
+            return False
+        if isinstance(error, r_exc.Timeout):
+            return self.retry_on_timeout
+        if isinstance(error, r_exc.ConnectionError):
+            return self.retry_on_connection_error
+        return False
+
+    def get_backoff(self, attempt, retry_after=None):
+        """Get the delay before the next attempt.
+
+        A valid Retry-After value sent by the server is honoured up to the
+        maximum backoff.
+
+        :param attempt: number of attempts made so far -- int
+        :param retry_after: Retry-After response header -- str
+        :returns: delay in seconds -- float
+        """
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0), self.max_backoff)
+            except (TypeError, ValueError):
+                LOG.debug('Ignoring Retry-After value {ra}.'.format(
+                    ra=retry_after))
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)),
+                      self.max_backoff)
+        return random.uniform(0, backoff) if self.jitter else backoff
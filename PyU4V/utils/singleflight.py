@@ -0,0 +1,147 @@
+# Copyright (c) 2020 Dell Inc. or its subsidiaries.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""singleflight.py."""
+
+import copy
+import json
+import logging
+import threading
+
+from PyU4V.utils import deadline as dl
+from PyU4V.utils import exception
+
+LOG = logging.getLogger(__name__)
+
+
+class _Call(object):
+    """An in-flight call shared by concurrent callers."""
+
+    def __init__(self):
+        """__init__."""
+        self.event = threading.Event()
+        self.results = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """Coalesce concurrent identical calls into a single call.
+
+    While a call for a key is in flight any other caller asking for the same
+    key waits for it and receives a copy of its result, or its exception.
+    Every caller gets its own copy of the result so callers can not modify
+    each other's results. Waiters give up when the deadline of their thread
+    expires. Nothing is kept once the call completes so results are never
+    stale.
+    """
+
+    def __init__(self):
+        """__init__."""
+        self._calls = dict()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(*args):
+        """Build a call key from hashable or JSON serializable arguments.
+
+        :param args: call arguments e.g. uri and params -- tuple
+        :returns: key -- str
+        """
+        return json.dumps(args, sort_keys=True, default=str)
+
+    def do(self, key, func, *args, **kwargs):
+        """Run func, or wait for the in-flight call with the same key.
+
+        If the in-flight call fails because its caller's deadline expired,
+        or does not complete, the waiters make the call again themselves
+        rather than failing with the budget of another caller.
+
+        :param key: call key -- str
+        :param func: function to call -- callable
+        :param args: function arguments -- tuple
+        :param kwargs: function keyword arguments -- dict
+        :returns: function result
+        :raises: DeadlineExceededException
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.calls += 1
+                else:
+                    call.waiters += 1
+                    self.coalesced += 1
+            if not leader:
+                done, result = self._wait(key, call)
+                if done:
+                    return result
+                continue
+
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as error:
+                call.error = error
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                    waiters = call.waiters
+                # Each waiter gets its own copy so callers can not modify
+                # each other's results, nothing is copied if none waited
+                if waiters and call.error is None:
+                    call.results = [copy.deepcopy(result) for __ in range(
+                        waiters)]
+                call.event.set()
+
+    def _wait(self, key, call):
+        """Wait for an in-flight call.
+
+        :param key: call key -- str
+        :param call: in-flight call -- _Call
+        :returns: if the call completed for the waiter, result -- bool, any
+        :raises: DeadlineExceededException
+        """
+        LOG.debug('Waiting for in-flight call {k}.'.format(k=key))
+        if not call.event.wait(dl.get_remaining()):
+            with self._lock:
+                call.waiters -= 1
+            msg = 'the in-flight call {k} did not complete in time'.format(
+                k=key)
+            LOG.error('Operation deadline exceeded, {m}.'.format(m=msg))
+            raise exception.DeadlineExceededException(data=msg)
+        if isinstance(call.error, exception.DeadlineExceededException) or (
+                call.error is None and call.results is None):
+            LOG.debug('In-flight call {k} did not complete for its caller, '
+                      'calling again.'.format(k=key))
+            return False, None
+        if call.error:
+            raise call.error
+        with self._lock:
+            return True, call.results.pop()
+
+    def get_stats(self):
+        """Get the number of calls made and calls coalesced.
+
+        :returns: statistics -- dict
+        """
+        with self._lock:
+            return {'calls': self.calls, 'coalesced': self.coalesced,
+                    'in_flight': len(self._calls)}
@@ -30,6 +30,7 @@ setuptools.setup(
     license='Apache 2.0',
     packages=setuptools.find_packages(),
     install_requires=['requests', 'six', 'urllib3', 'prettytable'],
+    extras_require={'async': ['aiohttp'], 'numpy': ['numpy']},
     include_package_data=True,
     classifiers=[
         'Development Status :: 5 - Production/Stable',